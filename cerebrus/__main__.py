@@ -1,5 +1,7 @@
 """Module entry point for launching the Cerebrus UI."""
 
+import multiprocessing
+
 from cerebrus.ui import CerebrusApp
 
 
@@ -9,4 +11,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Log conversion runs in worker processes; frozen builds must let those
+    # workers start without launching another UI.
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,153 @@
+"""Ordered, rate-limited delivery of UE console commands to devices."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Sequence, Tuple
+
+from cerebrus.tools.adb import CONSOLE_BATCH_COMMANDS, AdbClient
+
+# One batch is one adb shell call, so it must fit that call's time limit.
+DEFAULT_MAX_BATCH = CONSOLE_BATCH_COMMANDS
+# Gap between round trips, so a script flooding the queue cannot keep the
+# device's activity manager busy with back-to-back broadcasts.
+DEFAULT_MIN_INTERVAL = 0.1
+# How long the worker waits for more commands before sending a batch, so a
+# script submitting commands one by one still shares a round trip.
+DEFAULT_LINGER = 0.05
+
+_Item = Tuple[str, "Future[None]"]
+
+
+class ConsoleCommandQueue:
+    """Send UE console commands to one device from a background thread.
+
+    Commands go out in submission order. Whatever is queued when the worker
+    wakes (up to ``max_batch`` commands) is sent in one adb shell call with
+    :meth:`AdbClient.send_console_commands`. Round trips start at least
+    ``min_interval`` seconds apart. Each :meth:`submit` returns a future
+    that completes when its command was delivered, or holds the error
+    (usually an :class:`AdbError`) of the failed batch.
+    """
+
+    def __init__(
+        self,
+        adb_client: AdbClient,
+        serial: str,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        linger: float = DEFAULT_LINGER,
+    ) -> None:
+        self.serial = serial
+        self._client = adb_client
+        self._min_interval = min_interval
+        self._max_batch = max_batch
+        self._linger = linger
+        self._queue: queue.Queue[_Item | None] = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._last_sent = float("-inf")
+        self._thread = threading.Thread(
+            target=self._run, name=f"console-{serial}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, command: str) -> Future[None]:
+        """Queue ``command`` behind everything submitted before it."""
+
+        return self.submit_many([command])[0]
+
+    def submit_many(self, commands: Sequence[str]) -> List[Future[None]]:
+        """Queue ``commands`` back to back, in order."""
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"console queue for {self.serial} is closed")
+            futures: list[Future[None]] = []
+            for command in commands:
+                future: Future[None] = Future()
+                self._queue.put((command, future))
+                futures.append(future)
+        return futures
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Deliver what is already queued, then stop the worker."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch, closing = self._collect(item)
+            self._send(batch)
+            if closing:
+                return
+
+    def _collect(self, first: _Item) -> Tuple[List[_Item], bool]:
+        batch = [first]
+        expires = time.monotonic() + self._linger
+        while len(batch) < self._max_batch:
+            try:
+                item = self._queue.get(timeout=max(expires - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _send(self, batch: List[_Item]) -> None:
+        wait = self._last_sent + self._min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            self._client.send_console_commands(
+                self.serial, [command for command, _ in batch]
+            )
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+        else:
+            for _, future in batch:
+                future.set_result(None)
+        finally:
+            self._last_sent = time.monotonic()
+
+
+class ConsoleCommandQueues:
+    """One :class:`ConsoleCommandQueue` per device, created on first use."""
+
+    def __init__(
+        self, adb_client: AdbClient, min_interval: float = DEFAULT_MIN_INTERVAL
+    ) -> None:
+        self._client = adb_client
+        self._min_interval = min_interval
+        self._queues: Dict[str, ConsoleCommandQueue] = {}
+        self._lock = threading.Lock()
+
+    def for_device(self, serial: str) -> ConsoleCommandQueue:
+        with self._lock:
+            device_queue = self._queues.get(serial)
+            if device_queue is None:
+                device_queue = ConsoleCommandQueue(
+                    self._client, serial, self._min_interval
+                )
+                self._queues[serial] = device_queue
+            return device_queue
+
+    def close(self) -> None:
+        with self._lock:
+            queues = list(self._queues.values())
+            self._queues.clear()
+        for device_queue in queues:
+            device_queue.close()
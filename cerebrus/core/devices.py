@@ -2,10 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+import asyncio
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
 
-from cerebrus.tools.adb import AdbClient, AdbError
+from cerebrus.tools.adb import (
+    AdbClient,
+    AdbDeviceOfflineError,
+    AdbError,
+    AdbTimeoutError,
+    operation_deadline,
+)
+from cerebrus.tools.adb_async import AsyncAdbClient
+
+DEVICE_STATUS_ONLINE = "online"
+DEVICE_STATUS_UNRESPONSIVE = "unresponsive"
+
+DEFAULT_DISCOVERY_WORKERS = 8
+DEFAULT_DEVICE_TIMEOUT = 10.0
+# How often the collector re-checks probe deadlines while waiting.
+_DEADLINE_POLL_INTERVAL = 0.05
 
 
 @dataclass
@@ -16,13 +35,29 @@ class DeviceInfo:
     android_version: str
     sdk_level: str
     package_found: bool
+    status: str = DEVICE_STATUS_ONLINE
+    # Full getprop snapshot taken during discovery, so later lookups (build
+    # fingerprint, GPU, ABI, ...) need no further adb calls.
+    properties: Dict[str, str] = field(default_factory=dict, compare=False, repr=False)
+
+    def get_property(self, prop: str, default: str = "Unknown") -> str:
+        """Return a property from the discovery snapshot."""
+
+        return self.properties.get(prop) or default
 
 
 def collect_device_info(
-    package_name: str, adb_client: AdbClient | None = None
+    package_name: str,
+    adb_client: AdbClient | None = None,
+    max_workers: int = DEFAULT_DISCOVERY_WORKERS,
+    device_timeout: float = DEFAULT_DEVICE_TIMEOUT,
 ) -> List[DeviceInfo]:
     """Discover connected devices and fetch key properties.
 
+    Devices are probed concurrently on up to ``max_workers`` threads. A device
+    whose probe runs longer than ``device_timeout`` seconds is reported with
+    status ``"unresponsive"`` instead of holding up the others.
+
     Returns an empty list when adb is unavailable or produces errors.
     """
 
@@ -31,36 +66,189 @@ def collect_device_info(
         serials = client.list_devices()
     except AdbError:
         return []
+    if not serials:
+        return []
+
+    started: Dict[str, float] = {}
+    results: Dict[str, DeviceInfo] = {}
+
+    def probe(serial: str) -> DeviceInfo:
+        started[serial] = time.monotonic()
+        # The deadline also kills the adb processes of an abandoned probe.
+        with operation_deadline(device_timeout):
+            return _read_device(serial, package_name, client)
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(serials))),
+        thread_name_prefix="device-probe",
+    )
+    futures: Dict[Future[DeviceInfo], str] = {
+        executor.submit(probe, serial): serial for serial in serials
+    }
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(
+                pending, timeout=_DEADLINE_POLL_INTERVAL, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                serial = futures[future]
+                try:
+                    results[serial] = future.result()
+                except (AdbTimeoutError, AdbDeviceOfflineError):
+                    # The probe hit its own deadline or lost the device.
+                    results[serial] = placeholder_device(
+                        serial, DEVICE_STATUS_UNRESPONSIVE
+                    )
+                except AdbError:
+                    continue
+
+            now = time.monotonic()
+            for future in list(pending):
+                serial = futures[future]
+                start = started.get(serial)
+                if start is not None and now - start > device_timeout:
+                    pending.discard(future)
+                    results[serial] = placeholder_device(
+                        serial, DEVICE_STATUS_UNRESPONSIVE
+                    )
+    finally:
+        # Probes that blew their deadline are abandoned, not joined.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return [results[serial] for serial in serials if serial in results]
+
+
+def probe_device(
+    serial: str,
+    package_name: str,
+    adb_client: AdbClient | None = None,
+    device_timeout: float = DEFAULT_DEVICE_TIMEOUT,
+) -> DeviceInfo | None:
+    """Probe a single device, e.g. after a hotplug event.
+
+    Like :func:`collect_device_info`, the probe gets ``device_timeout``
+    seconds in total and the device is reported as ``"unresponsive"`` when
+    it runs out of time or drops off. Returns ``None`` when adb fails for
+    this device otherwise.
+    """
+
+    try:
+        with operation_deadline(device_timeout):
+            return _read_device(serial, package_name, adb_client or AdbClient())
+    except (AdbTimeoutError, AdbDeviceOfflineError):
+        return placeholder_device(serial, DEVICE_STATUS_UNRESPONSIVE)
+    except AdbError:
+        return None
+
+
+def placeholder_device(serial: str, status: str) -> DeviceInfo:
+    """Row for a device that cannot be probed (unresponsive, unauthorized, ...)."""
+
+    return DeviceInfo(
+        make="Unknown",
+        model="Unknown",
+        serial=serial,
+        android_version="Unknown",
+        sdk_level="Unknown",
+        package_found=False,
+        status=status,
+    )
 
-    devices: list[DeviceInfo] = []
-    for serial in serials:
-        try:
-            devices.append(_read_device(serial, package_name, client))
-        except AdbError:
-            continue
-    return devices
+
+def device_folder_names(devices: Sequence[DeviceInfo]) -> Dict[str, str]:
+    """Map serials to ``Make_Model`` folder names, unique within ``devices``.
+
+    Identical models get their serial appended so their files never mix.
+    """
+
+    counts = Counter(f"{device.make}_{device.model}" for device in devices)
+    names: dict[str, str] = {}
+    for device in devices:
+        name = f"{device.make}_{device.model}"
+        names[device.serial] = name if counts[name] == 1 else f"{name}_{device.serial}"
+    return names
+
+
+async def collect_device_info_async(
+    package_name: str,
+    adb_client: AsyncAdbClient | None = None,
+    device_timeout: float = DEFAULT_DEVICE_TIMEOUT,
+) -> List[DeviceInfo]:
+    """Event-loop variant of :func:`collect_device_info`.
+
+    Every device is probed at once on the running loop, with no thread per
+    device. A probe that exceeds ``device_timeout`` is cancelled, which
+    kills its adb process, and the device is reported as ``"unresponsive"``.
+    """
+
+    client = adb_client or AsyncAdbClient()
+    try:
+        serials = await client.list_devices()
+    except AdbError:
+        return []
+
+    probes = [
+        _probe_device_async(serial, package_name, client, device_timeout)
+        for serial in serials
+    ]
+    return [device for device in await asyncio.gather(*probes) if device]
+
+
+async def _probe_device_async(
+    serial: str, package_name: str, client: AsyncAdbClient, device_timeout: float
+) -> DeviceInfo | None:
+    try:
+        return await asyncio.wait_for(
+            _read_device_async(serial, package_name, client), device_timeout
+        )
+    except (asyncio.TimeoutError, AdbTimeoutError, AdbDeviceOfflineError):
+        return placeholder_device(serial, DEVICE_STATUS_UNRESPONSIVE)
+    except AdbError:
+        return None
+
+
+async def _read_device_async(
+    serial: str, package_name: str, client: AsyncAdbClient
+) -> DeviceInfo:
+    try:
+        properties = await client.get_properties(serial)
+    except (AdbTimeoutError, AdbDeviceOfflineError):
+        raise
+    except AdbError:
+        properties = {}
+    package_found = await client.is_package_installed(serial, package_name)
+    return _device_from_properties(serial, properties, package_found)
 
 
 def _read_device(serial: str, package_name: str, client: AdbClient) -> DeviceInfo:
-    make = _safe_property(client, serial, "ro.product.manufacturer")
-    model = _safe_property(client, serial, "ro.product.model")
-    android_version = _safe_property(client, serial, "ro.build.version.release")
-    sdk_level = _safe_property(client, serial, "ro.build.version.sdk")
+    properties = _safe_properties(client, serial)
     package_found = client.is_package_installed(serial, package_name)
+    return _device_from_properties(serial, properties, package_found)
 
+
+def _device_from_properties(
+    serial: str, properties: Dict[str, str], package_found: bool
+) -> DeviceInfo:
     return DeviceInfo(
-        make=make,
-        model=model,
+        make=_property(properties, "ro.product.manufacturer"),
+        model=_property(properties, "ro.product.model"),
         serial=serial,
-        android_version=android_version,
-        sdk_level=sdk_level,
+        android_version=_property(properties, "ro.build.version.release"),
+        sdk_level=_property(properties, "ro.build.version.sdk"),
         package_found=package_found,
+        properties=properties,
     )
 
 
-def _safe_property(client: AdbClient, serial: str, prop: str) -> str:
+def _safe_properties(client: AdbClient, serial: str) -> Dict[str, str]:
     try:
-        value = client.get_property(serial, prop)
+        return client.get_properties(serial)
+    except (AdbTimeoutError, AdbDeviceOfflineError):
+        raise
     except AdbError:
-        value = ""
-    return value or "Unknown"
+        return {}
+
+
+def _property(properties: Dict[str, str], prop: str) -> str:
+    return properties.get(prop) or "Unknown"
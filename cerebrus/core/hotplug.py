@@ -0,0 +1,147 @@
+"""Event-driven device tracking on top of ``adb track-devices``."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping
+
+from cerebrus.core.devices import (
+    DEFAULT_DEVICE_TIMEOUT,
+    DEVICE_STATUS_UNRESPONSIVE,
+    DeviceInfo,
+    placeholder_device,
+    probe_device,
+)
+from cerebrus.tools.adb import AdbClient, AdbError
+from cerebrus.tools.adb_server import AdbServerClient, DeviceTracker
+
+EVENT_ADDED = "added"
+EVENT_REMOVED = "removed"
+EVENT_CHANGED = "changed"
+
+# adb reports fully usable devices with this state.
+_READY_STATE = "device"
+
+
+@dataclass
+class DeviceEvent:
+    kind: str
+    serial: str
+    state: str
+
+
+def diff_device_states(
+    previous: Mapping[str, str], current: Mapping[str, str]
+) -> List[DeviceEvent]:
+    """Return the add/remove/state-change events between two snapshots."""
+
+    events: list[DeviceEvent] = []
+    for serial, state in current.items():
+        if serial not in previous:
+            events.append(DeviceEvent(EVENT_ADDED, serial, state))
+        elif previous[serial] != state:
+            events.append(DeviceEvent(EVENT_CHANGED, serial, state))
+    for serial, state in previous.items():
+        if serial not in current:
+            events.append(DeviceEvent(EVENT_REMOVED, serial, state))
+    return events
+
+
+class DeviceWatcher:
+    """Follow hotplug events and re-probe only the device that changed.
+
+    ``on_change(serial, device)`` is called from the watcher thread with the
+    freshly probed :class:`DeviceInfo`, or ``None`` when the device went
+    away. Each probe gets ``device_timeout`` seconds, so a hung device
+    delays the events behind it by at most that long. The stream is reopened with exponential backoff when the adb
+    server is not reachable.
+    """
+
+    def __init__(
+        self,
+        adb_client: AdbClient,
+        package_name: Callable[[], str],
+        on_change: Callable[[str, DeviceInfo | None], None],
+        server: AdbServerClient | None = None,
+        device_timeout: float = DEFAULT_DEVICE_TIMEOUT,
+        min_backoff: float = 1.0,
+        max_backoff: float = 10.0,
+    ) -> None:
+        self._client = adb_client
+        self._package_name = package_name
+        self._on_change = on_change
+        self._server = server or AdbServerClient()
+        self._device_timeout = device_timeout
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+        self._states: Dict[str, str] = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._tracker: DeviceTracker | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="device-watcher", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 2.0) -> None:
+        self._stop.set()
+        with self._lock:
+            tracker = self._tracker
+        if tracker is not None:
+            tracker.close()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        backoff = self._min_backoff
+        while not self._stop.is_set():
+            try:
+                tracker = self._server.track_devices()
+            except AdbError:
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+                continue
+
+            with self._lock:
+                self._tracker = tracker
+            if self._stop.is_set():
+                tracker.close()
+                return
+
+            try:
+                while not self._stop.is_set():
+                    snapshot = tracker.next_snapshot()
+                    backoff = self._min_backoff
+                    self._apply(snapshot)
+            except AdbError:
+                pass
+            finally:
+                with self._lock:
+                    self._tracker = None
+                tracker.close()
+            self._stop.wait(backoff)
+
+    def _apply(self, snapshot: Dict[str, str]) -> None:
+        for event in diff_device_states(self._states, snapshot):
+            if event.kind == EVENT_REMOVED:
+                self._client.forget_device(event.serial)
+                self._on_change(event.serial, None)
+            elif event.state == _READY_STATE:
+                # A device that just came (back) up may have had apps
+                # installed meanwhile, e.g. by a build pipeline.
+                self._client.invalidate_packages(event.serial)
+                device = probe_device(
+                    event.serial,
+                    self._package_name(),
+                    self._client,
+                    self._device_timeout,
+                ) or placeholder_device(event.serial, DEVICE_STATUS_UNRESPONSIVE)
+                self._on_change(event.serial, device)
+            else:
+                self._on_change(
+                    event.serial, placeholder_device(event.serial, event.state)
+                )
+        self._states = dict(snapshot)
@@ -0,0 +1,172 @@
+"""Background tracking of whether the profiled package runs on each device."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Tuple
+
+from cerebrus.tools.adb import AdbClient, AdbError
+
+
+@dataclass(frozen=True)
+class PackageLiveness:
+    """The package's processes on one device as of the last poll."""
+
+    serial: str
+    package_name: str
+    pids: Tuple[int, ...] = ()
+    error: str | None = None  # set when the last poll failed
+
+    @property
+    def running(self) -> bool:
+        return bool(self.pids)
+
+
+@dataclass
+class _Schedule:
+    due: float
+    interval: float
+
+
+class PackageLivenessPoller:
+    """Poll the configured package's PIDs on every connected device.
+
+    One background thread checks each device with ``pidof``. A device is
+    polled every ``min_interval`` seconds after a change, and the interval
+    doubles up to ``max_interval`` while nothing changes. Failed polls back
+    off up to ``max_error_backoff``. ``on_change(current, previous)`` is called
+    from the poller thread whenever a device's PIDs or error change, and
+    when a device goes away (``current`` is then ``None``).
+    """
+
+    def __init__(
+        self,
+        adb_client: AdbClient,
+        package_name: Callable[[], str],
+        serials: Callable[[], Iterable[str]],
+        on_change: Callable[[PackageLiveness | None, PackageLiveness | None], None],
+        min_interval: float = 1.0,
+        max_interval: float = 10.0,
+        max_error_backoff: float = 30.0,
+    ) -> None:
+        self._client = adb_client
+        self._package_name = package_name
+        self._serials = serials
+        self._on_change = on_change
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._max_error_backoff = max_error_backoff
+        self._states: Dict[str, PackageLiveness] = {}
+        self._schedule: Dict[str, _Schedule] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="package-liveness", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 2.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def poke(self) -> None:
+        """Poll every device now, e.g. after the device list changed."""
+
+        with self._lock:
+            for schedule in self._schedule.values():
+                schedule.due = 0.0
+                schedule.interval = self._min_interval
+        self._wake.set()
+
+    def get(self, serial: str) -> PackageLiveness | None:
+        with self._lock:
+            return self._states.get(serial)
+
+    def snapshot(self) -> Dict[str, PackageLiveness]:
+        with self._lock:
+            return dict(self._states)
+
+    def poll_once(self) -> float:
+        """Poll the devices that are due; return seconds until the next is due."""
+
+        package_name = self._package_name()
+        serials = set(self._serials())
+        self._forget(serials, package_name)
+
+        now = time.monotonic()
+        with self._lock:
+            for serial in serials:
+                self._schedule.setdefault(serial, _Schedule(0.0, self._min_interval))
+            due = [s for s, item in self._schedule.items() if item.due <= now]
+        for serial in due:
+            if self._stop.is_set():
+                break
+            self._poll(serial, package_name)
+
+        with self._lock:
+            if not self._schedule:
+                return self._max_interval
+            next_due = min(item.due for item in self._schedule.values())
+        return max(next_due - time.monotonic(), 0.0)
+
+    def _poll(self, serial: str, package_name: str) -> None:
+        if not package_name:
+            current = PackageLiveness(serial, package_name)
+            failed = False
+        else:
+            try:
+                pids = self._client.package_pids(serial, package_name)
+                current = PackageLiveness(serial, package_name, tuple(sorted(pids)))
+                failed = False
+            except AdbError as exc:
+                with self._lock:
+                    known = self._states.get(serial)
+                pids_known = known.pids if known is not None else ()
+                current = PackageLiveness(serial, package_name, pids_known, str(exc))
+                failed = True
+
+        with self._lock:
+            previous = self._states.get(serial)
+            self._states[serial] = current
+            schedule = self._schedule.get(serial)
+            if schedule is None:
+                return  # forgotten while polling
+            if failed:
+                schedule.interval = min(schedule.interval * 2, self._max_error_backoff)
+            elif previous is not None and previous.pids != current.pids:
+                schedule.interval = self._min_interval
+            else:
+                schedule.interval = min(schedule.interval * 2, self._max_interval)
+            schedule.due = time.monotonic() + schedule.interval
+        if current != previous:
+            self._on_change(current, previous)
+
+    def _forget(self, serials: set[str], package_name: str) -> None:
+        with self._lock:
+            gone = [
+                state
+                for serial, state in self._states.items()
+                if serial not in serials or state.package_name != package_name
+            ]
+            for state in gone:
+                del self._states[state.serial]
+                if state.serial not in serials:
+                    self._schedule.pop(state.serial, None)
+                else:
+                    self._schedule[state.serial] = _Schedule(0.0, self._min_interval)
+            for serial in [s for s in self._schedule if s not in serials]:
+                del self._schedule[serial]
+        for state in gone:
+            self._on_change(None, state)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            self._wake.wait(self.poll_once())
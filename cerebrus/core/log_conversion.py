@@ -0,0 +1,126 @@
+"""Convert batches of text logs to colored HTML across worker processes."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from cerebrus.tools.log_to_html import (
+    PARALLEL_MIN_BYTES,
+    convert_log_to_html,
+    convert_log_to_pages,
+)
+
+
+@dataclass(frozen=True)
+class LogConversion:
+    """The outcome of converting one log."""
+
+    source: Path
+    output: Path
+    error: str | None = None  # why the conversion failed
+    remove_error: str | None = None  # why the source could not be removed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def default_workers(jobs: int) -> int:
+    """One worker process per core, but no more than there are logs."""
+
+    return max(1, min(jobs, os.cpu_count() or 1))
+
+
+def convert_logs(
+    jobs: Sequence[Tuple[Path, Path]],
+    search_index: bool = False,
+    remove_sources: bool = False,
+    on_done: Callable[[LogConversion], None] | None = None,
+    max_workers: int | None = None,
+    page_lines: int | None = None,
+) -> List[LogConversion]:
+    """Convert each ``(source, output)`` log in a pool of worker processes.
+
+    Logs below ``PARALLEL_MIN_BYTES`` are converted first, one per worker,
+    largest first. Larger logs follow one at a time, each split across
+    every core, so a huge log neither waits on one core nor leaves cores
+    idle once the small logs are done. ``on_done`` is called from the
+    calling thread as each log finishes. With ``remove_sources``, a source
+    is deleted right after its own conversion succeeded, never otherwise.
+    With ``page_lines``, each log is written as pages of that many lines
+    plus an index page at its output path. Results come back in the order
+    of ``jobs``.
+    """
+
+    if not jobs:
+        return []
+    sizes = {job: _size(job) for job in jobs}
+    by_size = sorted(sizes, key=sizes.__getitem__, reverse=True)
+    small = [job for job in by_size if sizes[job] < PARALLEL_MIN_BYTES]
+    huge = [job for job in by_size if sizes[job] >= PARALLEL_MIN_BYTES]
+    cores = os.cpu_count() or 1
+    results: Dict[Tuple[Path, Path], LogConversion] = {}
+
+    def finish(job: Tuple[Path, Path], future: Future[None]) -> None:
+        result = _outcome(job[0], job[1], future, remove_sources)
+        results[job] = result
+        if on_done is not None:
+            on_done(result)
+
+    workers = max_workers or default_workers(len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: Dict[Future[None], Tuple[Path, Path]] = {}
+        for source, output in small:
+            future = executor.submit(
+                _convert, source, output, search_index, 1, page_lines
+            )
+            futures[future] = (source, output)
+        for future in as_completed(futures):
+            finish(futures[future], future)
+        # finish() waits for each, so huge logs never share the cores.
+        for source, output in huge:
+            future = executor.submit(
+                _convert, source, output, search_index, cores, page_lines
+            )
+            finish((source, output), future)
+    return [results[job] for job in jobs]
+
+
+def _convert(
+    source: Path,
+    output: Path,
+    search_index: bool,
+    workers: int,
+    page_lines: int | None,
+) -> None:
+    if page_lines is None:
+        convert_log_to_html(source, output, search_index=search_index, workers=workers)
+    else:
+        convert_log_to_pages(
+            source, output, page_lines, search_index=search_index, workers=workers
+        )
+
+
+def _outcome(
+    source: Path, output: Path, future: Future[None], remove_source: bool
+) -> LogConversion:
+    error = future.exception()
+    if error is not None:
+        return LogConversion(source, output, error=str(error) or type(error).__name__)
+    if remove_source:
+        try:
+            source.unlink()
+        except OSError as exc:
+            return LogConversion(source, output, remove_error=str(exc))
+    return LogConversion(source, output)
+
+
+def _size(job: Tuple[Path, Path]) -> int:
+    try:
+        return job[0].stat().st_size
+    except OSError:
+        return 0
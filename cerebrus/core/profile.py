@@ -8,6 +8,12 @@ from typing import Optional
 CONFIG_DIR = Path.home() / ".cerebrus"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
+# How the app talks to adb: one adb process per call (with persistent shell
+# sessions), or the adb server's socket protocol directly.
+ADB_BACKEND_PROCESS = "process"
+ADB_BACKEND_SERVER = "server"
+ADB_BACKENDS = (ADB_BACKEND_PROCESS, ADB_BACKEND_SERVER)
+
 
 @dataclass
 class Profile:
@@ -20,8 +26,13 @@ class Profile:
 
     move_logs_enabled: bool = True
     move_csv_enabled: bool = True
+    incremental_sync_enabled: bool = False
+    compressed_transfer_enabled: bool = False
+    device_log_filter_enabled: bool = False
     generate_perf_report_enabled: bool = True
     generate_colored_logs_enabled: bool = True
+    log_search_index_enabled: bool = False
+    log_paging_enabled: bool = False
 
     def validate(self) -> list[str]:
         errors = []
@@ -51,8 +62,13 @@ class Profile:
             "use_prefix_only",
             "move_logs_enabled",
             "move_csv_enabled",
+            "incremental_sync_enabled",
+            "compressed_transfer_enabled",
+            "device_log_filter_enabled",
             "generate_perf_report_enabled",
             "generate_colored_logs_enabled",
+            "log_search_index_enabled",
+            "log_paging_enabled",
         }
         filtered_data = {k: v for k, v in data.items() if k in valid_fields}
         return cls(**filtered_data)
@@ -100,6 +116,31 @@ class ProfileManager:
         with open(CONFIG_FILE, "w") as f:
             json.dump(data, f, indent=4)
 
+    def get_adb_backend(self) -> str:
+        """The saved adb backend, ``ADB_BACKEND_PROCESS`` unless set."""
+        try:
+            with open(CONFIG_FILE, "r") as f:
+                backend = json.load(f).get("adb_backend")
+        except Exception:
+            return ADB_BACKEND_PROCESS
+        return backend if backend in ADB_BACKENDS else ADB_BACKEND_PROCESS
+
+    def set_adb_backend(self, backend: str) -> None:
+        if backend not in ADB_BACKENDS:
+            raise ValueError(f"Unknown adb backend: {backend}")
+        data = {}
+        if CONFIG_FILE.exists():
+            try:
+                with open(CONFIG_FILE, "r") as f:
+                    data = json.load(f)
+            except Exception:
+                data = {}
+
+        data["adb_backend"] = backend
+
+        with open(CONFIG_FILE, "w") as f:
+            json.dump(data, f, indent=4)
+
     def load_last_profile(self) -> tuple[Profile, Optional[Path]]:
         path = self.get_last_used_profile_path()
         if path:
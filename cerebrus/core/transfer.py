@@ -0,0 +1,575 @@
+"""Incremental, manifest-based sync of device folders to the PC."""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import posixpath
+import shlex
+import shutil
+import tarfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Sequence, Tuple
+
+from cerebrus.tools.adb import AdbClient, AdbCommandError, AdbError
+
+MANIFEST_NAME = ".cerebrus_sync.json"
+# Keep each ``rm`` / ``tar`` well below Android's command line limit.
+_REMOVE_BATCH = 64
+_TAR_BATCH = 64
+# Files at least this large (e.g. Insights traces) are pulled in resumable,
+# checksummed chunks instead of one ``adb pull``.
+RESUMABLE_PULL_THRESHOLD = 64 * 1024 * 1024
+# The manifest is rewritten after this many newly copied files or seconds,
+# and once at the end, rather than after every file.
+_MANIFEST_SAVE_FILES = 100
+_MANIFEST_SAVE_SECONDS = 5.0
+# ``device_grep_command`` ends its output with this marker and grep's exit
+# status, since ``exec-out`` does not report the status itself.
+_GREP_STATUS_MARKER = "__CEREBRUS_GREP_STATUS__"
+_COPY_CHUNK = 64 * 1024
+# Only text logs are run through the on-device filter.
+_FILTERABLE_SUFFIXES = (".log", ".txt")
+
+
+@dataclass(frozen=True)
+class RemoteFile:
+    """A regular file under the synced device folder."""
+
+    path: str  # relative to the synced folder, "/"-separated
+    size: int
+    mtime: int
+
+
+@dataclass
+class SyncResult:
+    """What one :func:`sync_device_folder` call did."""
+
+    pulled: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """Device-side ``grep -E`` that replaces copying whole log files."""
+
+    patterns: Tuple[str, ...]
+    context: int = 3
+
+
+@dataclass
+class DeviceTransfer:
+    """One device folder to sync into one local folder.
+
+    With ``log_filter`` set, the folder's logs are filtered on the device
+    (see :func:`filter_device_logs`) instead of being moved.
+    """
+
+    serial: str
+    remote_dir: str
+    local_dir: Path
+    log_filter: LogFilter | None = None
+
+
+class TransferProgress:
+    """Byte and device counters shared by concurrent device transfers."""
+
+    def __init__(self, devices: int = 0) -> None:
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.devices = devices
+        self.devices_done = 0
+        self.total_bytes = 0
+        self.done_bytes = 0
+
+    def add_total(self, size: int) -> None:
+        with self._lock:
+            self.total_bytes += size
+
+    def add_done(self, size: int) -> None:
+        with self._lock:
+            self.done_bytes += size
+
+    def device_done(self) -> None:
+        with self._lock:
+            self.devices_done += 1
+
+    @property
+    def fraction(self) -> float:
+        with self._lock:
+            if self.devices and self.devices_done >= self.devices:
+                return 1.0
+            if not self.total_bytes:
+                return 0.0
+            return min(self.done_bytes / self.total_bytes, 1.0)
+
+    @property
+    def bytes_per_second(self) -> float:
+        elapsed = time.monotonic() - self._started
+        return self.done_bytes / elapsed if elapsed > 0 else 0.0
+
+
+def list_remote_files(
+    client: AdbClient, serial: str, remote_dir: str
+) -> List[RemoteFile]:
+    """List every file under ``remote_dir`` with size and mtime in one call."""
+
+    remote_dir = remote_dir.rstrip("/")
+    output = client.shell(
+        serial,
+        [
+            "find",
+            shlex.quote(remote_dir),
+            "-type",
+            "f",
+            "-exec",
+            "stat",
+            "-c",
+            shlex.quote("%s %Y %n"),
+            "{}",
+            "+",
+        ],
+    )
+    return parse_stat_listing(output, remote_dir)
+
+
+def parse_stat_listing(output: str, remote_dir: str) -> List[RemoteFile]:
+    """Parse ``stat -c '%s %Y %n'`` lines into files relative to ``remote_dir``."""
+
+    files: list[RemoteFile] = []
+    for line in output.splitlines():
+        parts = line.split(" ", 2)
+        if len(parts) != 3 or not parts[0].isdigit() or not parts[1].isdigit():
+            continue
+        relative = posixpath.relpath(parts[2], remote_dir)
+        if relative.startswith(".."):
+            continue
+        files.append(RemoteFile(relative, int(parts[0]), int(parts[1])))
+    return files
+
+
+def stream_device_files(
+    client: AdbClient,
+    serial: str,
+    remote_dir: str,
+    local_dir: Path,
+    paths: Sequence[str] | None = None,
+) -> List[str] | None:
+    """Copy files as a gzip-compressed ``tar`` stream over ``exec-out``.
+
+    ``paths`` (relative to ``remote_dir``) limits the copy; ``None`` copies
+    the whole folder. Files are extracted while the bytes arrive. Returns
+    the relative paths written, or ``None`` when the device's ``tar`` cannot
+    produce a gzip stream and the caller should fall back to pulling.
+    """
+
+    remote_dir = remote_dir.rstrip("/")
+    members = "." if paths is None else " ".join(shlex.quote(p) for p in paths)
+    command = f"tar -czf - -C {shlex.quote(remote_dir)} {members} 2>/dev/null"
+    written: list[str] = []
+    with client.exec_out(serial, command) as stream:
+        try:
+            archive = tarfile.open(fileobj=stream, mode="r|gz")
+        except (tarfile.ReadError, EOFError):
+            return None
+        try:
+            with archive:
+                for member in archive:
+                    name = posixpath.normpath(member.name)
+                    if (
+                        not member.isfile()
+                        or name == ".."
+                        or name.startswith(("../", "/"))
+                    ):
+                        continue
+                    source = archive.extractfile(member)
+                    if source is None:
+                        continue
+                    target = local_dir.joinpath(*name.split("/"))
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with open(target, "wb") as handle:
+                        shutil.copyfileobj(source, handle)
+                    written.append(name)
+        except (tarfile.TarError, EOFError, zlib.error) as exc:
+            raise AdbError(
+                f"compressed stream from {serial} was cut short after "
+                f"{len(written)} files: {exc}"
+            ) from exc
+    return written
+
+
+def sync_device_folder(
+    client: AdbClient,
+    serial: str,
+    remote_dir: str,
+    local_dir: Path,
+    remove_verified: bool = True,
+    compressed: bool = False,
+    progress: TransferProgress | None = None,
+    incremental: bool = True,
+) -> SyncResult:
+    """Copy new or changed files from ``remote_dir`` into ``local_dir``.
+
+    A manifest in ``local_dir`` remembers the size and mtime of every file
+    already copied from this device folder, so unchanged files are skipped.
+    With ``compressed`` the files travel as gzip'd tar streams (see
+    :func:`stream_device_files`); anything the stream did not deliver is
+    pulled as usual. Files of at least :data:`RESUMABLE_PULL_THRESHOLD` bytes
+    go through :meth:`AdbClient.pull_resumable`, so a dropped cable costs
+    one chunk rather than the whole file. A file is removed from the device
+    only once its local copy has the size the listing reported. Files that
+    fail to copy are reported in :attr:`SyncResult.failed` and left on the
+    device.
+
+    ``progress``, when given, is credited with the bytes of every file copied.
+
+    With ``incremental`` off no manifest is read or written and every file
+    is copied, but removal from the device is still size-checked per file.
+    """
+
+    remote_dir = remote_dir.rstrip("/")
+    local_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = local_dir / MANIFEST_NAME
+    manifest = _load_manifest(manifest_path) if incremental else {}
+    entries = manifest.setdefault(f"{serial}:{remote_dir}", {})
+
+    result = SyncResult()
+    verified: list[str] = []
+    wanted: list[RemoteFile] = []
+    for remote in list_remote_files(client, serial, remote_dir):
+        local_path = local_dir.joinpath(*remote.path.split("/"))
+        if incremental and _is_current(entries.get(remote.path), remote, local_path):
+            result.skipped.append(remote.path)
+            verified.append(remote.path)
+        else:
+            wanted.append(remote)
+
+    if progress is not None:
+        progress.add_total(sum(remote.size for remote in wanted))
+
+    streamed: set[str] = set()
+    small = [r.path for r in wanted if r.size < RESUMABLE_PULL_THRESHOLD]
+    if compressed and small:
+        streamed = _stream_in_batches(client, serial, remote_dir, local_dir, small)
+
+    saver = _ManifestSaver(manifest_path, manifest)
+    try:
+        for remote in wanted:
+            local_path = local_dir.joinpath(*remote.path.split("/"))
+            if remote.path not in streamed:
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                source = f"{remote_dir}/{remote.path}"
+                try:
+                    if remote.size >= RESUMABLE_PULL_THRESHOLD:
+                        client.pull_resumable(serial, source, str(local_path))
+                    else:
+                        client.pull(serial, source, str(local_path))
+                except AdbError as exc:
+                    result.failed[remote.path] = str(exc)
+                    _forget_bytes(progress, remote.size)
+                    continue
+            if not local_path.is_file() or local_path.stat().st_size != remote.size:
+                # Most likely still being written on the device; try next time.
+                result.failed[remote.path] = "size changed during transfer"
+                _forget_bytes(progress, remote.size)
+                continue
+
+            if incremental:
+                entries[remote.path] = {"size": remote.size, "mtime": remote.mtime}
+                saver.changed()
+            result.pulled.append(remote.path)
+            verified.append(remote.path)
+            if progress is not None:
+                progress.add_done(remote.size)
+    finally:
+        # Also on failure, so an interrupted sync keeps what it copied.
+        saver.save()
+
+    if remove_verified and verified:
+        _remove_remote(client, serial, remote_dir, verified)
+        result.removed.extend(verified)
+    return result
+
+
+def device_grep_command(path: str, log_filter: LogFilter) -> str:
+    """Shell command printing the lines of ``path`` that match ``log_filter``.
+
+    The output ends with a trailer line holding grep's exit status, which
+    :func:`_copy_grep_output` strips off.
+    """
+
+    patterns = " ".join(f"-e {shlex.quote(p)}" for p in log_filter.patterns)
+    return (
+        f"grep -E -C {log_filter.context} {patterns} {shlex.quote(path)} "
+        f"2>/dev/null; printf '\\n{_GREP_STATUS_MARKER} %d\\n' $?"
+    )
+
+
+def _copy_grep_output(stream: BinaryIO, handle: BinaryIO) -> None:
+    """Copy ``device_grep_command`` output without its status trailer.
+
+    Raises :class:`AdbCommandError` when grep failed (exit status 2 and up;
+    1 only means nothing matched) or the trailer never arrived.
+    """
+
+    marker = f"\n{_GREP_STATUS_MARKER} ".encode()
+    # Enough to always hold back the whole trailer.
+    keep = len(marker) + 8
+    pending = b""
+    while chunk := stream.read(_COPY_CHUNK):
+        pending += chunk
+        if len(pending) > keep:
+            handle.write(pending[:-keep])
+            pending = pending[-keep:]
+    output, found, status = pending.rpartition(marker)
+    if not found or not status.strip().isdigit():
+        raise AdbCommandError("grep output ended without its exit status", -1)
+    handle.write(output)
+    returncode = int(status)
+    if returncode > 1:
+        raise AdbCommandError(f"grep failed with exit status {returncode}", returncode)
+
+
+def filtered_name(path: str) -> str:
+    """Local name of a filtered copy: ``Game.log`` becomes ``Game.filtered.log``."""
+
+    stem, dot, suffix = path.rpartition(".")
+    return f"{stem}.filtered.{suffix}" if dot else f"{path}.filtered"
+
+
+def filter_device_logs(
+    client: AdbClient,
+    serial: str,
+    remote_dir: str,
+    local_dir: Path,
+    log_filter: LogFilter,
+    progress: TransferProgress | None = None,
+) -> SyncResult:
+    """Copy only the matching lines (plus context) of each log in ``remote_dir``.
+
+    ``grep`` runs on the device and its output streams back over
+    ``exec-out`` into ``<name>.filtered.log``. ``grep -C`` prints ``--``
+    between groups of lines that were not adjacent. The original files stay
+    on the device. The sync manifest remembers what was filtered, so
+    unchanged logs are skipped next time, even once the filtered copy has
+    been converted and deleted. Only ``.log`` and ``.txt`` files are
+    filtered.
+    """
+
+    remote_dir = remote_dir.rstrip("/")
+    local_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = local_dir / MANIFEST_NAME
+    manifest = _load_manifest(manifest_path)
+    entries = manifest.setdefault(f"{serial}:{remote_dir}:filtered", {})
+
+    result = SyncResult()
+    logs = [
+        remote
+        for remote in list_remote_files(client, serial, remote_dir)
+        if remote.path.lower().endswith(_FILTERABLE_SUFFIXES)
+    ]
+    wanted: list[RemoteFile] = []
+    for remote in logs:
+        # The manifest alone decides: colored-log generation converts and
+        # deletes the filtered copy, and that must not trigger a re-filter.
+        entry = entries.get(remote.path)
+        if (
+            entry is not None
+            and entry.get("size") == remote.size
+            and entry.get("mtime") == remote.mtime
+        ):
+            result.skipped.append(remote.path)
+        else:
+            wanted.append(remote)
+
+    if progress is not None:
+        progress.add_total(sum(remote.size for remote in wanted))
+    saver = _ManifestSaver(manifest_path, manifest)
+    try:
+        for remote in wanted:
+            local_path = local_dir.joinpath(*filtered_name(remote.path).split("/"))
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = local_path.with_name(local_path.name + ".tmp")
+            command = device_grep_command(f"{remote_dir}/{remote.path}", log_filter)
+            try:
+                with client.exec_out(serial, command) as stream:
+                    with open(temporary, "wb") as handle:
+                        _copy_grep_output(stream, handle)
+            except AdbError as exc:
+                temporary.unlink(missing_ok=True)
+                result.failed[remote.path] = str(exc)
+                _forget_bytes(progress, remote.size)
+                continue
+            temporary.replace(local_path)
+            entries[remote.path] = {"size": remote.size, "mtime": remote.mtime}
+            saver.changed()
+            result.pulled.append(remote.path)
+            if progress is not None:
+                progress.add_done(remote.size)
+    finally:
+        saver.save()
+    return result
+
+
+def sync_devices(
+    client: AdbClient,
+    transfers: Sequence[DeviceTransfer],
+    compressed: bool = False,
+    progress: TransferProgress | None = None,
+    incremental: bool = True,
+) -> Dict[str, List[Tuple[DeviceTransfer, SyncResult | AdbError]]]:
+    """Run :func:`sync_device_folder` for many devices at once.
+
+    Each device gets its own worker thread, which syncs that device's folders
+    in order, so the total time tracks the slowest device. Transfers with a
+    ``log_filter`` go through :func:`filter_device_logs`; ``compressed`` and
+    ``incremental`` are passed to the others. An adb failure
+    ends only the folder it happened in. Returns each device's outcomes in
+    transfer order, keyed by serial.
+    """
+
+    by_device: Dict[str, List[DeviceTransfer]] = {}
+    for transfer in transfers:
+        by_device.setdefault(transfer.serial, []).append(transfer)
+
+    def run(
+        device_transfers: List[DeviceTransfer],
+    ) -> List[Tuple[DeviceTransfer, SyncResult | AdbError]]:
+        outcomes: list[tuple[DeviceTransfer, SyncResult | AdbError]] = []
+        try:
+            for transfer in device_transfers:
+                try:
+                    outcome: SyncResult | AdbError
+                    if transfer.log_filter is not None:
+                        outcome = filter_device_logs(
+                            client,
+                            transfer.serial,
+                            transfer.remote_dir,
+                            transfer.local_dir,
+                            transfer.log_filter,
+                            progress=progress,
+                        )
+                    else:
+                        outcome = sync_device_folder(
+                            client,
+                            transfer.serial,
+                            transfer.remote_dir,
+                            transfer.local_dir,
+                            compressed=compressed,
+                            progress=progress,
+                            incremental=incremental,
+                        )
+                except AdbError as exc:
+                    outcome = exc
+                outcomes.append((transfer, outcome))
+        finally:
+            if progress is not None:
+                progress.device_done()
+        return outcomes
+
+    if not by_device:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=len(by_device), thread_name_prefix="device-transfer"
+    ) as executor:
+        # Copy the caller's context so an operation_deadline() covers workers.
+        futures = {
+            serial: executor.submit(
+                contextvars.copy_context().run, run, device_transfers
+            )
+            for serial, device_transfers in by_device.items()
+        }
+        return {serial: future.result() for serial, future in futures.items()}
+
+
+def _forget_bytes(progress: TransferProgress | None, size: int) -> None:
+    if progress is not None:
+        progress.add_total(-size)
+
+
+def _stream_in_batches(
+    client: AdbClient,
+    serial: str,
+    remote_dir: str,
+    local_dir: Path,
+    paths: List[str],
+) -> set[str]:
+    streamed: set[str] = set()
+    for start in range(0, len(paths), _TAR_BATCH):
+        try:
+            written = stream_device_files(
+                client, serial, remote_dir, local_dir, paths[start : start + _TAR_BATCH]
+            )
+        except AdbError:
+            # Whatever did not arrive is pulled file by file instead.
+            continue
+        if written is None:
+            break
+        streamed.update(written)
+    return streamed
+
+
+def _is_current(entry: Dict[str, int] | None, remote: RemoteFile, local: Path) -> bool:
+    if entry is None or entry.get("size") != remote.size:
+        return False
+    if entry.get("mtime") != remote.mtime:
+        return False
+    return local.is_file() and local.stat().st_size == remote.size
+
+
+def _remove_remote(
+    client: AdbClient, serial: str, remote_dir: str, paths: List[str]
+) -> None:
+    for start in range(0, len(paths), _REMOVE_BATCH):
+        batch = paths[start : start + _REMOVE_BATCH]
+        quoted = [shlex.quote(f"{remote_dir}/{path}") for path in batch]
+        client.shell(serial, ["rm", "-f", *quoted])
+
+
+def _load_manifest(path: Path) -> Dict[str, Dict[str, Dict[str, int]]]:
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class _ManifestSaver:
+    """Save a manifest every few changes or seconds instead of after each."""
+
+    def __init__(
+        self, path: Path, manifest: Dict[str, Dict[str, Dict[str, int]]]
+    ) -> None:
+        self._path = path
+        self._manifest = manifest
+        self._pending = 0
+        self._saved = time.monotonic()
+
+    def changed(self) -> None:
+        self._pending += 1
+        if (
+            self._pending >= _MANIFEST_SAVE_FILES
+            or time.monotonic() - self._saved >= _MANIFEST_SAVE_SECONDS
+        ):
+            self.save()
+
+    def save(self) -> None:
+        if self._pending:
+            _save_manifest(self._path, self._manifest)
+            self._pending = 0
+        self._saved = time.monotonic()
+
+
+def _save_manifest(path: Path, manifest: Dict[str, Dict[str, Dict[str, int]]]) -> None:
+    temporary = path.with_suffix(".tmp")
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    temporary.replace(path)
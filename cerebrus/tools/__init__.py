@@ -1,5 +1,25 @@
 """External tooling wrappers for Cerebrus."""
 
-from cerebrus.tools.adb import AdbClient, AdbError
+from cerebrus.tools.adb import (
+    AdbChecksumError,
+    AdbClient,
+    AdbCommandError,
+    AdbDeviceOfflineError,
+    AdbError,
+    AdbTimeoutError,
+    RetryPolicy,
+)
+from cerebrus.tools.adb_async import AsyncAdbClient
+from cerebrus.tools.adb_server import AdbServerClient
 
-__all__ = ["AdbClient", "AdbError"]
+__all__ = [
+    "AdbChecksumError",
+    "AdbClient",
+    "AdbCommandError",
+    "AdbDeviceOfflineError",
+    "AdbError",
+    "AdbServerClient",
+    "AdbTimeoutError",
+    "AsyncAdbClient",
+    "RetryPolicy",
+]
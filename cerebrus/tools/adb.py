@@ -2,36 +2,404 @@
 
 from __future__ import annotations
 
+import contextvars
+import hashlib
+import io
+import json
+import posixpath
+import queue
+import re
+import shlex
 import subprocess
-from dataclasses import dataclass
-from typing import List
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+import psutil
+
+from cerebrus.tools.adb_metrics import (
+    ADB_METRICS,
+    AdbCallRecord,
+    AdbMetrics,
+    command_key,
+)
+
+DEFAULT_COMMAND_TIMEOUT = 30.0
+DEFAULT_PACKAGE_CACHE_TTL = 60.0
+DEFAULT_PULL_CHUNK = 8 * 1024 * 1024
+
+_STREAM_CHUNK = 64 * 1024
+# Keep batched console broadcasts under older adb's 4 KiB shell command limit.
+_CONSOLE_BATCH_CHARS = 4000
+# Each ``am broadcast`` can take around a second on a slow device, and a
+# whole chain runs under the single ``send_console_command`` time limit.
+CONSOLE_BATCH_COMMANDS = 8
+# ``dd`` block size used for ranged reads; chunks are whole multiples of it.
+_DD_BLOCK = 1024 * 1024
+_SESSION_MARKER = "__CEREBRUS_DONE_"
+# getprop dump lines look like "[ro.product.model]: [Pixel 8]"; values may
+# span several lines.
+_GETPROP_LINE = re.compile(r"^\[([^\]]+)\]: \[(.*?)\]$", re.MULTILINE | re.DOTALL)
+# Messages adb prints when the transport, rather than the command, failed.
+_OFFLINE_MESSAGE = re.compile(
+    r"device offline|device '[^']*' not found|no devices/emulators found"
+    r"|device unauthorized|device still authorizing|^error: closed$",
+    re.MULTILINE,
+)
+
+_T = TypeVar("_T")
+_operation_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "adb_operation_deadline", default=None
+)
 
 
 class AdbError(RuntimeError):
     """Raised when an adb invocation fails."""
 
 
+class AdbTimeoutError(AdbError):
+    """Raised when an adb command or operation runs past its deadline."""
+
+
+class AdbDeviceOfflineError(AdbError):
+    """Raised when the target device is missing, offline or unauthorized."""
+
+
+class AdbChecksumError(AdbError):
+    """Raised when transferred bytes do not match the device's checksum."""
+
+
+class AdbCommandError(AdbError):
+    """Raised when adb reached the device but the command itself failed."""
+
+    def __init__(self, message: str, returncode: int) -> None:
+        super().__init__(message)
+        self.returncode = returncode
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Time limit and retry behaviour for one kind of adb call.
+
+    ``timeout`` bounds each attempt; ``attempts`` counts the first try. Only
+    errors listed in ``retry_on`` are retried, after ``backoff`` seconds
+    doubled on every further attempt.
+    """
+
+    timeout: float | None = DEFAULT_COMMAND_TIMEOUT
+    attempts: int = 1
+    backoff: float = 0.5
+    retry_on: Tuple[Type[AdbError], ...] = (AdbTimeoutError, AdbDeviceOfflineError)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number ``attempt``."""
+
+        return self.backoff * 2 ** (attempt - 1)
+
+
+# Console commands are not idempotent, so they are never retried.
+DEFAULT_RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "list_devices": RetryPolicy(timeout=10.0, attempts=2),
+    "get_property": RetryPolicy(timeout=10.0, attempts=2),
+    "get_properties": RetryPolicy(timeout=10.0, attempts=2),
+    "is_package_installed": RetryPolicy(timeout=15.0, attempts=2),
+    "is_package_running": RetryPolicy(timeout=5.0, attempts=2),
+    "send_console_command": RetryPolicy(timeout=10.0),
+    "shell": RetryPolicy(),
+    # Bulk transfers take as long as their size needs; a stuck one is
+    # cancelled by the user. Chunked pulls are bounded per chunk instead.
+    "pull": RetryPolicy(timeout=None),
+    "exec_out": RetryPolicy(timeout=None),
+    # Chunk reads are idempotent, so ride out a replugged cable.
+    "pull_chunk": RetryPolicy(
+        timeout=120.0,
+        attempts=6,
+        backoff=1.0,
+        retry_on=(AdbTimeoutError, AdbDeviceOfflineError, AdbChecksumError),
+    ),
+}
+
+
+@contextmanager
+def operation_deadline(seconds: float) -> Iterator[None]:
+    """Bound every adb call made inside the block to ``seconds`` in total.
+
+    The deadline follows the current thread or asyncio task. Nested blocks
+    can only shorten it.
+    """
+
+    expires = time.monotonic() + seconds
+    outer = _operation_deadline.get()
+    if outer is not None:
+        expires = min(expires, outer)
+    token = _operation_deadline.set(expires)
+    try:
+        yield
+    finally:
+        _operation_deadline.reset(token)
+
+
+def remaining_timeout(timeout: float | None) -> float | None:
+    """Clamp ``timeout`` to the active operation deadline.
+
+    Raises :class:`AdbTimeoutError` when that deadline has already passed.
+    """
+
+    expires = _operation_deadline.get()
+    if expires is None:
+        return timeout
+    remaining = expires - time.monotonic()
+    if remaining <= 0:
+        raise AdbTimeoutError("adb operation deadline expired")
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def adb_failure(description: str, message: str, returncode: int = 1) -> AdbError:
+    """Build the typed error for a failed adb call from its error output."""
+
+    message = message.strip() or "adb command failed"
+    text = f"{description}: {message}"
+    if _OFFLINE_MESSAGE.search(message):
+        return AdbDeviceOfflineError(text)
+    return AdbCommandError(text, returncode)
+
+
+def kill_process_tree(pid: int) -> None:
+    """Kill ``pid`` and its descendants.
+
+    An adb server forked by the client is spared so other tools (and later
+    calls) keep their server.
+    """
+
+    try:
+        root = psutil.Process(pid)
+        descendants = root.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return
+    for process in [root, *descendants]:
+        try:
+            if process is not root and "fork-server" in process.cmdline():
+                continue
+            process.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+
+class _CountingReader(io.RawIOBase):
+    """Raw binary stream over ``stream`` that counts the bytes read from it."""
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        # read1() returns what is available instead of waiting for a full buffer.
+        chunk = cast(io.BufferedIOBase, self._stream).read1(len(buffer))
+        buffer[: len(chunk)] = chunk
+        self.bytes_read += len(chunk)
+        return len(chunk)
+
+
+class AdbShellSession:
+    """Keep one ``adb -s <serial> shell`` process open and frame each command.
+
+    Every command is followed by a ``printf`` of a unique marker and the
+    command's exit status, so the output of consecutive commands can be split
+    apart without spawning a new adb process. The device's stderr is
+    interleaved with stdout, as with an interactive shell.
+    """
+
+    def __init__(self, executable: str, serial: str) -> None:
+        self.serial = serial
+        try:
+            self._process = subprocess.Popen(
+                [executable, "-s", serial, "shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        except OSError as exc:
+            raise AdbError(f"{executable} -s {serial} shell: {exc}") from exc
+        self._lines: queue.Queue[Optional[str]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._pump_output, daemon=True)
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def run(self, command: str, timeout: float | None = None) -> Tuple[int, str]:
+        """Run ``command`` in the session and return its exit code and output.
+
+        When ``timeout`` expires the session is killed, since the remote shell
+        is left in an unknown state, and :class:`AdbTimeoutError` is raised.
+        """
+
+        marker = f"{_SESSION_MARKER}{uuid.uuid4().hex}"
+        # stdin is redirected so a command that reads input cannot swallow the
+        # marker line; printf starts on a fresh line so the marker is always
+        # found even when the output has no trailing newline.
+        script = f"{{ {command}; }} </dev/null\nprintf '\\n{marker}:%s\\n' \"$?\"\n"
+
+        expires = None if timeout is None else time.monotonic() + timeout
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise AdbTimeoutError(
+                f"adb shell session for {self.serial} stayed busy for {timeout:g}s"
+            )
+        try:
+            if not self.alive or self._process.stdin is None:
+                raise AdbDeviceOfflineError(
+                    f"adb shell session for {self.serial} is closed"
+                )
+            try:
+                # Bytes, not text: a text pipe on Windows would send "\r\n",
+                # and the device shell would read "/dev/null\r".
+                self._process.stdin.write(script.encode("utf-8"))
+                self._process.stdin.flush()
+            except OSError as exc:
+                self.close()
+                raise AdbDeviceOfflineError(
+                    f"adb shell session for {self.serial} failed: {exc}"
+                ) from exc
+
+            output: list[str] = []
+            while True:
+                line = self._next_line(expires)
+                if line is None:
+                    self.close()
+                    raise AdbDeviceOfflineError(
+                        f"adb shell session for {self.serial} closed"
+                    )
+                if line.startswith(marker):
+                    status = line[len(marker) + 1 :].strip()
+                    exit_code = int(status) if status.isdigit() else 1
+                    break
+                output.append(line)
+        finally:
+            self._lock.release()
+
+        text = "".join(output)
+        # Drop the newline printf emitted ahead of the marker.
+        if text.endswith("\n"):
+            text = text[:-1]
+        return exit_code, text
+
+    def close(self) -> None:
+        """Ask the remote shell to exit and reap the adb process."""
+
+        if self.alive and self._process.stdin is not None:
+            try:
+                self._process.stdin.write(b"exit\n")
+                self._process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            kill_process_tree(self._process.pid)
+            self._process.wait()
+
+    def _next_line(self, expires: float | None) -> Optional[str]:
+        try:
+            if expires is None:
+                return self._lines.get()
+            return self._lines.get(timeout=max(expires - time.monotonic(), 0))
+        except queue.Empty:
+            kill_process_tree(self._process.pid)
+            self._process.wait()
+            raise AdbTimeoutError(
+                f"adb shell session for {self.serial} timed out"
+            ) from None
+
+    def _pump_output(self) -> None:
+        stdout = self._process.stdout
+        if stdout is not None:
+            for raw in stdout:
+                line = raw.decode("utf-8", errors="replace")
+                if line.endswith("\r\n"):
+                    line = line[:-2] + "\n"
+                self._lines.put(line)
+        self._lines.put(None)
+
+
 @dataclass
 class AdbClient:
-    """Execute adb commands and parse their output."""
+    """Execute adb commands and parse their output.
+
+    With ``persistent_sessions`` enabled, shell commands reuse one long-lived
+    ``adb shell`` per device instead of spawning an adb process per call.
+    Call :meth:`close` to shut those sessions down.
+
+    ``retry_policies`` maps public method names to the :class:`RetryPolicy`
+    applied to them; a call that runs out of time kills its adb process tree
+    and raises :class:`AdbTimeoutError`.
+
+    Every adb process and session command is timed into ``metrics``.
+    """
 
     executable: str = "adb"
+    persistent_sessions: bool = False
+    retry_policies: Dict[str, RetryPolicy] = field(
+        default_factory=lambda: dict(DEFAULT_RETRY_POLICIES)
+    )
+    package_cache_ttl: float = DEFAULT_PACKAGE_CACHE_TTL
+    metrics: AdbMetrics = field(
+        default_factory=lambda: ADB_METRICS, repr=False, compare=False
+    )
+    _sessions: Dict[str, AdbShellSession] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _sessions_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    # serial -> (monotonic fetch time, installed package names)
+    _packages: Dict[str, Tuple[float, FrozenSet[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _packages_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def list_devices(self) -> List[str]:
         """Return a list of connected device serial numbers."""
 
-        result = self._run(["devices"])
-        serials: list[str] = []
-        for line in result.stdout.splitlines():
-            if "\tdevice" in line:
-                serials.append(line.split("\t", maxsplit=1)[0])
+        result = self._run(["devices"], "list_devices")
+        serials = parse_device_serials(result.stdout)
+        self._prune_sessions(serials)
         return serials
 
     def get_property(self, serial: str, prop: str) -> str:
         """Fetch a system property from the device."""
 
-        result = self._run(["-s", serial, "shell", "getprop", prop])
-        return result.stdout.strip()
+        return self._shell(serial, ["getprop", prop], "get_property").strip()
+
+    def get_properties(self, serial: str) -> Dict[str, str]:
+        """Fetch every system property from the device in a single call."""
+
+        return parse_getprop(self._shell(serial, ["getprop"], "get_properties"))
 
     def is_package_installed(self, serial: str, package_name: str) -> bool:
         """Check whether the provided package is installed on the device."""
@@ -39,60 +407,512 @@ class AdbClient:
         if not package_name:
             return False
 
-        result = self._run(
-            ["-s", serial, "shell", "pm", "list", "packages", package_name]
+        return package_name in self.installed_packages(serial)
+
+    def installed_packages(self, serial: str) -> FrozenSet[str]:
+        """Return every package installed on the device.
+
+        The list is fetched with one ``pm list packages`` call and reused for
+        ``package_cache_ttl`` seconds, or until :meth:`invalidate_packages`.
+        """
+
+        with self._packages_lock:
+            cached = self._packages.get(serial)
+        if cached is not None and time.monotonic() - cached[0] < self.package_cache_ttl:
+            return cached[1]
+
+        fetched_at = time.monotonic()
+        packages = parse_package_list(
+            self._shell(serial, ["pm", "list", "packages"], "is_package_installed")
         )
-        return package_name in result.stdout
+        with self._packages_lock:
+            self._packages[serial] = (fetched_at, packages)
+        return packages
+
+    def invalidate_packages(self, serial: str | None = None) -> None:
+        """Forget cached package lists, e.g. after an install or uninstall."""
+
+        with self._packages_lock:
+            if serial is None:
+                self._packages.clear()
+            else:
+                self._packages.pop(serial, None)
 
     def pull(self, serial: str, source: str, destination: str) -> None:
         """Pull a file or directory from the device."""
-        self._run(["-s", serial, "pull", source, destination])
+        self._run(["-s", serial, "pull", source, destination], "pull")
+
+    def pull_resumable(
+        self,
+        serial: str,
+        source: str,
+        destination: str,
+        chunk_size: int = DEFAULT_PULL_CHUNK,
+    ) -> None:
+        """Pull one large file in checksummed byte ranges.
+
+        Chunks are read with ``dd`` over ``exec-out`` into ``<destination>.part``
+        and each one is compared with a ``sha256sum`` taken on the device, when
+        the device has one. Verified chunks are recorded in a
+        ``<destination>.part.json`` sidecar, so calling again after a dropped
+        connection resumes from the last good chunk, provided the remote file
+        kept its size and mtime. Each chunk is retried under the
+        ``pull_chunk`` policy.
+        """
+
+        if chunk_size <= 0 or chunk_size % _DD_BLOCK:
+            raise ValueError("chunk_size must be a positive multiple of 1 MiB")
+
+        target = Path(destination)
+        if target.is_dir():
+            target = target / posixpath.basename(source)
+        partial = target.with_name(target.name + ".part")
+        sidecar = target.with_name(target.name + ".part.json")
+
+        size, mtime = self._remote_size_and_mtime(serial, source)
+        identity = {
+            "source": source,
+            "size": size,
+            "mtime": mtime,
+            "chunk_size": chunk_size,
+        }
+        chunks = _load_resume_chunks(sidecar, identity)
+        done = min(len(chunks) * chunk_size, size)
+        if not partial.is_file() or partial.stat().st_size < done:
+            chunks, done = [], 0
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        verify = True
+        with open(partial, "r+b" if done else "wb") as handle:
+            handle.truncate(done)
+            handle.seek(done)
+            for index in range(len(chunks), -(-size // chunk_size)):
+                length = min(chunk_size, size - index * chunk_size)
+
+                def fetch(timeout: float | None, index: int = index) -> bytes:
+                    nonlocal verify
+                    data = self._read_chunk(serial, source, index, chunk_size)
+                    if len(data) != length:
+                        raise AdbDeviceOfflineError(
+                            f"{source}: chunk {index} ended after "
+                            f"{len(data)} of {length} bytes"
+                        )
+                    if verify:
+                        expected = self._remote_chunk_digest(
+                            serial, source, index, chunk_size, timeout
+                        )
+                        if expected is None:
+                            verify = False
+                        elif expected != hashlib.sha256(data).hexdigest():
+                            raise AdbChecksumError(
+                                f"{source}: chunk {index} failed its checksum"
+                            )
+                    return data
+
+                data = self._call("pull_chunk", fetch)
+                handle.write(data)
+                handle.flush()
+                chunks.append(hashlib.sha256(data).hexdigest())
+                _save_resume_chunks(sidecar, identity, chunks)
+
+        partial.replace(target)
+        sidecar.unlink(missing_ok=True)
 
     def shell(self, serial: str, command: List[str]) -> str:
         """Run a shell command on the device."""
-        result = self._run(["-s", serial, "shell", *command])
-        return result.stdout
+        return self._shell(serial, command)
+
+    @contextmanager
+    def exec_out(
+        self, serial: str, command: str, method: str = "exec_out"
+    ) -> Iterator[IO[bytes]]:
+        """Stream the raw stdout of ``command`` via ``adb exec-out``.
+
+        The device's stderr is mixed into the stream, so redirect it in
+        ``command`` when the output is binary. The timeout of the ``method``
+        policy bounds the whole stream; it is not retried.
+        """
+
+        timeout = remaining_timeout(
+            self.retry_policies.get(method, RetryPolicy()).timeout
+        )
+        args = ["-s", serial, "exec-out", command]
+        description = " ".join([self.executable, *args])
+        started = time.monotonic()
+        with subprocess.Popen(
+            [self.executable, *args], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        ) as process:
+            counter = _CountingReader(cast(IO[bytes], process.stdout))
+            stdout = io.BufferedReader(counter)
+            expired = threading.Event()
+
+            def expire() -> None:
+                expired.set()
+                kill_process_tree(process.pid)
+
+            watchdog = threading.Timer(timeout, expire) if timeout else None
+            if watchdog is not None:
+                watchdog.daemon = True
+                watchdog.start()
+            try:
+                yield stdout
+                # Drain trailing bytes (e.g. tar padding) so adb exits cleanly.
+                while stdout.read(_STREAM_CHUNK):
+                    pass
+                process.wait()
+            except Exception as exc:
+                kill_process_tree(process.pid)
+                process.wait()
+                self._record(
+                    args,
+                    started,
+                    None if expired.is_set() else 1,
+                    "",
+                    output_bytes=counter.bytes_read,
+                )
+                if expired.is_set():
+                    raise AdbTimeoutError(
+                        f"{description}: timed out after {timeout:g}s"
+                    ) from exc
+                raise
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+            stderr = process.stderr.read() if process.stderr else b""
+        self._record(
+            args,
+            started,
+            None if expired.is_set() else process.returncode,
+            "",
+            output_bytes=counter.bytes_read,
+        )
+        if expired.is_set():
+            raise AdbTimeoutError(f"{description}: timed out after {timeout:g}s")
+        if process.returncode != 0:
+            raise adb_failure(
+                description,
+                stderr.decode("utf-8", errors="replace"),
+                process.returncode,
+            )
 
     def send_console_command(self, serial: str, command: str) -> None:
         """Send a console command to the running Unreal Engine application."""
-        # Broadcast intent with 'cmd' extra which UE listens for
-        # Command: adb shell am broadcast -a android.intent.action.RUN -e cmd 'command'
-        self._run(
-            [
-                "-s",
-                serial,
-                "shell",
-                "am",
-                "broadcast",
-                "-a",
-                "android.intent.action.RUN",
-                "-e",
-                "cmd",
-                f"'{command}'",
-            ]
-        )
+        self._shell(serial, console_command_args(command), "send_console_command")
+
+    def send_console_commands(self, serial: str, commands: Sequence[str]) -> None:
+        """Send several console commands, in order, in as few shell calls as fit.
+
+        A failed broadcast stops the rest of its batch.
+        """
+        for args in console_batch_args(commands):
+            self._shell(serial, args, "send_console_command")
 
     def is_package_running(self, serial: str, package_name: str) -> bool:
-        """Check if the package is currently running (has a PID)."""
+        """Check if the package is currently running (has a PID).
+
+        Timeouts and offline devices raise rather than report "not running".
+        """
+        return bool(self.package_pids(serial, package_name))
+
+    def package_pids(self, serial: str, package_name: str) -> List[int]:
+        """Return the PIDs of the package's processes; empty when not running."""
+
         if not package_name:
-            return False
+            return []
         try:
             # pidof returns the PID if running, or fails if not
-            result = self._run(["-s", serial, "shell", "pidof", package_name])
-            return bool(result.stdout.strip())
-        except AdbError:
-            return False
+            output = self._shell(serial, ["pidof", package_name], "is_package_running")
+        except AdbCommandError:
+            return []
+        return [int(pid) for pid in output.split() if pid.isdigit()]
+
+    def forget_device(self, serial: str) -> None:
+        """Drop anything cached for ``serial``, e.g. after it was unplugged."""
+
+        self.invalidate_packages(serial)
+        with self._sessions_lock:
+            session = self._sessions.pop(serial, None)
+        if session is not None:
+            session.close()
+
+    def close(self) -> None:
+        """Close every persistent shell session held by this client."""
+
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _call(self, method: str, attempt_once: Callable[[float | None], _T]) -> _T:
+        """Run ``attempt_once(timeout)`` under the retry policy for ``method``."""
+
+        policy = self.retry_policies.get(method, RetryPolicy())
+        attempt = 1
+        while True:
+            try:
+                return attempt_once(remaining_timeout(policy.timeout))
+            except policy.retry_on:
+                if attempt >= policy.attempts:
+                    raise
+                delay = policy.delay(attempt)
+                remaining = remaining_timeout(None)
+                if remaining is not None and remaining <= delay:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _remote_size_and_mtime(self, serial: str, source: str) -> Tuple[int, int]:
+        output = self._shell(serial, ["stat", "-c", "'%s %Y'", shlex.quote(source)])
+        fields = output.split()
+        if len(fields) != 2 or not all(value.isdigit() for value in fields):
+            raise AdbCommandError(f"stat {source}: unexpected output {output!r}", 1)
+        return int(fields[0]), int(fields[1])
+
+    def _read_chunk(
+        self, serial: str, source: str, index: int, chunk_size: int
+    ) -> bytes:
+        with self.exec_out(
+            serial, _dd_command(source, index, chunk_size), "pull_chunk"
+        ) as stream:
+            return stream.read()
+
+    def _remote_chunk_digest(
+        self,
+        serial: str,
+        source: str,
+        index: int,
+        chunk_size: int,
+        timeout: float | None,
+    ) -> str | None:
+        command = [_dd_command(source, index, chunk_size), "|", "sha256sum"]
+        try:
+            output = self._shell_once(serial, command, timeout)
+        except AdbCommandError:
+            return None  # no sha256sum on this device
+        digest = output.split()[0] if output.strip() else ""
+        return digest.lower() if len(digest) == 64 else None
 
-    def _run(self, args: List[str]) -> subprocess.CompletedProcess[str]:
+    def _shell(self, serial: str, command: List[str], method: str = "shell") -> str:
+        return self._call(
+            method, lambda timeout: self._shell_once(serial, command, timeout)
+        )
+
+    def _shell_once(
+        self, serial: str, command: List[str], timeout: float | None
+    ) -> str:
+        if not self.persistent_sessions:
+            return self._run_once(["-s", serial, "shell", *command], timeout).stdout
+
+        # adb joins shell arguments with spaces; the session does the same.
+        command_line = " ".join(command)
+        session = self._session(serial)
+        started = time.monotonic()
+        try:
+            exit_code, output = session.run(command_line, timeout)
+        except AdbError as exc:
+            self._record(
+                ["-s", serial, "shell", command_line],
+                started,
+                None if isinstance(exc, AdbTimeoutError) else 1,
+                "",
+            )
+            # A session still alive here timed out waiting for another
+            # thread's command, which must not be killed with it. A timeout
+            # of this call's own command has already killed the session.
+            if not session.alive:
+                self._drop_session(serial, session)
+            raise
+        self._record(["-s", serial, "shell", command_line], started, exit_code, output)
+        if exit_code != 0:
+            error_message = output.strip() or "adb command failed"
+            raise AdbCommandError(
+                f"{self.executable} -s {serial} shell {command_line}: {error_message}",
+                exit_code,
+            )
+        return output
+
+    def _session(self, serial: str) -> AdbShellSession:
+        with self._sessions_lock:
+            session = self._sessions.get(serial)
+            if session is None or not session.alive:
+                session = AdbShellSession(self.executable, serial)
+                self._sessions[serial] = session
+            return session
+
+    def _drop_session(self, serial: str, session: AdbShellSession) -> None:
+        with self._sessions_lock:
+            if self._sessions.get(serial) is session:
+                del self._sessions[serial]
+        session.close()
+
+    def _prune_sessions(self, connected: Iterable[str]) -> None:
+        connected_set = set(connected)
+        with self._sessions_lock:
+            stale = [
+                (serial, session)
+                for serial, session in self._sessions.items()
+                if serial not in connected_set
+            ]
+        for serial, session in stale:
+            self._drop_session(serial, session)
+
+    def _run(
+        self, args: List[str], method: str = "shell"
+    ) -> subprocess.CompletedProcess[str]:
+        return self._call(method, lambda timeout: self._run_once(args, timeout))
+
+    def _run_once(
+        self, args: List[str], timeout: float | None
+    ) -> subprocess.CompletedProcess[str]:
         command = [self.executable, *args]
-        completed = subprocess.run(
+        started = time.monotonic()
+        with subprocess.Popen(
             command,
-            check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+        ) as process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # adb.exe may have spawned helpers that hold the transport;
+                # killing only the client would leave them wedged.
+                kill_process_tree(process.pid)
+                process.wait()
+                self._record(args, started, None, "")
+                raise AdbTimeoutError(
+                    f"{' '.join(command)}: timed out after {timeout:g}s"
+                ) from None
+        self._record(args, started, process.returncode, stdout)
+        if process.returncode != 0:
+            raise adb_failure(" ".join(command), stderr, process.returncode)
+        return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+    def _record(
+        self,
+        args: List[str],
+        started: float,
+        returncode: int | None,
+        output: str,
+        output_bytes: int | None = None,
+    ) -> None:
+        """Time a finished call into ``metrics``.
+
+        ``output_bytes`` gives the size of binary output that was streamed
+        instead of collected into ``output``.
+        """
+
+        if output_bytes is None:
+            output_bytes = len(output.encode("utf-8", errors="replace"))
+        name, serial = command_key(args)
+        self.metrics.record(
+            AdbCallRecord(
+                command=name,
+                serial=serial,
+                seconds=time.monotonic() - started,
+                returncode=returncode,
+                output_bytes=output_bytes,
+            )
         )
-        if completed.returncode != 0:
-            error_message = completed.stderr.strip() or "adb command failed"
-            raise AdbError(f"{' '.join(command)}: {error_message}")
-        return completed
+
+
+def _dd_command(source: str, index: int, chunk_size: int) -> str:
+    blocks = chunk_size // _DD_BLOCK
+    return (
+        f"dd if={shlex.quote(source)} bs={_DD_BLOCK} skip={index * blocks} "
+        f"count={blocks} 2>/dev/null"
+    )
+
+
+def _load_resume_chunks(sidecar: Path, identity: Dict[str, object]) -> List[str]:
+    try:
+        with open(sidecar, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict) or data.get("identity") != identity:
+        return []  # a different or since-modified remote file
+    chunks = data.get("chunks")
+    return list(chunks) if isinstance(chunks, list) else []
+
+
+def _save_resume_chunks(
+    sidecar: Path, identity: Dict[str, object], chunks: List[str]
+) -> None:
+    temporary = sidecar.with_name(sidecar.name + ".tmp")
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump({"identity": identity, "chunks": chunks}, handle)
+    temporary.replace(sidecar)
+
+
+def parse_getprop(output: str) -> Dict[str, str]:
+    """Parse a full ``getprop`` dump into a property map."""
+
+    return {key: value for key, value in _GETPROP_LINE.findall(output)}
+
+
+def parse_package_list(output: str) -> FrozenSet[str]:
+    """Parse ``pm list packages`` output (``package:<name>`` lines)."""
+
+    return frozenset(
+        line[len("package:") :].strip()
+        for line in output.splitlines()
+        if line.startswith("package:")
+    )
+
+
+def parse_device_serials(output: str) -> List[str]:
+    """Return the serials that ``adb devices`` reports as ready."""
+
+    serials: list[str] = []
+    for line in output.splitlines():
+        if "\tdevice" in line:
+            serials.append(line.split("\t", maxsplit=1)[0])
+    return serials
+
+
+def console_command_args(command: str) -> List[str]:
+    """Shell arguments that deliver ``command`` to the UE console."""
+
+    # Broadcast intent with 'cmd' extra which UE listens for
+    # Command: adb shell am broadcast -a android.intent.action.RUN -e cmd 'command'
+    return [
+        "am",
+        "broadcast",
+        "-a",
+        "android.intent.action.RUN",
+        "-e",
+        "cmd",
+        shlex.quote(command),
+    ]
+
+
+def console_batch_args(commands: Sequence[str]) -> List[List[str]]:
+    """Group console broadcasts into ``&&``-chained shell argument lists.
+
+    Each list holds at most :data:`CONSOLE_BATCH_COMMANDS` broadcasts and
+    stays under the shell command limit, apart from a single command that
+    is longer on its own.
+    """
+
+    batches: list[list[str]] = []
+    current: list[str] = []
+    length = count = 0
+    for command in commands:
+        args = console_command_args(command)
+        size = sum(len(arg) + 1 for arg in args)
+        if current and (
+            count == CONSOLE_BATCH_COMMANDS or length + size + 3 > _CONSOLE_BATCH_CHARS
+        ):
+            batches.append(current)
+            current, length, count = [], 0, 0
+        if current:
+            current.append("&&")
+            length += 3
+        current.extend(args)
+        length += size
+        count += 1
+    if current:
+        batches.append(current)
+    return batches
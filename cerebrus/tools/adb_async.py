@@ -0,0 +1,221 @@
+"""asyncio-native counterpart of :class:`cerebrus.tools.adb.AdbClient`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from cerebrus.tools.adb import (
+    DEFAULT_PACKAGE_CACHE_TTL,
+    DEFAULT_RETRY_POLICIES,
+    AdbCommandError,
+    AdbError,
+    AdbTimeoutError,
+    RetryPolicy,
+    adb_failure,
+    console_batch_args,
+    console_command_args,
+    kill_process_tree,
+    parse_device_serials,
+    parse_getprop,
+    parse_package_list,
+    remaining_timeout,
+)
+from cerebrus.tools.adb_metrics import (
+    ADB_METRICS,
+    AdbCallRecord,
+    AdbMetrics,
+    command_key,
+)
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class AsyncAdbClient:
+    """Execute adb commands from an event loop without blocking threads.
+
+    Every call runs ``adb`` through :func:`asyncio.create_subprocess_exec`
+    under the same per-method :class:`RetryPolicy` table as ``AdbClient``. A
+    call that runs out of time, or whose task is cancelled, kills its adb
+    process tree before the error propagates.
+    """
+
+    executable: str = "adb"
+    retry_policies: Dict[str, RetryPolicy] = field(
+        default_factory=lambda: dict(DEFAULT_RETRY_POLICIES)
+    )
+    package_cache_ttl: float = DEFAULT_PACKAGE_CACHE_TTL
+    metrics: AdbMetrics = field(
+        default_factory=lambda: ADB_METRICS, repr=False, compare=False
+    )
+    _packages: Dict[str, Tuple[float, FrozenSet[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    async def list_devices(self) -> List[str]:
+        """Return a list of connected device serial numbers."""
+
+        return parse_device_serials(await self._run(["devices"], "list_devices"))
+
+    async def get_property(self, serial: str, prop: str) -> str:
+        """Fetch a system property from the device."""
+
+        output = await self._shell(serial, ["getprop", prop], "get_property")
+        return output.strip()
+
+    async def get_properties(self, serial: str) -> Dict[str, str]:
+        """Fetch every system property from the device in a single call."""
+
+        return parse_getprop(await self._shell(serial, ["getprop"], "get_properties"))
+
+    async def is_package_installed(self, serial: str, package_name: str) -> bool:
+        """Check whether the provided package is installed on the device."""
+
+        if not package_name:
+            return False
+
+        return package_name in await self.installed_packages(serial)
+
+    async def installed_packages(self, serial: str) -> FrozenSet[str]:
+        """Return every package installed on the device, cached like AdbClient."""
+
+        cached = self._packages.get(serial)
+        if cached is not None and time.monotonic() - cached[0] < self.package_cache_ttl:
+            return cached[1]
+        fetched_at = time.monotonic()
+        packages = parse_package_list(
+            await self._shell(
+                serial, ["pm", "list", "packages"], "is_package_installed"
+            )
+        )
+        self._packages[serial] = (fetched_at, packages)
+        return packages
+
+    def invalidate_packages(self, serial: str | None = None) -> None:
+        """Forget cached package lists, e.g. after an install or uninstall."""
+
+        if serial is None:
+            self._packages.clear()
+        else:
+            self._packages.pop(serial, None)
+
+    async def pull(self, serial: str, source: str, destination: str) -> None:
+        """Pull a file or directory from the device."""
+
+        await self._run(["-s", serial, "pull", source, destination], "pull")
+
+    async def shell(self, serial: str, command: List[str]) -> str:
+        """Run a shell command on the device."""
+
+        return await self._shell(serial, command)
+
+    async def send_console_command(self, serial: str, command: str) -> None:
+        """Send a console command to the running Unreal Engine application."""
+
+        await self._shell(serial, console_command_args(command), "send_console_command")
+
+    async def send_console_commands(self, serial: str, commands: Sequence[str]) -> None:
+        """Send several console commands, in order, in as few shell calls as fit."""
+        for args in console_batch_args(commands):
+            await self._shell(serial, args, "send_console_command")
+
+    async def is_package_running(self, serial: str, package_name: str) -> bool:
+        """Check if the package is currently running (has a PID)."""
+
+        if not package_name:
+            return False
+        try:
+            output = await self._shell(
+                serial, ["pidof", package_name], "is_package_running"
+            )
+        except AdbCommandError:
+            return False
+        return bool(output.strip())
+
+    async def _call(
+        self, method: str, attempt_once: Callable[[float | None], Awaitable[_T]]
+    ) -> _T:
+        policy = self.retry_policies.get(method, RetryPolicy())
+        attempt = 1
+        while True:
+            try:
+                return await attempt_once(remaining_timeout(policy.timeout))
+            except policy.retry_on:
+                if attempt >= policy.attempts:
+                    raise
+                delay = policy.delay(attempt)
+                remaining = remaining_timeout(None)
+                if remaining is not None and remaining <= delay:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _shell(
+        self, serial: str, command: List[str], method: str = "shell"
+    ) -> str:
+        return await self._run(["-s", serial, "shell", *command], method)
+
+    async def _run(self, args: List[str], method: str = "shell") -> str:
+        return await self._call(method, lambda timeout: self._run_once(args, timeout))
+
+    async def _run_once(self, args: List[str], timeout: float | None) -> str:
+        command = [self.executable, *args]
+        started = time.monotonic()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as exc:
+            raise AdbError(f"{' '.join(command)}: {exc}") from exc
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            await _kill(process)
+            self._record(args, started, None, 0)
+            raise AdbTimeoutError(
+                f"{' '.join(command)}: timed out after {timeout:g}s"
+            ) from None
+        except asyncio.CancelledError:
+            await _kill(process)
+            raise
+
+        self._record(args, started, process.returncode, len(stdout))
+        if process.returncode != 0:
+            raise adb_failure(
+                " ".join(command), _decode(stderr), process.returncode or 1
+            )
+        return _decode(stdout)
+
+    def _record(
+        self, args: List[str], started: float, returncode: int | None, size: int
+    ) -> None:
+        name, serial = command_key(args)
+        self.metrics.record(
+            AdbCallRecord(name, serial, time.monotonic() - started, returncode, size)
+        )
+
+
+def _decode(data: bytes) -> str:
+    # Match the universal-newline text mode used by the blocking client.
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        kill_process_tree(process.pid)
+    await process.wait()
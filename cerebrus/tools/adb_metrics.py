@@ -0,0 +1,187 @@
+"""In-process latency metrics for adb invocations."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Deque, Dict, List, Sequence
+
+# Upper bounds (seconds) of the cumulative latency histogram buckets.
+HISTOGRAM_BOUNDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf)
+DEFAULT_SAMPLES = 1000
+_RECENT_RECORDS = 200
+
+
+@dataclass(frozen=True)
+class AdbCallRecord:
+    """One finished adb invocation."""
+
+    command: str  # e.g. "devices", "pull", "shell getprop"
+    serial: str  # "" for host commands such as ``adb devices``
+    seconds: float
+    returncode: int | None  # None when the call was killed on timeout
+    output_bytes: int
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Latency summary for one command or one device."""
+
+    key: str
+    calls: int
+    failures: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    output_bytes: int
+
+
+class _Series:
+    def __init__(self, samples: int) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.output_bytes = 0
+        self.latencies: Deque[float] = deque(maxlen=samples)
+        self.buckets = [0] * len(HISTOGRAM_BOUNDS)
+
+    def add(self, record: AdbCallRecord) -> None:
+        self.calls += 1
+        if record.returncode != 0:
+            self.failures += 1
+        self.output_bytes += record.output_bytes
+        self.latencies.append(record.seconds)
+        for index, bound in enumerate(HISTOGRAM_BOUNDS):
+            if record.seconds <= bound:
+                self.buckets[index] += 1
+                break
+
+    def stats(self, key: str) -> LatencyStats:
+        ordered = sorted(self.latencies)
+        return LatencyStats(
+            key=key,
+            calls=self.calls,
+            failures=self.failures,
+            p50=percentile(ordered, 0.50),
+            p95=percentile(ordered, 0.95),
+            p99=percentile(ordered, 0.99),
+            max=ordered[-1] if ordered else 0.0,
+            output_bytes=self.output_bytes,
+        )
+
+
+class AdbMetrics:
+    """Thread-safe registry of adb call latencies.
+
+    Calls are grouped by command and by device. Percentiles are taken over
+    the last ``samples`` calls of each group; counts, byte totals and the
+    histogram buckets cover every call since the last :meth:`reset`.
+    """
+
+    def __init__(self, samples: int = DEFAULT_SAMPLES) -> None:
+        self._samples = samples
+        self._lock = threading.Lock()
+        self._commands: Dict[str, _Series] = {}
+        self._devices: Dict[str, _Series] = {}
+        self._recent: Deque[AdbCallRecord] = deque(maxlen=_RECENT_RECORDS)
+
+    def record(self, record: AdbCallRecord) -> None:
+        with self._lock:
+            self._series(self._commands, record.command).add(record)
+            if record.serial:
+                self._series(self._devices, record.serial).add(record)
+            self._recent.append(record)
+
+    def by_command(self) -> List[LatencyStats]:
+        """Per-command statistics, slowest p95 first."""
+
+        with self._lock:
+            return _sorted_stats(self._commands)
+
+    def by_device(self) -> List[LatencyStats]:
+        """Per-device statistics, slowest p95 first."""
+
+        with self._lock:
+            return _sorted_stats(self._devices)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Everything recorded so far as plain JSON-serialisable data."""
+
+        with self._lock:
+            return {
+                "histogram_bounds": [
+                    "inf" if math.isinf(bound) else bound for bound in HISTOGRAM_BOUNDS
+                ],
+                "commands": _dump_series(self._commands),
+                "devices": _dump_series(self._devices),
+                "recent": [asdict(record) for record in self._recent],
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def dump(self, path: Path) -> None:
+        """Write :meth:`snapshot` to ``path`` as JSON."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_json(), encoding="utf-8")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._commands.clear()
+            self._devices.clear()
+            self._recent.clear()
+
+    def _series(self, groups: Dict[str, _Series], key: str) -> _Series:
+        series = groups.get(key)
+        if series is None:
+            series = groups[key] = _Series(self._samples)
+        return series
+
+
+# Shared by every client unless one is given its own registry.
+ADB_METRICS = AdbMetrics()
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted ``ordered`` values."""
+
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def command_key(args: Sequence[str]) -> tuple[str, str]:
+    """Split adb arguments (without the executable) into ``(command, serial)``.
+
+    Shell-style commands keep the program they ran, e.g. ``shell getprop``, so
+    slow device-side tools stand out from each other.
+    """
+
+    serial = ""
+    rest = list(args)
+    if len(rest) >= 2 and rest[0] == "-s":
+        serial, rest = rest[1], rest[2:]
+    if not rest:
+        return "", serial
+    if rest[0] in ("shell", "exec-out") and len(rest) > 1:
+        program = rest[1].split()[0] if rest[1].split() else ""
+        return f"{rest[0]} {program}".rstrip(), serial
+    return rest[0], serial
+
+
+def _sorted_stats(groups: Dict[str, _Series]) -> List[LatencyStats]:
+    stats = [series.stats(key) for key, series in groups.items()]
+    return sorted(stats, key=lambda item: item.p95, reverse=True)
+
+
+def _dump_series(groups: Dict[str, _Series]) -> Dict[str, object]:
+    return {
+        key: {**asdict(series.stats(key)), "histogram": list(series.buckets)}
+        for key, series in sorted(groups.items())
+    }
@@ -0,0 +1,466 @@
+"""AdbClient backend that speaks the adb server's socket protocol directly."""
+
+from __future__ import annotations
+
+import io
+import posixpath
+import socket
+import stat
+import struct
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Tuple
+
+from cerebrus.tools.adb import (
+    AdbClient,
+    AdbCommandError,
+    AdbDeviceOfflineError,
+    AdbError,
+    AdbTimeoutError,
+    RetryPolicy,
+    adb_failure,
+    remaining_timeout,
+)
+
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 5037
+
+# shell,v2 packet ids
+_SHELL_STDOUT = 1
+_SHELL_STDERR = 2
+_SHELL_EXIT = 3
+
+_SYNC_CHUNK = 64 * 1024
+
+
+class _ShellV2Unsupported(Exception):
+    """The device rejected the shell v2 service; fall back to ``shell:``."""
+
+
+class AdbServerConnection:
+    """One socket to the adb server speaking the host smart-socket protocol.
+
+    ``timeout`` bounds each blocking read. ``deadline``, a
+    :func:`time.monotonic` value, bounds all reads together, so a peer that
+    keeps trickling data cannot outlast it.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_SERVER_HOST,
+        port: int = DEFAULT_SERVER_PORT,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        self._timeout = timeout
+        self._deadline = deadline
+        try:
+            self._socket = socket.create_connection((host, port), timeout=timeout)
+        except OSError as exc:
+            raise AdbError(f"adb server not reachable at {host}:{port}: {exc}") from exc
+
+    def __enter__(self) -> "AdbServerConnection":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # shutdown() wakes a recv() blocked in another thread before closing.
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+    def request(self, service: str) -> None:
+        """Send ``service`` and raise :class:`AdbError` unless the server says OKAY."""
+
+        payload = service.encode("utf-8")
+        self.send(b"%04x" % len(payload) + payload)
+        status = self.read_exact(4)
+        if status == b"OKAY":
+            return
+        if status == b"FAIL":
+            raise adb_failure(service, self.read_length_prefixed())
+        raise AdbError(f"{service}: unexpected adb server reply {status!r}")
+
+    def read_length_prefixed(self) -> str:
+        """Read a payload prefixed by a four digit hex length."""
+
+        length = int(self.read_exact(4), 16)
+        return self.read_exact(length).decode("utf-8", errors="replace")
+
+    def send(self, data: bytes) -> None:
+        try:
+            self._socket.sendall(data)
+        except OSError as exc:
+            raise AdbError(f"adb server connection failed: {exc}") from exc
+
+    def read_exact(self, size: int) -> bytes:
+        buffer = bytearray()
+        while len(buffer) < size:
+            chunk = self.read_some(size - len(buffer))
+            if not chunk:
+                # The server drops transport connections when the device goes.
+                raise AdbDeviceOfflineError("adb server closed the connection")
+            buffer.extend(chunk)
+        return bytes(buffer)
+
+    def read_some(self, size: int = _SYNC_CHUNK) -> bytes:
+        """Return up to ``size`` bytes, or ``b""`` once the server closes."""
+
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                raise AdbTimeoutError("adb server call ran past its time limit")
+            if self._timeout is not None:
+                remaining = min(remaining, self._timeout)
+            self._socket.settimeout(remaining)
+        try:
+            return self._socket.recv(size)
+        except socket.timeout as exc:
+            raise AdbTimeoutError("adb server connection timed out") from exc
+        except OSError as exc:
+            raise AdbError(f"adb server connection failed: {exc}") from exc
+
+
+class _ConnectionReader(io.RawIOBase):
+    """Raw binary stream over a connection, ending at server EOF."""
+
+    def __init__(self, connection: AdbServerConnection) -> None:
+        self._connection = connection
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._connection.read_some(len(buffer))
+        buffer[: len(chunk)] = chunk
+        self.bytes_read += len(chunk)
+        return len(chunk)
+
+
+class DeviceTracker:
+    """Stream of device state snapshots from ``host:track-devices``."""
+
+    def __init__(self, connection: AdbServerConnection) -> None:
+        self._connection = connection
+        self._connection.request("host:track-devices")
+
+    def next_snapshot(self) -> Dict[str, str]:
+        """Block until the server reports the device list and return it.
+
+        Raises :class:`AdbError` when the stream ends or :meth:`close` is
+        called from another thread.
+        """
+
+        return parse_device_states(self._connection.read_length_prefixed())
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class _SyncSession:
+    """Minimal client for the ``sync:`` file transfer sub-protocol."""
+
+    def __init__(self, connection: AdbServerConnection) -> None:
+        self._connection = connection
+        self.bytes_received = 0
+
+    def stat(self, path: str) -> Tuple[int, int, int]:
+        """Return ``(mode, size, mtime)``; mode is 0 when the path is missing."""
+
+        self._send("STAT", path)
+        reply = self._connection.read_exact(16)
+        if reply[:4] != b"STAT":
+            raise AdbError(f"sync STAT {path}: unexpected reply {reply[:4]!r}")
+        mode, size, mtime = struct.unpack("<III", reply[4:])
+        return mode, size, mtime
+
+    def list(self, path: str) -> List[Tuple[str, int]]:
+        """Return ``(name, mode)`` for each entry of a remote directory."""
+
+        self._send("LIST", path)
+        entries: list[tuple[str, int]] = []
+        while True:
+            header = self._connection.read_exact(20)
+            if header[:4] == b"DONE":
+                return entries
+            if header[:4] != b"DENT":
+                raise AdbError(f"sync LIST {path}: unexpected reply {header[:4]!r}")
+            mode, _size, _mtime, name_length = struct.unpack("<IIII", header[4:])
+            name = self._connection.read_exact(name_length).decode("utf-8")
+            if name not in (".", ".."):
+                entries.append((name, mode))
+
+    def recv(self, path: str, destination: Path) -> None:
+        """Stream a remote file into ``destination``."""
+
+        self._send("RECV", path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        with open(destination, "wb") as handle:
+            while True:
+                header = self._connection.read_exact(8)
+                kind = header[:4]
+                (length,) = struct.unpack("<I", header[4:])
+                if kind == b"DATA":
+                    handle.write(self._connection.read_exact(length))
+                    self.bytes_received += length
+                elif kind == b"DONE":
+                    return
+                elif kind == b"FAIL":
+                    message = self._connection.read_exact(length).decode(
+                        "utf-8", errors="replace"
+                    )
+                    raise AdbCommandError(f"sync RECV {path}: {message}", 1)
+                else:
+                    raise AdbError(f"sync RECV {path}: unexpected reply {kind!r}")
+
+    def quit(self) -> None:
+        self._connection.send(b"QUIT" + struct.pack("<I", 0))
+
+    def _send(self, request_id: str, path: str) -> None:
+        encoded = path.encode("utf-8")
+        self._connection.send(
+            request_id.encode("ascii") + struct.pack("<I", len(encoded)) + encoded
+        )
+
+
+@dataclass
+class AdbServerClient(AdbClient):
+    """Run AdbClient operations over the adb server socket, without adb.exe.
+
+    Each operation opens one local TCP connection to the server instead of
+    spawning a process, so ``persistent_sessions`` has no effect here.
+    """
+
+    host: str = DEFAULT_SERVER_HOST
+    port: int = DEFAULT_SERVER_PORT
+    socket_timeout: float | None = 30.0
+
+    def list_devices(self) -> List[str]:
+        """Return a list of connected device serial numbers."""
+
+        return self._call("list_devices", self._list_devices_once)
+
+    def _list_devices_once(self, timeout: float | None) -> List[str]:
+        started = time.monotonic()
+        try:
+            with self._connect(timeout) as connection:
+                connection.request("host:devices-l")
+                listing = connection.read_length_prefixed()
+        except AdbError as exc:
+            self._record(["devices"], started, _failure_code(exc), "")
+            raise
+        self._record(["devices"], started, 0, listing)
+        states = parse_device_states(listing)
+        return [serial for serial, state in states.items() if state == "device"]
+
+    def track_devices(self) -> DeviceTracker:
+        """Open a ``host:track-devices`` stream; the caller must close it."""
+
+        connection = AdbServerConnection(self.host, self.port, timeout=None)
+        try:
+            return DeviceTracker(connection)
+        except AdbError:
+            connection.close()
+            raise
+
+    def pull(self, serial: str, source: str, destination: str) -> None:
+        """Pull a file or directory from the device over the sync protocol."""
+
+        self._call(
+            "pull",
+            lambda timeout: self._pull_once(serial, source, destination, timeout),
+        )
+
+    @contextmanager
+    def exec_out(
+        self, serial: str, command: str, method: str = "exec_out"
+    ) -> Iterator[IO[bytes]]:
+        """Stream the raw stdout of ``command`` over the ``exec:`` service.
+
+        The timeout of the ``method`` policy bounds the whole stream.
+        """
+
+        timeout = remaining_timeout(
+            self.retry_policies.get(method, RetryPolicy()).timeout
+        )
+        args = ["-s", serial, "exec-out", command]
+        started = time.monotonic()
+        reader: _ConnectionReader | None = None
+        returncode: int | None = 0
+        try:
+            with self._connect_transport(serial, timeout) as connection:
+                connection.request(f"exec:{command}")
+                reader = _ConnectionReader(connection)
+                yield io.BufferedReader(reader)
+        except Exception as exc:
+            returncode = _failure_code(exc)
+            raise
+        finally:
+            received = reader.bytes_read if reader is not None else 0
+            self._record(args, started, returncode, "", output_bytes=received)
+
+    def close(self) -> None:
+        """Nothing to release; connections are closed after every operation."""
+
+    def _pull_once(
+        self, serial: str, source: str, destination: str, timeout: float | None
+    ) -> None:
+        args = ["-s", serial, "pull", source, destination]
+        started = time.monotonic()
+        sync: _SyncSession | None = None
+        returncode: int | None = 0
+        try:
+            with self._connect_transport(serial, timeout) as connection:
+                connection.request("sync:")
+                sync = _SyncSession(connection)
+                self._pull_sync(sync, source, destination)
+        except AdbError as exc:
+            returncode = _failure_code(exc)
+            raise
+        finally:
+            received = sync.bytes_received if sync is not None else 0
+            self._record(args, started, returncode, "", output_bytes=received)
+
+    def _pull_sync(self, sync: _SyncSession, source: str, destination: str) -> None:
+        contents_only = source.endswith("/.")
+        remote = source[:-2] if contents_only else source
+        remote = remote.rstrip("/") or "/"
+        target = Path(destination)
+
+        mode, _size, _mtime = sync.stat(remote)
+        if mode == 0:
+            raise AdbCommandError(f"remote object '{remote}' does not exist", 1)
+
+        if stat.S_ISDIR(mode):
+            if not contents_only and target.is_dir():
+                target = target / posixpath.basename(remote)
+            target.mkdir(parents=True, exist_ok=True)
+            self._pull_tree(sync, remote, target)
+        else:
+            if target.is_dir():
+                target = target / posixpath.basename(remote)
+            sync.recv(remote, target)
+        sync.quit()
+
+    def _shell_once(
+        self, serial: str, command: List[str], timeout: float | None
+    ) -> str:
+        command_line = " ".join(command)
+        args = ["-s", serial, "shell", command_line]
+        started = time.monotonic()
+        try:
+            try:
+                exit_code, stdout, stderr = self._shell_v2(
+                    serial, command_line, timeout
+                )
+            except _ShellV2Unsupported:
+                legacy_output = self._shell_legacy(serial, command_line, timeout)
+                exit_code, stdout, stderr = 0, legacy_output, ""
+        except AdbError as exc:
+            self._record(args, started, _failure_code(exc), "")
+            raise
+        self._record(args, started, exit_code, stdout)
+        if exit_code != 0:
+            error_message = stderr.strip() or stdout.strip() or "adb command failed"
+            raise AdbCommandError(
+                f"shell {command_line} on {serial}: {error_message}", exit_code
+            )
+        return stdout
+
+    def _shell_v2(
+        self, serial: str, command_line: str, timeout: float | None
+    ) -> Tuple[int, str, str]:
+        stdout = bytearray()
+        stderr = bytearray()
+        with self._connect_transport(serial, timeout) as connection:
+            try:
+                connection.request(f"shell,v2,raw:{command_line}")
+            except AdbCommandError as exc:
+                # Only a FAIL reply means the device lacks shell v2. Offline,
+                # timeout and connection errors propagate: retrying them over
+                # shell: would hide the failure and lose the exit code.
+                raise _ShellV2Unsupported() from exc
+            while True:
+                header = connection.read_exact(5)
+                (length,) = struct.unpack("<I", header[1:])
+                payload = connection.read_exact(length)
+                if header[0] == _SHELL_STDOUT:
+                    stdout.extend(payload)
+                elif header[0] == _SHELL_STDERR:
+                    stderr.extend(payload)
+                elif header[0] == _SHELL_EXIT:
+                    exit_code = payload[0] if payload else 0
+                    break
+        return (
+            exit_code,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    def _shell_legacy(
+        self, serial: str, command_line: str, timeout: float | None
+    ) -> str:
+        output = bytearray()
+        with self._connect_transport(serial, timeout) as connection:
+            connection.request(f"shell:{command_line}")
+            while chunk := connection.read_some():
+                output.extend(chunk)
+        return output.decode("utf-8", errors="replace")
+
+    def _pull_tree(self, sync: _SyncSession, remote: str, target: Path) -> None:
+        for name, mode in sync.list(remote):
+            remote_child = posixpath.join(remote, name)
+            if stat.S_ISDIR(mode):
+                (target / name).mkdir(parents=True, exist_ok=True)
+                self._pull_tree(sync, remote_child, target / name)
+            elif stat.S_ISREG(mode):
+                sync.recv(remote_child, target / name)
+
+    def _connect(self, timeout: float | None) -> AdbServerConnection:
+        # The socket timeout bounds each blocking read, so a silent transport
+        # fails fast; the deadline bounds the call as a whole.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if timeout is None or (
+            self.socket_timeout is not None and self.socket_timeout < timeout
+        ):
+            timeout = self.socket_timeout
+        return AdbServerConnection(self.host, self.port, timeout, deadline)
+
+    def _connect_transport(
+        self, serial: str, timeout: float | None
+    ) -> AdbServerConnection:
+        connection = self._connect(timeout)
+        try:
+            connection.request(f"host:transport:{serial}")
+        except AdbError:
+            connection.close()
+            raise
+        return connection
+
+
+def _failure_code(error: BaseException) -> int | None:
+    """The metrics return code of a failed call: None for a timeout."""
+
+    if isinstance(error, AdbTimeoutError):
+        return None
+    if isinstance(error, AdbCommandError):
+        return error.returncode
+    return 1
+
+
+def parse_device_states(listing: str) -> Dict[str, str]:
+    """Parse ``adb devices`` style output into ``{serial: state}``."""
+
+    states: dict[str, str] = {}
+    for line in listing.splitlines():
+        fields = line.split()
+        if len(fields) >= 2:
+            states[fields[0]] = fields[1]
+    return states
@@ -0,0 +1,233 @@
+"""Trigram posting lists for searching log lines without scanning them."""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Collection, Dict, List, Set, TextIO, Tuple
+
+GRAM = 3
+# Trigrams found in more than this fraction of lines are left out: they would
+# dominate the index and barely narrow a search down.
+DEFAULT_DENSE_FRACTION = 0.5
+# About 1% false positives with the number of hashes below.
+BLOOM_BITS_PER_GRAM = 10
+BLOOM_HASHES = 7
+
+
+class TrigramIndex:
+    """Which lines contain each lower-cased trigram.
+
+    Lines are numbered in the order they are added. Each posting list is
+    kept as delta-encoded varints, so a posting usually costs one byte. A
+    search for a term of at least three characters intersects the lists of
+    its trigrams and only checks the lines left over; shorter terms, and
+    trigrams listed as ``dense``, need a scan.
+    """
+
+    def __init__(self, dense_fraction: float = DEFAULT_DENSE_FRACTION) -> None:
+        self.lines = 0
+        self._dense_fraction = dense_fraction
+        # trigram -> [last line added, number of lines, varint deltas]
+        self._postings: Dict[str, list] = {}
+
+    def add(self, line: str) -> int:
+        """Index ``line`` and return its number."""
+
+        number = self.lines
+        self.lines += 1
+        postings = self._postings
+        for gram in trigrams(line):
+            entry = postings.get(gram)
+            if entry is None:
+                entry = postings[gram] = [0, 0, bytearray()]
+            delta = number - entry[0]
+            entry[0] = number
+            entry[1] += 1
+            _append_varint(entry[2], delta)
+        return number
+
+    def extend(self, other: TrigramIndex) -> None:
+        """Append the lines indexed by ``other`` after this index's lines.
+
+        Lets separately built indexes of consecutive parts of a log, e.g.
+        from worker processes, be joined without re-reading the lines.
+        """
+
+        offset = self.lines
+        postings = self._postings
+        for gram, (last, count, deltas) in other._postings.items():
+            entry = postings.get(gram)
+            if entry is None:
+                entry = postings[gram] = [0, 0, bytearray()]
+            # Only the first delta of ``other`` (its first line number)
+            # changes; the rest stay relative to the previous posting.
+            first, size = _read_varint(deltas)
+            _append_varint(entry[2], first + offset - entry[0])
+            entry[2] += deltas[size:]
+            entry[0] = last + offset
+            entry[1] += count
+        self.lines += other.lines
+
+    def lines_with(self, gram: str) -> List[int] | None:
+        """Line numbers containing ``gram``; ``None`` if it is dense."""
+
+        entry = self._postings.get(gram.lower())
+        if entry is None:
+            return []
+        if self._is_dense(entry[1]):
+            return None
+        return decode_postings(bytes(entry[2]))
+
+    def search(self, term: str) -> List[int] | None:
+        """Candidate lines for ``term``; ``None`` when a scan is needed.
+
+        Candidates contain every indexed trigram of ``term`` but not
+        necessarily ``term`` itself, so callers still check each one.
+        """
+
+        lists = []
+        for gram in trigrams(term):
+            lines = self.lines_with(gram)
+            if lines is None:
+                continue
+            if not lines:
+                return []
+            lists.append(lines)
+        if not lists:
+            return None
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for lines in lists[1:]:
+            candidates.intersection_update(lines)
+        return sorted(candidates)
+
+    def write_json(self, out: TextIO) -> None:
+        """Write the index as JSON, one posting list at a time.
+
+        The shape is ``{"gram": 3, "lines": n, "dense": [...], "postings":
+        {trigram: base64 varint deltas}}``. ``<`` is escaped so the JSON
+        can sit inside a ``<script>`` element.
+        """
+
+        dense = sorted(
+            gram for gram, entry in self._postings.items() if self._is_dense(entry[1])
+        )
+        out.write(f'{{"gram": {GRAM}, "lines": {self.lines}, "dense": ')
+        out.write(_script_safe(json.dumps(dense, ensure_ascii=False)))
+        out.write(', "postings": {')
+        first = True
+        for gram, entry in self._postings.items():
+            if self._is_dense(entry[1]):
+                continue
+            if not first:
+                out.write(",")
+            first = False
+            out.write(_script_safe(json.dumps(gram, ensure_ascii=False)))
+            out.write(':"')
+            out.write(base64.b64encode(entry[2]).decode("ascii"))
+            out.write('"')
+        out.write("}}")
+
+    def _is_dense(self, count: int) -> bool:
+        return count > self.lines * self._dense_fraction
+
+
+class TrigramBloom:
+    """A Bloom filter of lower-cased trigrams.
+
+    Much smaller than posting lists, it only answers whether some text may
+    contain a term: ``False`` is certain, ``True`` can be wrong. The bit for
+    hash ``i`` of a trigram is ``(h1 + i * h2) % bits``, with ``h1`` and
+    ``h2`` 32-bit FNV-1a hashes of its code points; page scripts compute
+    the same.
+    """
+
+    def __init__(
+        self, grams: Collection[str], bits_per_gram: int = BLOOM_BITS_PER_GRAM
+    ) -> None:
+        self.bits = max(64, -(-len(grams) * bits_per_gram // 8) * 8)
+        self.hashes = BLOOM_HASHES
+        self._data = bytearray(self.bits // 8)
+        for gram in grams:
+            for bit in self._bits(gram):
+                self._data[bit >> 3] |= 1 << (bit & 7)
+
+    def might_contain(self, term: str) -> bool:
+        """``False`` if some trigram of ``term`` was never added."""
+
+        data = self._data
+        return all(
+            data[bit >> 3] & (1 << (bit & 7))
+            for gram in trigrams(term)
+            for bit in self._bits(gram)
+        )
+
+    def to_json(self) -> Dict[str, object]:
+        """``{"bits": n, "hashes": k, "data": base64 bit array}``."""
+
+        data = base64.b64encode(self._data).decode("ascii")
+        return {"bits": self.bits, "hashes": self.hashes, "data": data}
+
+    def _bits(self, gram: str) -> List[int]:
+        h1 = _fnv1a(gram, _FNV_OFFSET)
+        h2 = _fnv1a(gram, _FNV_OFFSET_2) | 1
+        return [((h1 + i * h2) & 0xFFFFFFFF) % self.bits for i in range(self.hashes)]
+
+
+def trigrams(text: str) -> Set[str]:
+    """The distinct lower-cased trigrams of ``text``."""
+
+    lowered = text.lower()
+    return {lowered[i : i + GRAM] for i in range(len(lowered) - GRAM + 1)}
+
+
+def decode_postings(data: bytes) -> List[int]:
+    """Line numbers from delta-encoded varints."""
+
+    lines = []
+    line = value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            line += value
+            lines.append(line)
+            value = shift = 0
+    return lines
+
+
+def _append_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes | bytearray) -> Tuple[int, int]:
+    """The first varint in ``data`` and the number of bytes it takes."""
+
+    value = shift = 0
+    for size, byte in enumerate(data, 1):
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, size
+        shift += 7
+    raise ValueError("truncated varint")
+
+
+_FNV_OFFSET = 0x811C9DC5
+_FNV_OFFSET_2 = 0x050C5D1F
+_FNV_PRIME = 0x01000193
+
+
+def _fnv1a(text: str, offset: int) -> int:
+    value = offset
+    for char in text:
+        value = ((value ^ ord(char)) * _FNV_PRIME) & 0xFFFFFFFF
+    return value
+
+
+def _script_safe(text: str) -> str:
+    return text.replace("<", "\\u003c")
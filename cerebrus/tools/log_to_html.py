@@ -1,9 +1,34 @@
 """Convert text log files to colored HTML with search filtering."""
 
+from __future__ import annotations
+
 import argparse
+import io
+import json
+import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from html import escape
+from itertools import islice
 from pathlib import Path
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import quote
+
+from cerebrus.tools.log_search_index import GRAM, TrigramBloom, TrigramIndex, trigrams
 
 # Define log level color patterns
 # Order matters! First match wins.
@@ -257,8 +282,8 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         </div>
         
         <div class="stats">
-            <span>Total Lines: <strong id="totalLines">{total_lines}</strong></span>
-            <span>Visible Lines: <strong id="visibleLines">{total_lines}</strong></span>
+            <span>Total Lines: <strong id="totalLines"></strong></span>
+            <span>Visible Lines: <strong id="visibleLines"></strong></span>
         </div>
         
         <div class="log-container" id="logContainer">
@@ -272,6 +297,10 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         const visibleLinesSpan = document.getElementById('visibleLines');
         const filterBtns = document.querySelectorAll('.filter-btn');
         
+        // Lines are streamed into the page, so count them here.
+        document.getElementById('totalLines').textContent = logLines.length;
+        visibleLinesSpan.textContent = logLines.length;
+        
         let currentFilter = 'all';
         let searchTimeout;
         
@@ -377,59 +406,1061 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
+# The virtual viewer reuses the page above up to the log container, so both
+# modes look the same. Only the rows in view exist in the DOM; the lines are
+# embedded once as JSON and their levels as one digit per line.
+_VIRTUAL_STYLE = """
+        .log-container.virtual {{
+            position: relative;
+            height: 600px;
+            max-height: none;
+            padding: 0;
+        }}
+
+        .virtual .log-window {{
+            position: absolute;
+            top: 0;
+            left: 0;
+            right: 0;
+        }}
+
+        .virtual .log-line {{
+            height: 24px;
+            line-height: 24px;
+            margin: 0;
+            padding: 0 12px;
+            white-space: pre;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }}
+
+        .virtual .log-line:hover {{
+            transform: none;
+        }}
+
+        .page-nav {{
+            display: flex;
+            gap: 20px;
+            justify-content: center;
+            margin-bottom: 15px;
+            font-size: 13px;
+            color: #a0a0b0;
+        }}
+
+        .page-nav a, .page-table a {{
+            color: #7dd3fc;
+            text-decoration: none;
+        }}
+
+        .page-nav a:hover, .page-table a:hover {{
+            text-decoration: underline;
+        }}
+    </style>"""
+
+_VIRTUAL_HEAD = HTML_TEMPLATE[
+    : HTML_TEMPLATE.index('        <div class="log-container"')
+].replace("\n    </style>", _VIRTUAL_STYLE, 1)
+
+# Not a format string: the JavaScript keeps its braces, and the three
+# placeholders are substituted by _virtual_template_parts.
+_VIRTUAL_BODY = r"""        <div class="log-container virtual" id="logContainer">
+            <div id="logSpacer">
+                <div class="log-window" id="logWindow"></div>
+            </div>
+        </div>
+    </div>
+
+    <script id="logData" type="application/json">{log_data}</script>
+    <script id="logLevels" type="text/plain">{log_levels}</script>
+    <script id="logIndex" type="application/json">{log_index}</script>
+    <script>
+        const LEVELS = {level_names};
+        const ROW_HEIGHT = 24;
+        const OVERSCAN = 20;
+        // Browsers cap element heights, so past this the scroll range is
+        // mapped onto the rows instead of giving every row its own pixels.
+        const MAX_SPACER = 8000000;
+
+        const lines = JSON.parse(document.getElementById('logData').textContent);
+        const levelCodes = document.getElementById('logLevels').textContent;
+        const levels = new Uint8Array(lines.length);
+        for (let i = 0; i < lines.length; i++) {
+            levels[i] = levelCodes.charCodeAt(i) - 48;
+        }
+        let lowerLines = null;  // built on the first search that scans
+        // Optional trigram posting lists (see cerebrus.tools.log_search_index).
+        const searchIndex = JSON.parse(document.getElementById('logIndex').textContent);
+        const denseGrams = new Set(searchIndex ? searchIndex.dense : []);
+        const postingCache = new Map();
+
+        const searchInput = document.getElementById('searchInput');
+        const logContainer = document.getElementById('logContainer');
+        const logSpacer = document.getElementById('logSpacer');
+        const logWindow = document.getElementById('logWindow');
+        const visibleLinesSpan = document.getElementById('visibleLines');
+        const filterBtns = document.querySelectorAll('.filter-btn');
+
+        // Indices of the lines passing the current filters, in order.
+        const visible = new Uint32Array(lines.length);
+        let visibleCount = lines.length;
+        for (let i = 0; i < lines.length; i++) {
+            visible[i] = i;
+        }
+
+        let currentFilter = 'all';
+        let highlight = null;
+        let searchTimeout;
+        let renderPending = false;
+
+        document.getElementById('totalLines').textContent = lines.length;
+
+        searchInput.addEventListener('input', function(e) {
+            clearTimeout(searchTimeout);
+            searchTimeout = setTimeout(() => {
+                applyFilters();
+            }, 150);
+        });
+
+        logContainer.addEventListener('scroll', scheduleRender);
+        window.addEventListener('resize', scheduleRender);
+
+        function setFilter(filterType) {
+            currentFilter = filterType;
+
+            filterBtns.forEach(btn => {
+                if (btn.getAttribute('data-filter') === filterType) {
+                    btn.classList.add('active');
+                } else {
+                    btn.classList.remove('active');
+                }
+            });
+
+            applyFilters();
+        }
+
+        function applyFilters() {
+            const searchTerm = searchInput.value.toLowerCase().trim();
+            const level = currentFilter === 'all' ? -1 : LEVELS.indexOf(currentFilter);
+            const candidates = searchTerm ? indexCandidates(searchTerm) : null;
+
+            let count = 0;
+            if (candidates !== null) {
+                for (let k = 0; k < candidates.length; k++) {
+                    const i = candidates[k];
+                    if (level >= 0 && levels[i] !== level) continue;
+                    if (!lines[i].toLowerCase().includes(searchTerm)) continue;
+                    visible[count++] = i;
+                }
+            } else {
+                if (searchTerm && lowerLines === null) {
+                    lowerLines = lines.map(line => line.toLowerCase());
+                }
+                for (let i = 0; i < lines.length; i++) {
+                    if (level >= 0 && levels[i] !== level) continue;
+                    if (searchTerm && !lowerLines[i].includes(searchTerm)) continue;
+                    visible[count++] = i;
+                }
+            }
+            visibleCount = count;
+            highlight = searchTerm
+                ? new RegExp(`(${escapeRegex(searchInput.value)})`, 'gi')
+                : null;
+
+            logContainer.scrollTop = 0;
+            layout();
+        }
+
+        // Lines holding every indexed trigram of term, ascending, or null
+        // when there is no index or term has no usable trigram.
+        function indexCandidates(term) {
+            if (!searchIndex) return null;
+            const chars = Array.from(term);  // code points, as in Python
+            const lists = [];
+            const seen = new Set();
+            for (let i = 0; i + searchIndex.gram <= chars.length; i++) {
+                const gram = chars.slice(i, i + searchIndex.gram).join('');
+                if (seen.has(gram) || denseGrams.has(gram)) continue;
+                seen.add(gram);
+                const list = postings(gram);
+                if (list.length === 0) return list;
+                lists.push(list);
+            }
+            if (lists.length === 0) return null;
+            lists.sort((a, b) => a.length - b.length);
+            let result = lists[0];
+            for (let k = 1; k < lists.length && result.length > 0; k++) {
+                result = intersect(result, lists[k]);
+            }
+            return result;
+        }
+
+        function postings(gram) {
+            let list = postingCache.get(gram);
+            if (list === undefined) {
+                const encoded = searchIndex.postings[gram];
+                list = encoded === undefined ? new Uint32Array(0) : decodePostings(encoded);
+                postingCache.set(gram, list);
+            }
+            return list;
+        }
+
+        function decodePostings(encoded) {
+            // Base64 of varint deltas between ascending line numbers.
+            const bytes = atob(encoded);
+            const list = new Uint32Array(bytes.length);
+            let count = 0, line = 0, value = 0, scale = 1;
+            for (let i = 0; i < bytes.length; i++) {
+                const byte = bytes.charCodeAt(i);
+                value += (byte & 0x7f) * scale;
+                if (byte & 0x80) {
+                    scale *= 128;
+                } else {
+                    line += value;
+                    list[count++] = line;
+                    value = 0;
+                    scale = 1;
+                }
+            }
+            return list.subarray(0, count);
+        }
+
+        function intersect(a, b) {
+            const result = new Uint32Array(Math.min(a.length, b.length));
+            let i = 0, j = 0, count = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] < b[j]) {
+                    i++;
+                } else if (a[i] > b[j]) {
+                    j++;
+                } else {
+                    result[count++] = a[i];
+                    i++;
+                    j++;
+                }
+            }
+            return result.subarray(0, count);
+        }
+
+        function layout() {
+            visibleLinesSpan.textContent = visibleCount;
+            logSpacer.style.height =
+                Math.min(visibleCount * ROW_HEIGHT, MAX_SPACER) + 'px';
+
+            let noResultsMsg = document.getElementById('noResults');
+            if (visibleCount === 0) {
+                if (!noResultsMsg) {
+                    noResultsMsg = document.createElement('div');
+                    noResultsMsg.id = 'noResults';
+                    noResultsMsg.className = 'no-results';
+                    noResultsMsg.textContent = 'No matching logs found';
+                    logContainer.appendChild(noResultsMsg);
+                }
+            } else if (noResultsMsg) {
+                noResultsMsg.remove();
+            }
+
+            render();
+        }
+
+        function scheduleRender() {
+            if (!renderPending) {
+                renderPending = true;
+                requestAnimationFrame(render);
+            }
+        }
+
+        function render() {
+            renderPending = false;
+            const viewRows = Math.ceil(logContainer.clientHeight / ROW_HEIGHT);
+            const exact = visibleCount * ROW_HEIGHT <= MAX_SPACER;
+            let first;
+            if (exact) {
+                first = Math.floor(logContainer.scrollTop / ROW_HEIGHT);
+            } else {
+                const scrollable = MAX_SPACER - logContainer.clientHeight;
+                const lastFirst = Math.max(visibleCount - viewRows, 0);
+                first = Math.floor(logContainer.scrollTop / scrollable * lastFirst);
+            }
+            const start = Math.max(first - OVERSCAN, 0);
+            const end = Math.min(first + viewRows + OVERSCAN, visibleCount);
+            const top = exact
+                ? start * ROW_HEIGHT
+                : logContainer.scrollTop - (first - start) * ROW_HEIGHT;
+            logWindow.style.transform = `translateY(${top}px)`;
+
+            while (logWindow.childElementCount < end - start) {
+                logWindow.appendChild(document.createElement('div'));
+            }
+            while (logWindow.childElementCount > Math.max(end - start, 0)) {
+                logWindow.lastChild.remove();
+            }
+            for (let k = 0; k < end - start; k++) {
+                const index = visible[start + k];
+                const row = logWindow.children[k];
+                row.className = 'log-line log-' + LEVELS[levels[index]] +
+                    (highlight ? ' highlight' : '');
+                row.dataset.index = index;
+                if (highlight) {
+                    row.innerHTML = markMatches(lines[index]);
+                } else {
+                    row.textContent = lines[index];
+                }
+            }
+        }
+
+        function markMatches(text) {
+            // split() with a capturing group puts the matches at odd indices.
+            return text.split(highlight).map((part, i) =>
+                i % 2 ? '<mark>' + escapeHtml(part) + '</mark>' : escapeHtml(part)
+            ).join('');
+        }
+
+        function clearSearch() {
+            searchInput.value = '';
+            applyFilters();
+        }
+
+        function escapeRegex(string) {
+            return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+        }
+
+        function escapeHtml(string) {
+            return string.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+        }
+
+        // Allow copying log lines
+        logWindow.addEventListener('dblclick', function(e) {
+            const row = e.target.closest('.log-line');
+            if (!row) return;
+            navigator.clipboard.writeText(lines[row.dataset.index]).then(() => {
+                // Visual feedback
+                const originalBg = row.style.background;
+                row.style.background = 'rgba(125, 211, 252, 0.3)';
+                setTimeout(() => {
+                    row.style.background = originalBg;
+                }, 300);
+            });
+        });
+
+        // Pages of a paged log are opened from its index with the index's
+        // search and level filter as #q=...&filter=...
+        const hashParams = new URLSearchParams(location.hash.slice(1));
+        searchInput.value = hashParams.get('q') || '';
+        if (hashParams.has('filter')) {
+            setFilter(hashParams.get('filter'));
+        } else if (searchInput.value) {
+            applyFilters();
+        } else {
+            layout();
+        }
+    </script>
+</body>
+</html>
+"""
+
+
+# The index page of a paged log keeps the same header, search box and level
+# buttons; they pick the pages to list instead of lines.
+_INDEX_STYLE = """
+        .page-table {{
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 13px;
+        }}
+
+        .page-table th, .page-table td {{
+            padding: 8px 12px;
+            text-align: right;
+            border-bottom: 1px solid rgba(255, 255, 255, 0.08);
+        }}
+
+        .page-table th:first-child, .page-table td:first-child {{
+            text-align: left;
+        }}
+
+        .page-table th {{
+            color: #a0a0b0;
+            font-weight: 500;
+            text-transform: capitalize;
+        }}
+
+        .page-table tr.hidden {{
+            display: none;
+        }}
+
+        .page-table .log-info {{ color: #e0e0e0; }}
+    </style>"""
+
+_INDEX_HEAD = (
+    _VIRTUAL_HEAD.replace("\n    </style>", _INDEX_STYLE, 1)
+    .replace("Filter Logs:", "Search Pages:")
+    .replace(
+        'Visible Lines: <strong id="visibleLines">',
+        'Matching Pages: <strong id="visiblePages">',
+    )
+)
+
+# Not a format string; {level_names} and {manifest} are substituted by
+# _write_index_page.
+_INDEX_BODY = r"""        <div class="log-container">
+            <table class="page-table">
+                <thead><tr id="pageHeader"><th>Page</th><th>Lines</th></tr></thead>
+                <tbody id="pageRows"></tbody>
+            </table>
+        </div>
+    </div>
+
+    <script id="pageManifest" type="application/json">{manifest}</script>
+    <script>
+        const LEVELS = {level_names};
+        // Per page: its file, first line, line count, a count per level and
+        // a Bloom filter of its trigrams (see cerebrus.tools.log_search_index).
+        const manifest = JSON.parse(document.getElementById('pageManifest').textContent);
+        const searchInput = document.getElementById('searchInput');
+        const visiblePagesSpan = document.getElementById('visiblePages');
+        const pageHeader = document.getElementById('pageHeader');
+        const pageRows = document.getElementById('pageRows');
+        const filterBtns = document.querySelectorAll('.filter-btn');
+        const blooms = manifest.pages.map(page => decodeBase64(page.bloom.data));
+        const links = [];
+
+        let currentFilter = 'all';
+        let searchTimeout;
+
+        document.getElementById('totalLines').textContent = manifest.lines;
+
+        LEVELS.forEach(level => {
+            const th = document.createElement('th');
+            th.className = 'log-' + level;
+            th.textContent = level;
+            pageHeader.appendChild(th);
+        });
+        const rows = manifest.pages.map((page, i) => {
+            const row = document.createElement('tr');
+            appendCell(row, pageLink(page.href, 'Page ' + (i + 1), null));
+            const last = page.first + page.lines - 1;
+            appendCell(row, document.createTextNode(page.first + '–' + last));
+            page.counts.forEach((count, level) => {
+                const cell = appendCell(row, count
+                    ? pageLink(page.href, count, LEVELS[level])
+                    : document.createTextNode('0'));
+                cell.className = 'log-' + LEVELS[level];
+            });
+            pageRows.appendChild(row);
+            return row;
+        });
+
+        searchInput.addEventListener('input', function(e) {
+            clearTimeout(searchTimeout);
+            searchTimeout = setTimeout(() => {
+                applyFilters();
+            }, 150);
+        });
+
+        function appendCell(row, content) {
+            const cell = document.createElement('td');
+            cell.appendChild(content);
+            row.appendChild(cell);
+            return cell;
+        }
+
+        // A link to a page; with a level it opens the page filtered to it.
+        function pageLink(href, text, level) {
+            const link = document.createElement('a');
+            link.textContent = text;
+            link.dataset.href = href;
+            if (level) link.dataset.level = level;
+            links.push(link);
+            return link;
+        }
+
+        function setFilter(filterType) {
+            currentFilter = filterType;
+
+            filterBtns.forEach(btn => {
+                if (btn.getAttribute('data-filter') === filterType) {
+                    btn.classList.add('active');
+                } else {
+                    btn.classList.remove('active');
+                }
+            });
+
+            applyFilters();
+        }
+
+        function applyFilters() {
+            const term = searchInput.value.trim();
+            const grams = trigrams(term.toLowerCase());
+            const level = currentFilter === 'all' ? -1 : LEVELS.indexOf(currentFilter);
+
+            let count = 0;
+            manifest.pages.forEach((page, i) => {
+                const show = (level < 0 || page.counts[level] > 0) &&
+                    grams.every(gram => mightContain(page.bloom, blooms[i], gram));
+                rows[i].classList.toggle('hidden', !show);
+                if (show) count++;
+            });
+            visiblePagesSpan.textContent = count;
+
+            // Carry the search and filter over to the page that is opened.
+            links.forEach(link => {
+                const params = new URLSearchParams();
+                if (term) params.set('q', term);
+                const filter = link.dataset.level ||
+                    (currentFilter === 'all' ? '' : currentFilter);
+                if (filter) params.set('filter', filter);
+                const hash = params.toString();
+                link.setAttribute('href', link.dataset.href + (hash ? '#' + hash : ''));
+            });
+        }
+
+        function clearSearch() {
+            searchInput.value = '';
+            applyFilters();
+        }
+
+        function trigrams(term) {
+            const chars = Array.from(term);  // code points, as in Python
+            const grams = new Set();
+            for (let i = 0; i + manifest.gram <= chars.length; i++) {
+                grams.add(chars.slice(i, i + manifest.gram).join(''));
+            }
+            return Array.from(grams);
+        }
+
+        function mightContain(bloom, bytes, gram) {
+            const h1 = fnv1a(gram, 0x811c9dc5);
+            const h2 = fnv1a(gram, 0x050c5d1f) | 1;
+            for (let i = 0; i < bloom.hashes; i++) {
+                const bit = ((h1 + Math.imul(i, h2)) >>> 0) % bloom.bits;
+                if (!(bytes[bit >> 3] & (1 << (bit & 7)))) return false;
+            }
+            return true;
+        }
+
+        function fnv1a(text, hash) {
+            for (const char of text) {
+                hash = Math.imul(hash ^ char.codePointAt(0), 0x01000193);
+            }
+            return hash >>> 0;
+        }
+
+        function decodeBase64(encoded) {
+            const text = atob(encoded);
+            const bytes = new Uint8Array(text.length);
+            for (let i = 0; i < text.length; i++) {
+                bytes[i] = text.charCodeAt(i);
+            }
+            return bytes;
+        }
+
+        applyFilters();
+    </script>
+</body>
+</html>
+"""
+
+# Highlight categories kept by the on-device log filter.
+DEVICE_FILTER_LEVELS = ("ERROR", "WARNING", "LOGTEMP")
+
+
+def device_filter_patterns(
+    levels: Sequence[str] = DEVICE_FILTER_LEVELS,
+) -> List[str]:
+    """POSIX ERE versions of the ``LOG_PATTERNS`` for ``levels``.
+
+    Android's ``grep -E`` lacks ``\\b`` and ``(?:``, so word boundaries are
+    dropped and groups made capturing. The result matches a superset of the
+    original lines, which is what a pre-filter needs.
+    """
+    return [
+        LOG_PATTERNS[level][0].replace("(?:", "(").replace(r"\b", "")
+        for level in levels
+    ]
+
+
+# Every LOG_PATTERNS match starts with one of these characters. Checking them
+# first lets the classifier skip most positions cheaply; keep it in sync.
+_LEVEL_START_CHARS = "EWCScL.I"
+
+# One zero-width alternation with a named group per level, in priority order.
+# At each position the first matching level wins, and detect_log_level keeps
+# the best level over all positions, i.e. the first pattern that matches
+# anywhere in the line.
+_LEVEL_SCANNER = re.compile(
+    f"(?=[{re.escape(_LEVEL_START_CHARS)}])(?="
+    + "|".join(
+        f"(?P<{level}>{pattern})" for level, (pattern, _) in LOG_PATTERNS.items()
+    )
+    + ")"
+)
+_LEVEL_NAMES = [level.lower() for level in LOG_PATTERNS]
+_LEVEL_RANKS = {level: rank for rank, level in enumerate(LOG_PATTERNS)}
+
 
 def detect_log_level(line: str) -> str:
     """Detect the log level of a line based on patterns."""
-    # Check in priority order
-    for level, (pattern, _) in LOG_PATTERNS.items():
-        if re.search(pattern, line):
-            return level.lower()
-    return "info"
+    # Single scan; ERROR (rank 0) cannot be beaten, so stop there.
+    best = len(_LEVEL_NAMES)
+    for match in _LEVEL_SCANNER.finditer(line):
+        rank = _LEVEL_RANKS[str(match.lastgroup)]
+        if rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return _LEVEL_NAMES[best] if best < len(_LEVEL_NAMES) else "info"
+
+
+# Output is written through a buffer of this size, a batch of lines at a time.
+_WRITE_BUFFER = 1024 * 1024
+_BATCH_LINES = 1024
+# Lines per page of a paged log, see convert_log_to_pages.
+DEFAULT_PAGE_LINES = 100_000
+# Logs at least this big get the virtual viewer unless a mode is requested;
+# one DOM node per line stops being usable around this size.
+VIRTUAL_VIEWER_MIN_BYTES = 8 * 1024 * 1024
+# Logs at least this big are split into byte ranges of about _RANGE_BYTES
+# that worker processes classify and escape in parallel.
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+_RANGE_BYTES = 8 * 1024 * 1024
+_LEVEL_CODES = {name: code for code, name in enumerate(_LEVEL_NAMES)}
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class _Fragment:
+    """Rendered output for a run of consecutive log lines."""
+
+    text: str  # <div> rows, or comma-separated JSON strings for the virtual page
+    lines: int
+    levels: bytes = b""  # virtual page only: one level digit per line
+    index: TrigramIndex | None = None
+
+
+def render_log_line(line: str) -> str:
+    """The HTML ``<div>`` for one log line, classified and escaped."""
+    log_level = detect_log_level(line)
+    return f'            <div class="log-line log-{log_level}">{escape(line)}</div>'
+
+
+def _template_parts(title: str) -> Tuple[str, str]:
+    """``HTML_TEMPLATE`` split around the log lines: ``(head, tail)``."""
+    head, tail = HTML_TEMPLATE.split("{log_lines}")
+    return head.format(title=title), tail.format().lstrip("\n")
+
+
+def _virtual_template_parts(title: str, nav: str = "") -> List[str]:
+    """The virtual page split around the lines, levels and search index.
+
+    ``nav`` is HTML placed between the stats and the lines.
+    """
+    body = _VIRTUAL_BODY.replace("{level_names}", json.dumps(_LEVEL_NAMES))
+    parts = re.split(r"\{log_(?:data|levels|index)\}", body)
+    parts[0] = _VIRTUAL_HEAD.format(title=title) + nav + parts[0]
+    return parts
+
+
+def _log_lines(src: Iterable[str]) -> Iterator[str]:
+    for line in src:
+        line = line.rstrip("\n\r")
+        if line.strip():
+            yield line
+
+
+def _render_lines(lines: Iterable[str], virtual: bool, search_index: bool) -> _Fragment:
+    if not virtual:
+        rows = [render_log_line(line) + "\n" for line in lines]
+        return _Fragment("".join(rows), len(rows))
+    items = []
+    levels = bytearray()
+    index = TrigramIndex() if search_index else None
+    for line in lines:
+        # "<" is escaped so no line can close the <script> holding the data.
+        items.append(json.dumps(line, ensure_ascii=False).replace("<", "\\u003c"))
+        levels.append(48 + _LEVEL_CODES[detect_log_level(line)])
+        if index is not None:
+            index.add(line)
+    return _Fragment(",".join(items), len(items), bytes(levels), index)
+
+
+def _serial_fragments(
+    src: Iterable[str], virtual: bool, search_index: bool
+) -> Iterator[_Fragment]:
+    lines = _log_lines(src)
+    while True:
+        batch = list(islice(lines, _BATCH_LINES))
+        if not batch:
+            return
+        yield _render_lines(batch, virtual, search_index)
+
+
+def _byte_ranges(path: Path, size: int, range_bytes: int) -> List[Tuple[int, int]]:
+    """Split ``path`` into ``(start, end)`` ranges that end after a newline."""
+    ranges = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + range_bytes
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            end = min(end, size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
 
+def _render_range(
+    path: str, start: int, end: int, virtual: bool, search_index: bool
+) -> _Fragment:
+    """Worker process entry point: render the lines in ``[start, end)``."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # Same newline and decoding rules as reading the file in text mode.
+    src = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace")
+    return _render_lines(_log_lines(src), virtual, search_index)
 
-def convert_log_to_html(input_file: Path, output_file: Path) -> None:
-    """Convert a text log file to HTML with colored formatting."""
+
+def _ordered_map(
+    fn: Callable[..., _T], jobs: Iterable[tuple], workers: int, in_flight: int
+) -> Iterator[_T]:
+    """``fn(*job)`` for each job in worker processes, yielded in job order.
+
+    At most ``in_flight`` jobs are submitted ahead of the one being
+    yielded, so memory stays bounded however many jobs there are.
+    """
+    executor = ProcessPoolExecutor(max_workers=workers)
     try:
-        # Read the log file
-        with open(input_file, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-
-        # Generate HTML for each log line
-        log_html_lines = []
-        for i, line in enumerate(lines, 1):
-            line = line.rstrip("\n\r")
-            if not line.strip():
-                continue
-
-            # Escape HTML characters
-            escaped_line = escape(line)
-
-            # Detect log level
-            log_level = detect_log_level(line)
-
-            # Create HTML log line
-            log_html = f'            <div class="log-line log-{log_level}">{escaped_line}</div>'
-            log_html_lines.append(log_html)
-
-        # Generate the complete HTML
-        html_content = HTML_TEMPLATE.format(
-            title=f"Log Viewer - {input_file.name}",
-            total_lines=len(log_html_lines),
-            log_lines="\n".join(log_html_lines),
-        )
+        pending: Deque[Future[_T]] = deque()
+        for job in jobs:
+            pending.append(executor.submit(fn, *job))
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _parallel_fragments(
+    path: Path, size: int, virtual: bool, search_index: bool, workers: int
+) -> Iterator[_Fragment]:
+    jobs = (
+        (str(path), start, end, virtual, search_index)
+        for start, end in _byte_ranges(path, size, _RANGE_BYTES)
+    )
+    return _ordered_map(_render_range, jobs, workers, workers * 2)
+
+
+def _write_dom_page(fragments: Iterable[_Fragment], out: TextIO, title: str) -> int:
+    head, tail = _template_parts(title)
+    total_lines = 0
+    out.write(head)
+    for fragment in fragments:
+        out.write(fragment.text)
+        total_lines += fragment.lines
+    out.write(tail)
+    return total_lines
+
+
+def _write_virtual_page(
+    fragments: Iterable[_Fragment],
+    out: TextIO,
+    title: str,
+    search_index: bool,
+    nav: str = "",
+) -> int:
+    head, after_data, after_levels, tail = _virtual_template_parts(title, nav)
+    # One digit per line, kept until the lines are written.
+    levels = bytearray()
+    index = TrigramIndex() if search_index else None
+    out.write(head)
+    out.write("[")
+    for fragment in fragments:
+        if not fragment.lines:
+            continue
+        if levels:
+            out.write(",")
+        out.write(fragment.text)
+        levels += fragment.levels
+        if index is not None and fragment.index is not None:
+            index.extend(fragment.index)
+    out.write("]")
+    out.write(after_data)
+    out.write(levels.decode("ascii"))
+    out.write(after_levels)
+    if index is not None:
+        index.write_json(out)
+    else:
+        out.write("null")
+    out.write(tail)
+    return len(levels)
+
+
+def _write_fragments(
+    fragments: Iterable[_Fragment],
+    out: TextIO,
+    title: str,
+    virtual: bool,
+    search_index: bool,
+) -> int:
+    if virtual:
+        return _write_virtual_page(fragments, out, title, search_index)
+    return _write_dom_page(fragments, out, title)
+
+
+def convert_log_to_html(
+    input_file: Path,
+    output_file: Path,
+    virtual: bool | None = None,
+    search_index: bool = False,
+    workers: int | None = None,
+) -> None:
+    """Convert a text log file to HTML with colored formatting.
+
+    The log is streamed: lines are classified and written in small batches
+    as they are read, so memory use does not grow with the size of the
+    log. With ``virtual`` the page embeds the lines as data and only
+    renders the rows in view, which keeps multi-million-line logs
+    responsive. By default it is used for logs of
+    ``VIRTUAL_VIEWER_MIN_BYTES`` and up.
 
-        # Write the HTML file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+    ``search_index`` embeds a :class:`TrigramIndex` of the lines, so the
+    page's search intersects posting lists instead of scanning every line.
+    It implies the virtual viewer. The index is held in memory while the
+    log is converted and typically adds about as much as the log's size.
+
+    With ``workers`` above one, the log is split at line boundaries into
+    byte ranges that are rendered by that many worker processes and
+    written back in order. By default every core is used for logs of
+    ``PARALLEL_MIN_BYTES`` and up.
+    """
+    title = f"Log Viewer - {input_file.name}"
+    try:
+        size = input_file.stat().st_size
+        if search_index:
+            virtual = True
+        elif virtual is None:
+            virtual = size >= VIRTUAL_VIEWER_MIN_BYTES
+        if workers is None:
+            workers = (os.cpu_count() or 1) if size >= PARALLEL_MIN_BYTES else 1
+
+        with open(output_file, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as out:
+            try:
+                if workers > 1:
+                    total_lines = _write_fragments(
+                        _parallel_fragments(
+                            input_file, size, virtual, search_index, workers
+                        ),
+                        out,
+                        title,
+                        virtual,
+                        search_index,
+                    )
+                else:
+                    with open(
+                        input_file, "r", encoding="utf-8", errors="replace"
+                    ) as src:
+                        total_lines = _write_fragments(
+                            _serial_fragments(src, virtual, search_index),
+                            out,
+                            title,
+                            virtual,
+                            search_index,
+                        )
+            except BaseException:
+                # Don't leave a truncated page behind.
+                out.close()
+                output_file.unlink(missing_ok=True)
+                raise
 
         print(f"✓ Successfully converted {input_file.name} to {output_file.name}")
-        print(f"  - Total lines: {len(log_html_lines)}")
+        print(f"  - Total lines: {total_lines}")
 
     except Exception as e:
         print(f"✗ Error converting {input_file.name}: {e}")
         raise
 
 
+@dataclass
+class _Page:
+    """One rendered page of a paged log and its summary for the index."""
+
+    fragment: _Fragment
+    counts: List[int]  # lines per level, in _LEVEL_NAMES order
+    bloom: TrigramBloom
+    last: bool
+
+
+@dataclass
+class _PageEntry:
+    """What the index page knows about one page of a paged log."""
+
+    href: str
+    first: int  # number of the page's first line, from 1
+    lines: int
+    counts: List[int]  # lines per level, in _LEVEL_NAMES order
+    bloom: TrigramBloom
+
+
+@dataclass
+class _PagedManifest:
+    """The page list embedded in the index page of a paged log."""
+
+    lines: int = 0
+    pages: List[_PageEntry] = field(default_factory=list)
+
+    def to_json(self) -> Dict[str, object]:
+        """The shape the index page script reads."""
+        pages = [
+            {
+                "href": page.href,
+                "first": page.first,
+                "lines": page.lines,
+                "counts": page.counts,
+                "bloom": page.bloom.to_json(),
+            }
+            for page in self.pages
+        ]
+        return {"gram": GRAM, "lines": self.lines, "pages": pages}
+
+
+def _split_pages(lines: Iterator[str], page_lines: int) -> Iterator[Tuple[list, bool]]:
+    """``(lines, is_last_page)`` for each page of ``page_lines`` lines."""
+    page = list(islice(lines, page_lines))
+    while page:
+        following = next(lines, None)
+        yield page, following is None
+        if following is None:
+            return
+        page = [following] + list(islice(lines, page_lines - 1))
+
+
+def _render_page(lines: List[str], search_index: bool, last: bool) -> _Page:
+    """Worker process entry point: render one page of a paged log."""
+    fragment = _render_lines(lines, True, search_index)
+    counts = [0] * len(_LEVEL_NAMES)
+    for code in fragment.levels:
+        counts[code - 48] += 1
+    grams: Set[str] = set()
+    for line in lines:
+        grams.update(trigrams(line))
+    return _Page(fragment, counts, TrigramBloom(grams), last)
+
+
+def _page_name(number: int) -> str:
+    return f"page-{number:04d}.html"
+
+
+def _page_nav(index_name: str, number: int, first: int, page: _Page) -> str:
+    """Links from page ``number`` to the index and its neighbours."""
+    links = [f'<a href="../{quote(index_name)}">Index</a>']
+    if number > 1:
+        links.append(f'<a href="{_page_name(number - 1)}">&larr; Page {number - 1}</a>')
+    last_line = first + page.fragment.lines - 1
+    links.append(f"<span>Page {number}, lines {first}&ndash;{last_line}</span>")
+    if not page.last:
+        links.append(f'<a href="{_page_name(number + 1)}">Page {number + 1} &rarr;</a>')
+    return '        <nav class="page-nav">' + "".join(links) + "</nav>\n\n"
+
+
+def _write_index_page(output_file: Path, title: str, manifest: _PagedManifest) -> None:
+    # "<" is escaped so the manifest cannot close its <script> element.
+    body = _INDEX_BODY.replace("{level_names}", json.dumps(_LEVEL_NAMES)).replace(
+        "{manifest}", json.dumps(manifest.to_json()).replace("<", "\\u003c")
+    )
+    with open(output_file, "w", encoding="utf-8") as out:
+        out.write(_INDEX_HEAD.format(title=title))
+        out.write(body)
+
+
+def convert_log_to_pages(
+    input_file: Path,
+    output_file: Path,
+    page_lines: int = DEFAULT_PAGE_LINES,
+    search_index: bool = False,
+    workers: int | None = None,
+) -> None:
+    """Convert a text log to pages of ``page_lines`` lines and an index page.
+
+    The pages are virtual viewer pages, written to a ``<stem>_pages``
+    folder next to ``output_file``, which becomes the index. The index
+    lists each page with its line range and a count per log level, linking
+    to the page and to the page filtered to a level. Its search narrows the
+    list to the pages that may contain the term, using a Bloom filter of
+    each page's trigrams, and opens pages with the search applied.
+
+    ``search_index`` embeds a :class:`TrigramIndex` in every page. With
+    ``workers`` above one, pages are rendered by that many worker
+    processes; by default every core is used for logs of
+    ``PARALLEL_MIN_BYTES`` and up.
+    """
+    if page_lines < 1:
+        raise ValueError("page_lines must be at least 1")
+    name = input_file.name
+    pages_dir = output_file.with_name(output_file.stem + "_pages")
+    written: List[Path] = []
+    try:
+        if workers is None:
+            size = input_file.stat().st_size
+            workers = (os.cpu_count() or 1) if size >= PARALLEL_MIN_BYTES else 1
+        pages_dir.mkdir(parents=True, exist_ok=True)
+        manifest = _PagedManifest()
+
+        with open(input_file, "r", encoding="utf-8", errors="replace") as src:
+            jobs = (
+                (lines, search_index, last)
+                for lines, last in _split_pages(_log_lines(src), page_lines)
+            )
+            if workers > 1:
+                # Pages are large, so only one waits per worker.
+                rendered = _ordered_map(_render_page, jobs, workers, workers + 1)
+            else:
+                rendered = (_render_page(*job) for job in jobs)
+            for number, page in enumerate(rendered, 1):
+                first = manifest.lines + 1
+                path = pages_dir / _page_name(number)
+                written.append(path)
+                with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as out:
+                    _write_virtual_page(
+                        [page.fragment],
+                        out,
+                        f"Log Viewer - {name} - Page {number}",
+                        search_index,
+                        _page_nav(output_file.name, number, first, page),
+                    )
+                manifest.lines += page.fragment.lines
+                manifest.pages.append(
+                    _PageEntry(
+                        f"{quote(pages_dir.name)}/{path.name}",
+                        first,
+                        page.fragment.lines,
+                        page.counts,
+                        page.bloom,
+                    )
+                )
+
+        _write_index_page(output_file, f"Log Viewer - {name}", manifest)
+        # Pages left over from an earlier, longer conversion.
+        for stale in pages_dir.glob("page-*.html"):
+            if stale not in written:
+                stale.unlink()
+
+        print(f"✓ Successfully converted {name} to {output_file.name}")
+        print(f"  - Total lines: {manifest.lines}")
+        print(f"  - Pages: {len(written)} in {pages_dir.name}")
+
+    except Exception as e:
+        # Don't leave a partial set of pages behind.
+        for path in written:
+            path.unlink(missing_ok=True)
+        print(f"✗ Error converting {name}: {e}")
+        raise
+
+
 def main():
     """Main entry point for the log converter."""
     parser = argparse.ArgumentParser(
@@ -441,6 +1472,24 @@ def main():
     parser.add_argument(
         "-o", "--output", type=str, required=True, help="Output HTML file path"
     )
+    parser.add_argument(
+        "--viewer",
+        choices=("auto", "dom", "virtual"),
+        default="auto",
+        help="Page type; 'auto' picks 'virtual' for large logs",
+    )
+    parser.add_argument(
+        "--search-index",
+        action="store_true",
+        help="Embed a trigram search index (implies --viewer virtual)",
+    )
+    parser.add_argument(
+        "--page-lines",
+        type=int,
+        metavar="N",
+        help="Write pages of N lines to <output stem>_pages and make the "
+        "output an index page",
+    )
 
     args = parser.parse_args()
 
@@ -455,7 +1504,20 @@ def main():
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Convert the log file
-    convert_log_to_html(input_file, output_file)
+    if args.page_lines is not None:
+        if args.page_lines < 1:
+            parser.error("--page-lines must be at least 1")
+        convert_log_to_pages(
+            input_file,
+            output_file,
+            page_lines=args.page_lines,
+            search_index=args.search_index,
+        )
+        return 0
+    virtual = None if args.viewer == "auto" else args.viewer == "virtual"
+    convert_log_to_html(
+        input_file, output_file, virtual=virtual, search_index=args.search_index
+    )
 
     return 0
 
@@ -0,0 +1,318 @@
+"""Live ``adb logcat`` capture with a bounded buffer and rotating files."""
+
+from __future__ import annotations
+
+import gzip
+import re
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Deque, List, Sequence, Set, cast
+
+from cerebrus.tools.adb import AdbClient, AdbError, kill_process_tree
+
+DEFAULT_BUFFER_LINES = 5000
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+DEFAULT_PID_REFRESH = 5.0
+# Compressed segments are flushed this often so a crash loses little.
+_FLUSH_INTERVAL = 2.0
+
+# "01-31 12:34:56.789  1234  5678 I Tag     : message"
+_THREADTIME = re.compile(
+    r"^(\d\d-\d\d \d\d:\d\d:\d\d\.\d{3})\s+(\d+)\s+(\d+)\s+([VDIWEFS])\s+"
+    r"(.*?)\s*: (.*)$"
+)
+# ActivityManager announces new processes as "Start proc 1234:com.foo/u0a56".
+_START_PROC = re.compile(r"Start proc (\d+):([^/\s]+)")
+
+
+@dataclass(frozen=True)
+class LogcatLine:
+    """One ``logcat -v threadtime`` line."""
+
+    timestamp: str
+    pid: int
+    tid: int
+    level: str
+    tag: str
+    message: str
+
+
+def parse_threadtime(line: str) -> LogcatLine | None:
+    """Parse a ``threadtime`` line, or return ``None`` for anything else."""
+
+    match = _THREADTIME.match(line)
+    if match is None:
+        return None
+    timestamp, pid, tid, level, tag, message = match.groups()
+    return LogcatLine(timestamp, int(pid), int(tid), level, tag, message)
+
+
+class LogcatStreamer:
+    """Follow ``adb logcat -v threadtime`` for one device in a background thread.
+
+    With ``package_name`` or ``tags`` set, only lines from the package's
+    processes or with one of the tags are kept. The package's PIDs are
+    refreshed every ``pid_refresh`` seconds and picked up at once from
+    ActivityManager's "Start proc" lines, so app restarts are followed.
+
+    Kept lines go to a ring buffer of ``buffer_lines`` entries (see
+    :meth:`lines`) and to gzip segments in ``output_dir``, rotated every
+    ``segment_bytes`` of uncompressed text. With ``max_segments`` set, the
+    oldest segments are deleted. When the stream drops, e.g. because the
+    cable was pulled, it is reopened with backoff from the last timestamp
+    seen.
+    """
+
+    def __init__(
+        self,
+        adb_client: AdbClient,
+        serial: str,
+        output_dir: Path,
+        package_name: str = "",
+        tags: Sequence[str] = (),
+        buffer_lines: int = DEFAULT_BUFFER_LINES,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        max_segments: int | None = None,
+        pid_refresh: float = DEFAULT_PID_REFRESH,
+        min_backoff: float = 1.0,
+        max_backoff: float = 10.0,
+    ) -> None:
+        self.serial = serial
+        self._client = adb_client
+        self._package_name = package_name
+        self._tags = frozenset(tags)
+        self._pid_refresh = pid_refresh
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+        self._buffer: Deque[str] = deque(maxlen=buffer_lines)
+        self._buffer_lock = threading.Lock()
+        safe_serial = re.sub(r"[^\w.-]", "_", serial)
+        self._writer = _SegmentWriter(
+            output_dir,
+            f"logcat_{safe_serial}_{time.strftime('%Y%m%d-%H%M%S')}",
+            segment_bytes,
+            max_segments,
+        )
+        self._pids: Set[int] = set()
+        self._pids_checked = 0.0
+        # Resume point after a reconnect, and the lines already seen there.
+        self._last_stamp: str | None = None
+        self._last_stamp_lines: Set[str] = set()
+        self._process: subprocess.Popen[str] | None = None
+        self._process_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"logcat-{serial}", daemon=True
+        )
+        self.received = 0
+        self.kept = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def segments(self) -> List[Path]:
+        return self._writer.segments
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 2.0) -> None:
+        """Stop streaming and close the current segment.
+
+        A reader thread that outlives ``timeout`` keeps running until its
+        ``adb`` process exits, but its lines are no longer written.
+        """
+
+        self._stop.set()
+        self._kill_process()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        self._writer.close()
+
+    def lines(self, limit: int | None = None) -> List[str]:
+        """Buffered lines, oldest first; only the newest ``limit`` if given."""
+
+        with self._buffer_lock:
+            lines = list(self._buffer)
+        return lines[-limit:] if limit else lines
+
+    def handle_line(self, raw: str) -> None:
+        """Filter one raw line into the buffer and the current segment."""
+
+        self.received += 1
+        parsed = parse_threadtime(raw)
+        if parsed is not None:
+            if parsed.timestamp == self._last_stamp:
+                if raw in self._last_stamp_lines:
+                    return  # replayed after a reconnect
+                self._last_stamp_lines.add(raw)
+            else:
+                self._last_stamp = parsed.timestamp
+                self._last_stamp_lines = {raw}
+            self._learn_pid(parsed)
+        if not self._matches(parsed):
+            return
+
+        self.kept += 1
+        with self._buffer_lock:
+            self._buffer.append(raw)
+        self._writer.write(raw)
+
+    def _matches(self, line: LogcatLine | None) -> bool:
+        if not self._package_name and not self._tags:
+            return True
+        if line is None:
+            return False
+        if line.tag in self._tags:
+            return True
+        if not self._package_name:
+            return False
+        if time.monotonic() - self._pids_checked >= self._pid_refresh:
+            self._refresh_pids()
+        return line.pid in self._pids
+
+    def _learn_pid(self, line: LogcatLine) -> None:
+        if not self._package_name or line.tag != "ActivityManager":
+            return
+        match = _START_PROC.search(line.message)
+        if match is None:
+            return
+        process_name = match.group(2)
+        if process_name == self._package_name or process_name.startswith(
+            self._package_name + ":"
+        ):
+            self._pids.add(int(match.group(1)))
+
+    def _refresh_pids(self) -> None:
+        self._pids_checked = time.monotonic()
+        try:
+            self._pids = set(self._client.package_pids(self.serial, self._package_name))
+        except AdbError:
+            pass  # keep the last known PIDs; the device may be reconnecting
+
+    def _command(self) -> List[str]:
+        # ``adb shell`` passes arguments through unquoted, so quote them here.
+        since = self._last_stamp or "1"
+        return [
+            self._client.executable,
+            "-s",
+            self.serial,
+            "shell",
+            "logcat",
+            "-v",
+            "threadtime",
+            "-T",
+            shlex.quote(since),
+        ]
+
+    def _run(self) -> None:
+        backoff = self._min_backoff
+        while not self._stop.is_set():
+            if self._package_name:
+                self._refresh_pids()
+            try:
+                process = subprocess.Popen(
+                    self._command(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+            except OSError:
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+                continue
+
+            with self._process_lock:
+                self._process = process
+            if self._stop.is_set():
+                self._kill_process()
+            try:
+                for raw in cast(IO[str], process.stdout):
+                    backoff = self._min_backoff
+                    self.handle_line(raw.rstrip("\r\n"))
+            finally:
+                self._kill_process()
+                process.wait()
+                with self._process_lock:
+                    self._process = None
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, self._max_backoff)
+
+    def _kill_process(self) -> None:
+        with self._process_lock:
+            process = self._process
+        if process is not None and process.poll() is None:
+            kill_process_tree(process.pid)
+
+
+class _SegmentWriter:
+    """Write lines to ``<prefix>_NNNN.log.gz`` files of bounded size.
+
+    Once :meth:`close` has run, further lines are dropped, so no segment is
+    opened that nothing would close.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str,
+        segment_bytes: int,
+        max_segments: int | None,
+    ) -> None:
+        self._directory = directory
+        self._prefix = prefix
+        self._segment_bytes = segment_bytes
+        self._max_segments = max_segments
+        self._lock = threading.Lock()
+        self._handle: IO[str] | None = None
+        self._closed = False
+        self._size = 0
+        self._flushed = 0.0
+        self._index = 0
+        self.segments: List[Path] = []
+
+    def write(self, line: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if self._handle is None:
+                self._open()
+            handle = cast(IO[str], self._handle)
+            handle.write(line + "\n")
+            self._size += len(line) + 1
+            if self._size >= self._segment_bytes:
+                self._close()
+            elif time.monotonic() - self._flushed >= _FLUSH_INTERVAL:
+                handle.flush()
+                self._flushed = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._close()
+
+    def _open(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f"{self._prefix}_{self._index:04d}.log.gz"
+        self._index += 1
+        self._handle = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+        self._size = 0
+        self._flushed = time.monotonic()
+        self.segments.append(path)
+        if self._max_segments is not None:
+            while len(self.segments) > self._max_segments:
+                self.segments.pop(0).unlink(missing_ok=True)
+
+    def _close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
@@ -0,0 +1,176 @@
+"""Parse Unreal Engine logs into integer columns."""
+
+from __future__ import annotations
+
+import io
+import re
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Indexed by UE's ELogVerbosity value. Lines that are not in the UE format,
+# such as the log header or continuation lines, get code 0 ("").
+VERBOSITIES = (
+    "",
+    "Fatal",
+    "Error",
+    "Warning",
+    "Display",
+    "Log",
+    "Verbose",
+    "VeryVerbose",
+)
+VERBOSITY_CODES = {name: code for code, name in enumerate(VERBOSITIES) if name}
+# UE leaves the verbosity out of lines logged at Log verbosity.
+_DEFAULT_VERBOSITY = VERBOSITY_CODES["Log"]
+
+_VERBOSITY_PATTERN = "|".join(name for name in VERBOSITIES if name)
+# "[2024.05.14-10.22.31:512][  0]LogInit: Display: message"; both the
+# timestamp/frame prefix and the verbosity are optional. A leading "Word: "
+# is only taken as a category when the word starts with "Log", as UE's
+# category names do, or a verbosity follows it, so text such as "Error: ..."
+# or "Build: ..." on a continuation line stays in the message. Always matches.
+_LINE = re.compile(
+    r"(?:\[(\d{4})\.(\d\d)\.(\d\d)-(\d\d)\.(\d\d)\.(\d\d):(\d{3})\]\[\s*(\d+)\])?"
+    rf"(?:(Log\w+|[A-Za-z_]\w*(?=: (?:{_VERBOSITY_PATTERN}): )): "
+    rf"(?:({_VERBOSITY_PATTERN}): )?)?"
+)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass
+class UELog:
+    """The lines of a UE log as parallel columns, one row per line.
+
+    ``timestamps`` are milliseconds since the Unix epoch, read as UTC like
+    UE writes them; ``frames`` are the frame numbers UE prints, which wrap
+    at 1000. Both are -1 for lines without the ``[timestamp][frame]``
+    prefix. ``categories`` index ``category_names`` (-1 for none) and
+    ``verbosities`` hold ``VERBOSITIES`` codes. Row ``i``'s message is
+    ``messages[message_offsets[i]:message_offsets[i + 1]]``.
+    """
+
+    timestamps: array = field(default_factory=lambda: array("q"))
+    frames: array = field(default_factory=lambda: array("i"))
+    categories: array = field(default_factory=lambda: array("i"))
+    verbosities: array = field(default_factory=lambda: array("B"))
+    message_offsets: array = field(default_factory=lambda: array("Q", [0]))
+    messages: str = ""
+    category_names: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.verbosities)
+
+    def message(self, row: int) -> str:
+        offsets = self.message_offsets
+        return self.messages[offsets[row] : offsets[row + 1]]
+
+    def category(self, row: int) -> str | None:
+        category = self.categories[row]
+        return self.category_names[category] if category >= 0 else None
+
+    def category_id(self, name: str) -> int:
+        """The id of category ``name``, or -1 if no line has it."""
+
+        try:
+            return self.category_names.index(name)
+        except ValueError:
+            return -1
+
+    def select(
+        self,
+        categories: Iterable[str] | None = None,
+        frames: Tuple[int, int] | None = None,
+        max_verbosity: str | None = None,
+    ) -> List[int]:
+        """Rows matching every given condition, in order.
+
+        ``frames`` is an inclusive ``(first, last)`` range. ``max_verbosity``
+        keeps UE lines at least as severe as the named verbosity, e.g.
+        ``"Warning"`` keeps fatal errors, errors and warnings.
+        """
+
+        rows: Sequence[int] = range(len(self))
+        if categories is not None:
+            ids = {self.category_id(name) for name in categories} - {-1}
+            column = self.categories
+            rows = [row for row in rows if column[row] in ids]
+        if frames is not None:
+            first, last = frames
+            column = self.frames
+            rows = [row for row in rows if first <= column[row] <= last]
+        if max_verbosity is not None:
+            code = VERBOSITY_CODES[max_verbosity]
+            levels = self.verbosities
+            rows = [row for row in rows if 0 < levels[row] <= code]
+        return list(rows)
+
+    def category_counts(self) -> Dict[str, int]:
+        """Number of lines per category, most frequent first."""
+
+        counts = Counter(self.categories)
+        counts.pop(-1, None)
+        return {
+            self.category_names[category]: count
+            for category, count in counts.most_common()
+        }
+
+
+def parse_ue_log(lines: Iterable[str]) -> UELog:
+    """Split each line into its columns; trailing newlines are dropped."""
+
+    log = UELog()
+    timestamps, frames = log.timestamps, log.frames
+    categories, verbosities = log.categories, log.verbosities
+    offsets = log.message_offsets
+    category_ids: Dict[str, int] = {}
+    day_ordinals: Dict[Tuple[str, str, str], int] = {}
+    messages = io.StringIO()
+    offset = 0
+    for line in lines:
+        line = line.rstrip("\n\r")
+        match = _LINE.match(line)
+        if match is None:  # every part of _LINE is optional
+            raise ValueError(f"unparsable UE log line: {line!r}")
+        year, month, day, hour, minute, second, millis, frame, category, level = (
+            match.groups()
+        )
+        if year is None:
+            timestamps.append(-1)
+            frames.append(-1)
+        else:
+            days = day_ordinals.get((year, month, day))
+            if days is None:
+                days = date(int(year), int(month), int(day)).toordinal()
+                days = day_ordinals[(year, month, day)] = days - _EPOCH_ORDINAL
+            seconds = days * 86400 + int(hour) * 3600 + int(minute) * 60 + int(second)
+            timestamps.append(seconds * 1000 + int(millis))
+            frames.append(int(frame))
+        if category is None:
+            categories.append(-1)
+            verbosities.append(0)
+        else:
+            category_id = category_ids.get(category)
+            if category_id is None:
+                category_id = category_ids[category] = len(log.category_names)
+                log.category_names.append(category)
+            categories.append(category_id)
+            verbosities.append(
+                VERBOSITY_CODES[level] if level is not None else _DEFAULT_VERBOSITY
+            )
+        message = line[match.end() :]
+        messages.write(message)
+        offset += len(message)
+        offsets.append(offset)
+    log.messages = messages.getvalue()
+    return log
+
+
+def read_ue_log(path: Path) -> UELog:
+    """Parse the UE log at ``path``."""
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return parse_ue_log(f)
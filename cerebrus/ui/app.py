@@ -7,14 +7,18 @@ from pathlib import Path
 import dearpygui.dearpygui as dpg
 
 from cerebrus.ui import components
-from cerebrus.ui.state import UIState
+from cerebrus.ui.state import UIState, create_adb_client
 
 
 class CerebrusApp:
     """Build and run the Cerebrus UI described in the sketch."""
 
     def __init__(self, state: UIState | None = None) -> None:
-        self.state = state or UIState()
+        if state is None:
+            state = UIState()
+            state.adb_backend = state.profile_manager.get_adb_backend()
+            state.adb_client = create_adb_client(state.adb_backend)
+        self.state = state
         profile, path = self.state.profile_manager.load_last_profile()
         self.state.profile_nickname = profile.nickname or "None"
         self.state.package_name = profile.package_name
@@ -100,5 +104,14 @@ class CerebrusApp:
         )
         dpg.setup_dearpygui()
         dpg.show_viewport()
-        dpg.start_dearpygui()
+        watcher = components.start_device_watcher(self.state)
+        poller = components.start_liveness_poller(self.state)
+        while dpg.is_dearpygui_running():
+            components.process_ui_tasks(self.state)
+            dpg.render_dearpygui_frame()
+        watcher.stop()
+        poller.stop()
+        components.stop_logcat_streams(self.state)
+        components.close_console_queues(self.state)
+        self.state.adb_client.close()
         dpg.destroy_context()
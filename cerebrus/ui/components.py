@@ -2,24 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import queue
 import subprocess
 import sys
+import threading
 import webbrowser
+from concurrent.futures import Future
 from pathlib import Path
 from tkinter import Tk, filedialog
+from typing import Callable, Collection
 
 import dearpygui.dearpygui as dpg
 
 from cerebrus._version import __version__
-from cerebrus.core.devices import DeviceInfo, collect_device_info
-from cerebrus.tools.adb import AdbClient, AdbError
-from cerebrus.tools.log_to_html import convert_log_to_html
+from cerebrus.core.console import ConsoleCommandQueue, ConsoleCommandQueues
+from cerebrus.core.devices import (
+    DEVICE_STATUS_ONLINE,
+    DeviceInfo,
+    collect_device_info_async,
+    device_folder_names,
+)
+from cerebrus.core.hotplug import DeviceWatcher
+from cerebrus.core.liveness import PackageLiveness, PackageLivenessPoller
+from cerebrus.core.log_conversion import LogConversion, convert_logs, default_workers
+from cerebrus.core.profile import ADB_BACKEND_PROCESS, ADB_BACKEND_SERVER, ADB_BACKENDS
+from cerebrus.core.transfer import (
+    DeviceTransfer,
+    LogFilter,
+    SyncResult,
+    TransferProgress,
+    filter_device_logs,
+    sync_device_folder,
+    sync_devices,
+)
+from cerebrus.tools.adb import (
+    AdbCommandError,
+    AdbDeviceOfflineError,
+    AdbError,
+    AdbTimeoutError,
+)
+from cerebrus.tools.adb_metrics import LatencyStats
+from cerebrus.tools.adb_server import AdbServerClient
+from cerebrus.tools.log_to_html import DEFAULT_PAGE_LINES, device_filter_patterns
+from cerebrus.tools.logcat import LogcatStreamer
 from cerebrus.ui.state import UIState
 from cerebrus.ui.themes import get_theme_manager
 
 # Log colors are now handled by ThemeManager
 SELECTED_ROW_COLOR = (0, 119, 200, 153)  # Blue highlight with transparency
+TRANSFER_PROGRESS_INTERVAL = 0.25  # seconds between progress readout updates
+LOGCAT_VIEW_LINES = 500
+DEVICE_LOG_FILTER_CONTEXT = 3
 
 
 # Tooltip definitions
@@ -29,16 +64,23 @@ TOOLTIPS = {
     "input_path": "The folder path where files will be moved from the device. CSV and Logs subfolders will be created here.",
     "output_path": "The main workspace folder. Files moved from devices will be saved here, and generated reports will be output here.",
     "move_logs": "Moves log files from the selected device's Unreal Engine Saved/Logs folder to your PC.",
+    "incremental_sync": "Lists the device folder first and copies only files that are new or changed since the last move. A file is removed from the device only after its copy on the PC has been verified.",
+    "device_log_filter": "Move Logs copies only error, warning and LogTemp lines (with 3 lines of context) into <name>.filtered.log, filtering on the device. The full logs stay on the device.",
+    "compressed_transfer": "Streams files from the device as one compressed archive instead of copying them one at a time. Much faster for large logs and CSVs. Falls back to a normal copy when the device does not support it.",
     "move_csv": "Moves CSV profiling data from the selected device's Unreal Engine Saved/Profiling/CSV folder to your PC.",
     "generate_perf": "Generates performance reports from CSV files in the Output Path. Requires CSV files to be present.Source files are deleted after successful conversion.",
     "generate_logs": "Generates colored HTML logs from text logs in the Output Path. Requires log files to be present.Source files are deleted after successful conversion.",
+    "log_search_index": "Embeds a search index in each colored log so searching large logs is instant. Conversion takes longer and the HTML files are about twice as big.",
+    "log_paging": "Splits each colored log into pages of 100,000 lines, kept in a <name>_pages folder, plus an index page that lists them with their error and warning counts and finds the pages containing a search term. Use it for logs too large to open in one browser tab.",
     "generate_both": "Runs both Perf Report generation and Colored Logs conversion in sequence.",
     "view_html_logs": "Opens the Output Folder Path and allows you to select and view generated HTML log files in your default web browser.",
     "package_name": "The Android package identifier for your application (e.g., com.company.appname). Must start with 'com.' and have at least 3 parts.",
-    "device_table": "Lists all connected Android devices. Select a device to perform operations. Only devices with the package installed can be selected.",
+    "device_table": "Lists all connected Android devices. Select a device to perform operations. Only devices with the package installed can be selected. Tick the Bulk box of several devices to move their logs and CSVs in parallel, each into its own Make_Model folder.",
     "list_devices": "Scans for connected Android devices via ADB and checks if the specified package is installed on each device.",
     "start_profiling": "Starts profiling data on selected device if Package is running actively in foreground.",
     "stop_profiling": "Stops profiling data on selected device if Package is running actively in foreground.",
+    "console_commands": "UE console commands for the selected device, separated by ';' or new lines. They are sent in order, batched into as few adb calls as possible.",
+    "live_logcat": "Streams the selected device's logcat, filtered to the package's processes, into rotating .log.gz files in the output Logs folder while the session runs.",
     "generate_actions": "Executes all selected bulk actions (Move Logs, Move Profiling Data, Generate Reports) in sequence.",
 }
 
@@ -49,6 +91,20 @@ def _handle_theme_change(state: UIState, palette: str = None, mode: str = None)
     _render_log_entries(state)  # Re-render logs to apply new colors
 
 
+def _handle_adb_backend_change(state: UIState, backend: str) -> None:
+    for option in ADB_BACKENDS:
+        dpg.set_value(f"adb_backend_{option}", option == backend)
+    state.profile_manager.set_adb_backend(backend)
+    if backend == state.adb_backend:
+        log_message(state, "INFO", f"ADB backend '{backend}' is in use.")
+    else:
+        log_message(
+            state,
+            "INFO",
+            f"ADB backend set to '{backend}'. Restart Cerebrus to apply it.",
+        )
+
+
 def build_menu_bar(state: UIState) -> None:
     """Render the top menu bar."""
     with dpg.menu_bar():
@@ -64,6 +120,9 @@ def build_menu_bar(state: UIState) -> None:
                     state, "INFO", "Echo Test Command Executed"
                 ),
             )
+            dpg.add_menu_item(
+                label="ADB Metrics", callback=lambda: _show_adb_metrics(state)
+            )
 
         with dpg.menu(label="Profile"):
             dpg.add_menu_item(
@@ -77,6 +136,19 @@ def build_menu_bar(state: UIState) -> None:
             )
 
         with dpg.menu(label="Settings"):
+            with dpg.menu(label="ADB Backend"):
+                for backend, label in (
+                    (ADB_BACKEND_PROCESS, "adb processes"),
+                    (ADB_BACKEND_SERVER, "adb server socket"),
+                ):
+                    dpg.add_menu_item(
+                        tag=f"adb_backend_{backend}",
+                        label=label,
+                        check=True,
+                        default_value=state.adb_backend == backend,
+                        callback=lambda s, a, u: _handle_adb_backend_change(state, u),
+                        user_data=backend,
+                    )
             with dpg.menu(label="Load Theme"):
                 dpg.add_menu_item(
                     label="Standard",
@@ -103,6 +175,84 @@ def build_menu_bar(state: UIState) -> None:
             dpg.add_menu_item(label="About", callback=lambda: _show_about_dialog(state))
 
 
+def _show_adb_metrics(state: UIState) -> None:
+    """Show per-command and per-device adb latency tables."""
+    if dpg.does_item_exist("adb_metrics_window"):
+        dpg.delete_item("adb_metrics_window")
+
+    metrics = state.adb_client.metrics
+    with dpg.window(
+        tag="adb_metrics_window",
+        label="ADB Metrics",
+        width=760,
+        height=480,
+        pos=(80, 80),
+    ):
+        with dpg.group(horizontal=True):
+            dpg.add_button(label="Refresh", callback=lambda: _show_adb_metrics(state))
+            dpg.add_button(label="Save JSON", callback=lambda: _dump_adb_metrics(state))
+            dpg.add_button(label="Reset", callback=lambda: _reset_adb_metrics(state))
+        dpg.add_text("By command", color=(200, 200, 200))
+        _render_latency_table(metrics.by_command(), "Command")
+        dpg.add_spacer(height=8)
+        dpg.add_text("By device", color=(200, 200, 200))
+        _render_latency_table(metrics.by_device(), "Serial")
+
+
+def _render_latency_table(rows: list[LatencyStats], key_label: str) -> None:
+    with dpg.table(
+        header_row=True,
+        resizable=True,
+        borders_outerH=True,
+        borders_outerV=True,
+        borders_innerH=True,
+        borders_innerV=True,
+    ):
+        for column in [
+            key_label,
+            "Calls",
+            "Failed",
+            "p50",
+            "p95",
+            "p99",
+            "Max",
+            "Output",
+        ]:
+            dpg.add_table_column(label=column)
+        if not rows:
+            with dpg.table_row():
+                for message in ["No adb calls yet", "-", "-", "-", "-", "-", "-", "-"]:
+                    dpg.add_text(message)
+        for row in rows:
+            with dpg.table_row():
+                values = [
+                    row.key,
+                    str(row.calls),
+                    str(row.failures),
+                    *(
+                        f"{value * 1000:.0f} ms"
+                        for value in (row.p50, row.p95, row.p99, row.max)
+                    ),
+                    f"{row.output_bytes / 1024:.1f} KiB",
+                ]
+                for value in values:
+                    dpg.add_text(value)
+
+
+def _reset_adb_metrics(state: UIState) -> None:
+    state.adb_client.metrics.reset()
+    _show_adb_metrics(state)
+
+
+def _dump_adb_metrics(state: UIState) -> None:
+    target = (state.base_output_path or state.output_path) / "adb_metrics.json"
+    try:
+        state.adb_client.metrics.dump(target)
+        log_message(state, "SUCCESS", f"Saved adb metrics to {target}")
+    except OSError as e:
+        log_message(state, "ERROR", f"Failed to save adb metrics: {e}")
+
+
 def _open_user_guide(state: UIState) -> None:
     """Open the bundled user guide HTML file."""
     # Determine base path
@@ -280,6 +430,35 @@ def build_device_controls(state: UIState) -> None:
         )
         _add_help_button("stop_profiling", state)
 
+    with dpg.group(horizontal=True, horizontal_spacing=8):
+        dpg.add_text("Console", color=(120, 180, 255))
+        dpg.add_input_text(
+            tag="console_commands",
+            hint="stat unit; r.VSync 0",
+            width=360,
+            on_enter=True,
+            callback=lambda: _handle_send_console_commands(state),
+        )
+        dpg.add_button(
+            label="Send",
+            width=120,
+            callback=lambda: _handle_send_console_commands(state),
+        )
+        _add_help_button("console_commands")
+
+    with dpg.group(horizontal=True, horizontal_spacing=8):
+        dpg.add_text("Live Logcat", color=(120, 180, 255))
+        dpg.add_button(
+            label="Start Logcat", width=120, callback=lambda: _start_logcat(state)
+        )
+        dpg.add_button(
+            label="Stop Logcat", width=120, callback=lambda: _stop_logcat(state)
+        )
+        dpg.add_button(
+            label="View Logcat", width=120, callback=lambda: _show_logcat(state)
+        )
+        _add_help_button("live_logcat")
+
 
 def build_file_actions(state: UIState) -> None:
     """Render file copy actions and reporting panels."""
@@ -364,6 +543,40 @@ def build_file_actions(state: UIState) -> None:
                         )
                         _add_help_button("move_csv")
 
+                    with dpg.table_row():
+                        dpg.add_checkbox(
+                            tag="cb_incremental_sync",
+                            label="Copy only new or changed files",
+                            default_value=state.incremental_sync_enabled,
+                            callback=_handle_bulk_action_toggle,
+                            user_data=(state, "incremental_sync_enabled"),
+                        )
+                        _add_help_button("incremental_sync")
+
+                    with dpg.table_row():
+                        dpg.add_checkbox(
+                            tag="cb_compressed_transfer",
+                            label="Compress transfers",
+                            default_value=state.compressed_transfer_enabled,
+                            callback=_handle_bulk_action_toggle,
+                            user_data=(state, "compressed_transfer_enabled"),
+                        )
+                        _add_help_button("compressed_transfer")
+
+                    with dpg.table_row():
+                        dpg.add_checkbox(
+                            tag="cb_device_log_filter",
+                            label="Filter logs on device",
+                            default_value=state.device_log_filter_enabled,
+                            callback=_handle_bulk_action_toggle,
+                            user_data=(state, "device_log_filter_enabled"),
+                        )
+                        _add_help_button("device_log_filter")
+
+                dpg.add_progress_bar(
+                    tag="transfer_progress", default_value=0.0, overlay="", width=-1
+                )
+
             with dpg.child_window(border=True, autosize_y=True, width=460):
                 dpg.add_text("Bulk Actions From PC to PC", color=(200, 200, 200))
                 with dpg.table(header_row=False, policy=dpg.mvTable_SizingFixedFit):
@@ -390,6 +603,26 @@ def build_file_actions(state: UIState) -> None:
                         )
                         _add_help_button("generate_logs")
 
+                    with dpg.table_row():
+                        dpg.add_checkbox(
+                            tag="cb_log_search_index",
+                            label="Build search index for colored logs",
+                            default_value=state.log_search_index_enabled,
+                            callback=_handle_bulk_action_toggle,
+                            user_data=(state, "log_search_index_enabled"),
+                        )
+                        _add_help_button("log_search_index")
+
+                    with dpg.table_row():
+                        dpg.add_checkbox(
+                            tag="cb_log_paging",
+                            label="Split colored logs into pages",
+                            default_value=state.log_paging_enabled,
+                            callback=_handle_bulk_action_toggle,
+                            user_data=(state, "log_paging_enabled"),
+                        )
+                        _add_help_button("log_paging")
+
                     with dpg.table_row():
                         dpg.add_button(
                             label="Generate",
@@ -432,12 +665,240 @@ def _populate_devices(state: UIState) -> None:
         dpg.get_value("package_input") if dpg.does_item_exist("package_input") else ""
     )
     state.package_name = package_value or ""
-    state.devices = collect_device_info(state.package_name)
+    # An explicit refresh should see packages installed since the last one.
+    state.adb_client.invalidate_packages()
+    state.async_adb_client.invalidate_packages()
+    state.devices = asyncio.run(
+        collect_device_info_async(state.package_name, adb_client=state.async_adb_client)
+    )
 
     if not state.devices:
         _show_device_troubleshooting_dialog(state)
 
     _refresh_device_table(state)
+    if state.liveness_poller is not None:
+        state.liveness_poller.poke()
+
+
+def start_device_watcher(state: UIState) -> DeviceWatcher:
+    """Keep the device table current from adb hotplug events."""
+    client = state.adb_client
+    watcher = DeviceWatcher(
+        adb_client=client,
+        package_name=lambda: state.package_name,
+        on_change=lambda serial, device: post_to_ui(
+            state, lambda: _apply_device_update(state, serial, device)
+        ),
+        # With the socket backend selected, track devices through it too.
+        server=client if isinstance(client, AdbServerClient) else None,
+    )
+    watcher.start()
+    return watcher
+
+
+def start_liveness_poller(state: UIState) -> PackageLivenessPoller:
+    """Track the package's PIDs on every online device in the background."""
+    poller = PackageLivenessPoller(
+        adb_client=state.adb_client,
+        package_name=lambda: state.package_name,
+        serials=lambda: [
+            device.serial
+            for device in list(state.devices)
+            if device.status == DEVICE_STATUS_ONLINE
+        ],
+        on_change=lambda current, previous: post_to_ui(
+            state, lambda: _apply_liveness_update(state, current, previous)
+        ),
+    )
+    state.liveness_poller = poller
+    poller.start()
+    return poller
+
+
+def _apply_liveness_update(
+    state: UIState,
+    current: PackageLiveness | None,
+    previous: PackageLiveness | None,
+) -> None:
+    """Publish a liveness change and flag apps that died mid-capture."""
+    if current is None:
+        if previous is not None:
+            state.package_liveness.pop(previous.serial, None)
+        return
+    state.package_liveness[current.serial] = current
+    if current.serial not in state.profiling_serials or current.error is not None:
+        return
+    was_running = previous is not None and previous.running
+    if was_running and not current.running:
+        state.profiling_serials.discard(current.serial)
+        log_message(
+            state,
+            "ERROR",
+            f"{current.package_name} stopped on {current.serial} during profiling.",
+        )
+    elif was_running and previous is not None and previous.pids != current.pids:
+        log_message(
+            state,
+            "WARNING",
+            f"{current.package_name} restarted on {current.serial} during "
+            "profiling; the capture may be incomplete.",
+        )
+
+
+def close_console_queues(state: UIState) -> None:
+    """Deliver queued console commands and stop their workers."""
+    if state.console_queues is not None:
+        state.console_queues.close()
+        state.console_queues = None
+
+
+def _console_queue(state: UIState, serial: str) -> ConsoleCommandQueue:
+    if state.console_queues is None:
+        state.console_queues = ConsoleCommandQueues(state.adb_client)
+    return state.console_queues.for_device(serial)
+
+
+def _handle_send_console_commands(state: UIState) -> None:
+    """Queue the console commands typed in the Console field."""
+    serial = state.selected_device_serial
+    if not serial:
+        log_message(state, "ERROR", "No device selected.")
+        return
+    text = dpg.get_value("console_commands") or ""
+    commands = [
+        command.strip()
+        for line in text.splitlines()
+        for command in line.split(";")
+        if command.strip()
+    ]
+    if not commands:
+        return
+
+    futures = _console_queue(state, serial).submit_many(commands)
+    log_message(state, "INFO", f"Queued {len(commands)} console command(s).")
+
+    def report(_: object) -> None:
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            message = f"Console commands failed: {errors[0]}"
+            post_to_ui(state, lambda: log_message(state, "ERROR", message))
+        else:
+            message = f"Sent {len(commands)} console command(s) to {serial}."
+            post_to_ui(state, lambda: log_message(state, "SUCCESS", message))
+
+    futures[-1].add_done_callback(report)
+
+
+def stop_logcat_streams(state: UIState) -> None:
+    """Stop every live logcat stream, closing their current segments."""
+    for streamer in state.logcat_streamers.values():
+        streamer.stop()
+    state.logcat_streamers.clear()
+
+
+def _start_logcat(state: UIState) -> None:
+    serial = state.selected_device_serial
+    if not serial:
+        log_message(state, "ERROR", "No device selected.")
+        return
+    existing = state.logcat_streamers.get(serial)
+    if existing is not None and existing.running:
+        log_message(state, "INFO", f"Logcat for {serial} is already streaming.")
+        return
+
+    base_path = state.base_output_path if state.base_output_path else state.output_path
+    streamer = LogcatStreamer(
+        state.adb_client, serial, base_path / "Logs", package_name=state.package_name
+    )
+    streamer.start()
+    state.logcat_streamers[serial] = streamer
+    target = state.package_name or "all processes"
+    log_message(
+        state, "SUCCESS", f"Streaming logcat for {target} to {base_path / 'Logs'}"
+    )
+
+
+def _stop_logcat(state: UIState) -> None:
+    serial = state.selected_device_serial
+    streamer = state.logcat_streamers.pop(serial, None) if serial else None
+    if streamer is None:
+        log_message(state, "ERROR", "No logcat stream running for the selected device.")
+        return
+    streamer.stop()
+    log_message(
+        state,
+        "SUCCESS",
+        f"Stopped logcat for {serial}: kept {streamer.kept} of "
+        f"{streamer.received} lines in {len(streamer.segments)} file(s).",
+    )
+
+
+def _show_logcat(state: UIState) -> None:
+    """Show the newest buffered logcat lines of the selected device."""
+    streamer = state.logcat_streamers.get(state.selected_device_serial or "")
+    if streamer is None:
+        log_message(state, "ERROR", "No logcat stream running for the selected device.")
+        return
+    if dpg.does_item_exist("logcat_window"):
+        dpg.delete_item("logcat_window")
+
+    with dpg.window(
+        tag="logcat_window",
+        label=f"Logcat - {streamer.serial}",
+        width=900,
+        height=500,
+        pos=(60, 60),
+    ):
+        dpg.add_button(label="Refresh", callback=lambda: _show_logcat(state))
+        dpg.add_input_text(
+            default_value="\n".join(streamer.lines(LOGCAT_VIEW_LINES)),
+            multiline=True,
+            readonly=True,
+            width=-1,
+            height=-1,
+        )
+
+
+def _apply_device_update(
+    state: UIState, serial: str, device: DeviceInfo | None
+) -> None:
+    """Replace, add or remove one device row after a hotplug event."""
+    index = next(
+        (i for i, existing in enumerate(state.devices) if existing.serial == serial),
+        None,
+    )
+    if device is None:
+        if index is None:
+            return
+        removed = state.devices.pop(index)
+        state.bulk_device_serials.discard(serial)
+        log_message(
+            state, "WARNING", f"Device disconnected: {removed.make} {removed.model}"
+        )
+    elif index is None:
+        state.devices.append(device)
+        log_message(state, "INFO", f"Device connected: {device.make} {device.model}")
+    else:
+        state.devices[index] = device
+
+    _refresh_device_table(state)
+    if state.liveness_poller is not None:
+        state.liveness_poller.poke()
+
+
+def post_to_ui(state: UIState, task: Callable[[], None]) -> None:
+    """Queue ``task`` to run on the UI thread; safe to call from any thread."""
+    state.ui_tasks.put(task)
+
+
+def process_ui_tasks(state: UIState) -> None:
+    """Run work queued by background threads. Called once per frame."""
+    while True:
+        try:
+            task = state.ui_tasks.get_nowait()
+        except queue.Empty:
+            return
+        task()
 
 
 def _show_device_troubleshooting_dialog(state: UIState) -> None:
@@ -507,7 +968,8 @@ def _show_device_troubleshooting_dialog(state: UIState) -> None:
 
 def _handle_start_profiling(state: UIState) -> None:
     """Send 'CsvProfile Start' command to the selected device."""
-    if not state.selected_device_serial:
+    serial = state.selected_device_serial
+    if not serial:
         log_message(state, "ERROR", "No device selected.")
         return
 
@@ -515,10 +977,11 @@ def _handle_start_profiling(state: UIState) -> None:
         log_message(state, "ERROR", "Package Name not set.")
         return
 
-    client = AdbClient()
-
     # Check if running - Fail if not
-    if not client.is_package_running(state.selected_device_serial, state.package_name):
+    running = _cached_package_running(state, serial)
+    if running is None:
+        return
+    if not running:
         log_message(
             state,
             "ERROR",
@@ -531,17 +994,18 @@ def _handle_start_profiling(state: UIState) -> None:
         )
         return
 
-    try:
-        log_message(state, "INFO", "Sending 'CsvProfile Start'...")
-        client.send_console_command(state.selected_device_serial, "CsvProfile Start")
+    def started() -> None:
+        state.profiling_serials.add(serial)
         log_message(state, "SUCCESS", "Sent start profiling command.")
-    except Exception as e:
-        log_message(state, "ERROR", f"Failed to send command: {e}")
+
+    log_message(state, "INFO", "Sending 'CsvProfile Start'...")
+    _send_profiling_command(state, serial, "CsvProfile Start", started)
 
 
 def _handle_stop_profiling(state: UIState) -> None:
     """Send 'CsvProfile Stop' command to the selected device."""
-    if not state.selected_device_serial:
+    serial = state.selected_device_serial
+    if not serial:
         log_message(state, "ERROR", "No device selected.")
         return
 
@@ -549,10 +1013,11 @@ def _handle_stop_profiling(state: UIState) -> None:
         log_message(state, "ERROR", "Package Name not set.")
         return
 
-    client = AdbClient()
-
     # Check if running - Fail if not
-    if not client.is_package_running(state.selected_device_serial, state.package_name):
+    running = _cached_package_running(state, serial)
+    if running is None:
+        return
+    if not running:
         log_message(
             state,
             "ERROR",
@@ -563,12 +1028,54 @@ def _handle_stop_profiling(state: UIState) -> None:
         )
         return
 
-    try:
-        log_message(state, "INFO", "Sending 'CsvProfile Stop'...")
-        client.send_console_command(state.selected_device_serial, "CsvProfile Stop")
+    def stopped() -> None:
+        state.profiling_serials.discard(serial)
         log_message(state, "SUCCESS", "Sent stop profiling command.")
-    except Exception as e:
-        log_message(state, "ERROR", f"Failed to send command: {e}")
+
+    log_message(state, "INFO", "Sending 'CsvProfile Stop'...")
+    _send_profiling_command(state, serial, "CsvProfile Stop", stopped)
+
+
+def _cached_package_running(state: UIState, serial: str) -> bool | None:
+    """Whether the package runs on ``serial`` per the liveness poller.
+
+    Logs why and returns ``None`` when that is not known yet.
+    """
+    liveness = state.package_liveness.get(serial)
+    if liveness is None or liveness.package_name != state.package_name:
+        log_message(
+            state,
+            "WARNING",
+            f"Still checking whether {state.package_name} is running; "
+            "try again in a moment.",
+        )
+        if state.liveness_poller is not None:
+            state.liveness_poller.poke()
+        return None
+    if liveness.error is not None:
+        log_message(state, "ERROR", f"Could not check the package: {liveness.error}")
+        return None
+    return liveness.running
+
+
+def _send_profiling_command(
+    state: UIState, serial: str, command: str, on_sent: Callable[[], None]
+) -> None:
+    """Queue ``command`` and report the outcome on the UI thread."""
+
+    def report(future: Future[None]) -> None:
+        error = future.exception()
+        if error is None:
+            post_to_ui(state, on_sent)
+        else:
+            message = (
+                _describe_adb_error(error)
+                if isinstance(error, AdbError)
+                else f"Failed to send command: {error}"
+            )
+            post_to_ui(state, lambda: log_message(state, "ERROR", message))
+
+    _console_queue(state, serial).submit(command).add_done_callback(report)
 
 
 def _handle_log_filter(sender: int, app_data: str, user_data: UIState) -> None:
@@ -597,15 +1104,62 @@ def _handle_bulk_action_toggle(
 
 
 def _handle_generate_actions(state: UIState) -> None:
-    """Execute selected bulk actions."""
+    """Execute selected bulk actions.
+
+    With devices ticked the actions cover those devices, each in its own
+    ``Make_Model`` folder; otherwise they cover the selected device.
+    """
+    if state.bulk_device_serials:
+        bulk_devices = _bulk_devices(state)
+        if not bulk_devices:
+            log_message(
+                state,
+                "WARNING",
+                "None of the ticked devices is online with the package installed.",
+            )
+            return
+        folders = []
+        if state.move_logs_enabled:
+            folders.append(("Logs", "Logs"))
+        if state.move_csv_enabled:
+            folders.append(("Profiling/CSV", "CSV"))
+        if folders:
+            # The moves run in the background and start generation when done.
+            _move_files_from_devices(state, bulk_devices, folders, generate=True)
+        else:
+            _generate_outputs(state, list(device_folder_names(bulk_devices).values()))
+        return
+
     if state.move_logs_enabled:
         _handle_move_logs(state)
     if state.move_csv_enabled:
         _handle_move_csv(state)
+    _generate_outputs(state)
+
+
+def _generate_outputs(state: UIState, device_folders: list[str] | None = None) -> None:
+    """Run the enabled report and colored-log generation.
+
+    By default this reads ``CSV`` and ``Logs`` under the base output path,
+    where single-device moves put them, and writes to the output path. With
+    ``device_folders`` it reads ``<folder>/CSV`` and ``<folder>/Logs`` for
+    each device folder a bulk move wrote and writes into that folder.
+    """
+    base_path = state.base_output_path if state.base_output_path else state.output_path
+    if device_folders is None:
+        csv_dirs = [(base_path / "CSV", state.output_path)]
+        logs_dirs = [(base_path / "Logs", state.output_path)]
+    else:
+        csv_dirs = [
+            (base_path / name / "CSV", base_path / name) for name in device_folders
+        ]
+        logs_dirs = [
+            (base_path / name / "Logs", base_path / name) for name in device_folders
+        ]
     if state.generate_perf_report_enabled:
-        _handle_generate_perf_report(state)
+        _handle_generate_perf_report(state, csv_dirs)
     if state.generate_colored_logs_enabled:
-        _handle_generate_colored_logs(state)
+        _handle_generate_colored_logs(state, logs_dirs)
 
 
 def _open_profile_folder(state: UIState) -> None:
@@ -627,7 +1181,9 @@ def _handle_move_logs(state: UIState) -> None:
     _move_files_from_device(state, "Logs", "Logs")
 
 
-def _get_unique_output_path(base_path: Path, filename: str, extension: str) -> Path:
+def _get_unique_output_path(
+    base_path: Path, filename: str, extension: str, reserved: Collection[Path] = ()
+) -> Path:
     """
     Generate a unique file path by appending a counter if the file already exists.
 
@@ -635,6 +1191,7 @@ def _get_unique_output_path(base_path: Path, filename: str, extension: str) -> P
         base_path: Directory where the file will be saved
         filename: Desired filename without extension
         extension: File extension (with or without leading dot)
+        reserved: Paths already promised to other outputs that may not exist yet
 
     Returns:
         A unique Path object that doesn't conflict with existing files
@@ -646,20 +1203,25 @@ def _get_unique_output_path(base_path: Path, filename: str, extension: str) -> P
     output_path = base_path / f"{filename}{extension}"
 
     # If file doesn't exist, return it
-    if not output_path.exists():
+    if not output_path.exists() and output_path not in reserved:
         return output_path
 
     # File exists, find a unique name by appending counter
     counter = 1
     while True:
         output_path = base_path / f"{filename}_{counter}{extension}"
-        if not output_path.exists():
+        if not output_path.exists() and output_path not in reserved:
             return output_path
         counter += 1
 
 
-def _handle_generate_perf_report(state: UIState) -> None:
-    """Run PerfreportTool on CSV files and delete them on success."""
+def _handle_generate_perf_report(
+    state: UIState, sources: list[tuple[Path, Path]] | None = None
+) -> None:
+    """Run PerfreportTool on CSV files and delete them on success.
+
+    ``sources`` pairs each CSV folder with the folder its reports go to.
+    """
     # Locate PerfreportTool.exe
     # Assuming repo root is 3 levels up from this file (cerebrus/ui/components.py -> cerebrus/ui -> cerebrus -> root)
     repo_root = Path(__file__).resolve().parent.parent.parent
@@ -669,16 +1231,27 @@ def _handle_generate_perf_report(state: UIState) -> None:
         log_message(state, "ERROR", f"PerfreportTool not found at: {tool_path}")
         return
 
-    # Input CSV directory: Use base path / CSV (where files are actually moved)
-    base_path = state.base_output_path if state.base_output_path else state.output_path
-    csv_dir = base_path / "CSV"
+    if sources is None:
+        # Input CSV directory: Use base path / CSV (where files are actually moved)
+        # Output directory: state.output_path (which includes device folder if set)
+        base_path = (
+            state.base_output_path if state.base_output_path else state.output_path
+        )
+        sources = [(base_path / "CSV", state.output_path)]
+
+    for csv_dir, output_dir in sources:
+        _generate_perf_reports_in(state, tool_path, csv_dir, output_dir)
+
+    log_message(state, "INFO", "Batch processing completed.")
+
+
+def _generate_perf_reports_in(
+    state: UIState, tool_path: Path, csv_dir: Path, output_dir: Path
+) -> None:
     if not csv_dir.exists():
         log_message(state, "ERROR", f"CSV directory not found: {csv_dir}")
         return
 
-    # Output directory: state.output_path (which includes device folder if set)
-    output_dir = state.output_path
-
     if not output_dir.exists():
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -763,37 +1336,90 @@ def _handle_generate_perf_report(state: UIState) -> None:
                 state, "ERROR", f"Exception while processing {csv_file.name}: {e}"
             )
 
-    log_message(state, "INFO", "Batch processing completed.")
 
+def _handle_generate_colored_logs(
+    state: UIState, sources: list[tuple[Path, Path]] | None = None
+) -> None:
+    """Convert text logs to colored HTML logs.
 
-def _handle_generate_colored_logs(state: UIState) -> None:
-    """Convert text logs to colored HTML logs."""
-    # Input Logs directory: Use base path / Logs (where files are actually moved)
-    base_path = state.base_output_path if state.base_output_path else state.output_path
-    logs_dir = base_path / "Logs"
-    if not logs_dir.exists():
-        log_message(state, "ERROR", f"Logs directory not found: {logs_dir}")
+    ``sources`` pairs each Logs folder with the folder its HTML goes to.
+    """
+    if state.log_conversion_running:
+        log_message(state, "WARNING", "Log conversion is already running.")
         return
 
-    # Output directory: state.output_path (which includes device folder if set)
-    output_dir = state.output_path
+    if sources is None:
+        # Input Logs directory: Use base path / Logs (where files are actually moved)
+        # Output directory: state.output_path (which includes device folder if set)
+        base_path = (
+            state.base_output_path if state.base_output_path else state.output_path
+        )
+        sources = [(base_path / "Logs", state.output_path)]
+
+    jobs: list[tuple[Path, Path]] = []
+    reserved: set[Path] = set()
+    for logs_dir, output_dir in sources:
+        jobs.extend(_colored_log_jobs(state, logs_dir, output_dir, reserved))
+    if not jobs:
+        return
+
+    workers = default_workers(len(jobs))
+    log_message(
+        state,
+        "INFO",
+        f"Found {len(jobs)} log files. Converting on {workers} processes...",
+    )
+
+    search_index = state.log_search_index_enabled
+    page_lines = DEFAULT_PAGE_LINES if state.log_paging_enabled else None
+    state.log_conversion_running = True
+
+    def report(result: LogConversion) -> None:
+        post_to_ui(state, lambda: _report_log_conversion(state, result))
+
+    def work() -> None:
+        try:
+            convert_logs(
+                jobs,
+                search_index=search_index,
+                remove_sources=True,
+                on_done=report,
+                max_workers=workers,
+                page_lines=page_lines,
+            )
+        except Exception as e:
+            error = e
+            post_to_ui(
+                state,
+                lambda: log_message(state, "ERROR", f"Log conversion failed: {error}"),
+            )
+        finally:
+            post_to_ui(state, lambda: _finish_log_conversion(state))
+
+    threading.Thread(target=work, name="log-conversion", daemon=True).start()
+
+
+def _colored_log_jobs(
+    state: UIState, logs_dir: Path, output_dir: Path, reserved: set[Path]
+) -> list[tuple[Path, Path]]:
+    """``(log, html)`` conversions for the logs in ``logs_dir``."""
+    if not logs_dir.exists():
+        log_message(state, "ERROR", f"Logs directory not found: {logs_dir}")
+        return []
 
     if not output_dir.exists():
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             log_message(state, "ERROR", f"Failed to create output directory: {e}")
-            return
+            return []
 
     log_files = list(logs_dir.glob("*.log")) + list(logs_dir.glob("*.txt"))
     if not log_files:
         log_message(state, "WARNING", f"No log files found in {logs_dir}")
-        return
-
-    log_message(
-        state, "INFO", f"Found {len(log_files)} log files. Starting conversion..."
-    )
+        return []
 
+    jobs: list[tuple[Path, Path]] = []
     for log_file in log_files:
         # Determine output filename based on use_prefix_only setting
         if state.use_prefix_only:
@@ -809,27 +1435,35 @@ def _handle_generate_colored_logs(state: UIState) -> None:
             )
 
         # Get unique path to avoid overwriting existing files
-        output_file_path = _get_unique_output_path(output_dir, output_filename, ".html")
-
-        log_message(state, "INFO", f"Converting {log_file.name}...")
+        output_file_path = _get_unique_output_path(
+            output_dir, output_filename, ".html", reserved
+        )
+        reserved.add(output_file_path)
+        jobs.append((log_file, output_file_path))
+    return jobs
 
-        try:
-            # Run conversion directly
-            convert_log_to_html(log_file, output_file_path)
-            log_message(state, "SUCCESS", f"Created {output_file_path.name}")
 
-            # Delete the source file
-            try:
-                log_file.unlink()
-                log_message(state, "INFO", f"Deleted {log_file.name}")
-            except Exception as e:
-                log_message(state, "WARNING", f"Failed to delete {log_file.name}: {e}")
+def _report_log_conversion(state: UIState, result: LogConversion) -> None:
+    if not result.ok:
+        log_message(
+            state,
+            "ERROR",
+            f"Exception while converting {result.source.name}: {result.error}",
+        )
+        return
+    log_message(state, "SUCCESS", f"Created {result.output.name}")
+    if result.remove_error is not None:
+        log_message(
+            state,
+            "WARNING",
+            f"Failed to delete {result.source.name}: {result.remove_error}",
+        )
+    else:
+        log_message(state, "INFO", f"Deleted {result.source.name}")
 
-        except Exception as e:
-            log_message(
-                state, "ERROR", f"Exception while converting {log_file.name}: {e}"
-            )
 
+def _finish_log_conversion(state: UIState) -> None:
+    state.log_conversion_running = False
     log_message(state, "INFO", "Log conversion completed.")
 
 
@@ -841,8 +1475,13 @@ def _handle_view_html_logs(state: UIState) -> None:
         log_message(state, "ERROR", f"Output directory not found: {output_dir}")
         return
 
-    # Find all HTML files recursively in the output directory and subdirectories
-    html_files = list(output_dir.glob("**/*.html"))
+    # Find all HTML files recursively in the output directory and subdirectories,
+    # leaving out the pages of paged logs; their index page links to them.
+    html_files = [
+        path
+        for path in output_dir.glob("**/*.html")
+        if not path.parent.name.endswith("_pages")
+    ]
 
     if not html_files:
         log_message(state, "WARNING", f"No HTML files found in {output_dir}")
@@ -933,28 +1572,35 @@ def _open_all_html_files(state: UIState, html_files: list) -> None:
         dpg.delete_item("html_viewer_dialog")
 
 
-def _move_files_from_device(
-    state: UIState, source_subpath: str, dest_subpath: str
-) -> None:
-    if not state.selected_device_serial:
-        log_message(state, "ERROR", "No device selected.")
-        return
-
+def _device_saved_folder(state: UIState, source_subpath: str) -> str | None:
+    """Device path of ``Saved/<source_subpath>/`` for the current package."""
     if not state.package_name:
         log_message(state, "ERROR", "Package Name not set.")
-        return
+        return None
 
     parts = state.package_name.split(".")
     if len(parts) < 3:
         log_message(
             state, "ERROR", "Invalid Package Name format. Cannot derive Project Name."
         )
-        return
+        return None
     project_name = parts[-1]
 
     # Source: /sdcard/Android/data/{package}/files/UnrealGame/{project}/{project}/Saved/{source_subpath}/
     # User confirmed structure: UnrealGame/{Name}/{Name}/Saved/...
-    source_path = f"/sdcard/Android/data/{state.package_name}/files/UnrealGame/{project_name}/{project_name}/Saved/{source_subpath}/"
+    return f"/sdcard/Android/data/{state.package_name}/files/UnrealGame/{project_name}/{project_name}/Saved/{source_subpath}/"
+
+
+def _move_files_from_device(
+    state: UIState, source_subpath: str, dest_subpath: str
+) -> None:
+    if not state.selected_device_serial:
+        log_message(state, "ERROR", "No device selected.")
+        return
+
+    source_path = _device_saved_folder(state, source_subpath)
+    if source_path is None:
+        return
 
     # Dest: Use base_output_path (not device-specific) / {dest_subpath}/
     # This ensures files go to OutputPath/CSV and OutputPath/Logs, not OutputPath/Device/CSV
@@ -964,12 +1610,31 @@ def _move_files_from_device(
     if not dest_path.exists():
         dest_path.mkdir(parents=True, exist_ok=True)
 
-    client = AdbClient()
+    client = state.adb_client
     serial = state.selected_device_serial
 
     log_message(state, "INFO", f"Moving files from {source_path} to {dest_path}...")
 
+    file_type = "Logs" if "Logs" in dest_subpath else "CSV Data"
     try:
+        log_filter = _device_log_filter(state, dest_subpath)
+        if log_filter is not None:
+            _filter_logs_on_device(state, serial, source_path, dest_path, log_filter)
+            return
+        if state.incremental_sync_enabled or state.compressed_transfer_enabled:
+            # A tar stream does not report files it skipped, so compressed
+            # moves go through the sync, which size-checks each file before
+            # removing it from the device.
+            _sync_files_from_device(
+                state,
+                serial,
+                source_path,
+                dest_path,
+                file_type,
+                incremental=state.incremental_sync_enabled,
+            )
+            return
+
         # Pull all files from source directory
         # Append . to source path to pull contents
         client.pull(serial, source_path + ".", str(dest_path))
@@ -978,17 +1643,235 @@ def _move_files_from_device(
         client.shell(serial, ["rm", "-rf", source_path + "*"])
 
         log_message(state, "SUCCESS", f"Moved files to {dest_path}")
-    except AdbError as e:
+    except AdbCommandError as e:
         error_msg = str(e)
         if "does not exist" in error_msg or "No such file or directory" in error_msg:
-            file_type = "Logs" if "Logs" in dest_subpath else "CSV Data"
             log_message(state, "ERROR", f"No {file_type} present on device.")
         else:
             log_message(state, "ERROR", f"ADB Error: {e}")
+    except AdbError as e:
+        log_message(state, "ERROR", _describe_adb_error(e))
     except Exception as e:
         log_message(state, "ERROR", f"Failed to move files: {e}")
 
 
+def _device_log_filter(state: UIState, dest_subpath: str) -> LogFilter | None:
+    """The on-device filter for a Logs move, when that option is on."""
+    if not state.device_log_filter_enabled or dest_subpath != "Logs":
+        return None
+    return LogFilter(tuple(device_filter_patterns()), DEVICE_LOG_FILTER_CONTEXT)
+
+
+def _filter_logs_on_device(
+    state: UIState,
+    serial: str,
+    source_path: str,
+    dest_path: Path,
+    log_filter: LogFilter,
+) -> None:
+    result = filter_device_logs(
+        state.adb_client, serial, source_path, dest_path, log_filter
+    )
+    if not (result.pulled or result.skipped or result.failed):
+        log_message(state, "ERROR", "No Logs present on device.")
+        return
+    for path, reason in result.failed.items():
+        log_message(state, "WARNING", f"Could not filter {path}: {reason}")
+    level = "WARNING" if result.failed else "SUCCESS"
+    log_message(
+        state,
+        level,
+        f"Filtered Logs into {dest_path}: {len(result.pulled)} filtered, "
+        f"{len(result.skipped)} unchanged. Full logs were left on the device.",
+    )
+
+
+def _sync_files_from_device(
+    state: UIState,
+    serial: str,
+    source_path: str,
+    dest_path: Path,
+    file_type: str,
+    incremental: bool = True,
+) -> None:
+    result = sync_device_folder(
+        state.adb_client,
+        serial,
+        source_path,
+        dest_path,
+        compressed=state.compressed_transfer_enabled,
+        incremental=incremental,
+    )
+    if not (result.pulled or result.skipped or result.failed):
+        log_message(state, "ERROR", f"No {file_type} present on device.")
+        return
+    for path, reason in result.failed.items():
+        log_message(state, "WARNING", f"Kept {path} on device: {reason}")
+    level = "WARNING" if result.failed else "SUCCESS"
+    log_message(
+        state,
+        level,
+        f"Synced {file_type} to {dest_path}: {len(result.pulled)} copied, "
+        f"{len(result.skipped)} already up to date, "
+        f"{len(result.removed)} removed from device.",
+    )
+
+
+def _bulk_devices(state: UIState) -> list[DeviceInfo]:
+    """Ticked devices that can currently take part in a bulk move."""
+    return [
+        device
+        for device in state.devices
+        if device.serial in state.bulk_device_serials
+        and device.status == DEVICE_STATUS_ONLINE
+        and device.package_found
+    ]
+
+
+def _move_files_from_devices(
+    state: UIState,
+    devices: list[DeviceInfo],
+    folders: list[tuple[str, str]],
+    generate: bool = False,
+) -> None:
+    """Sync ``(source_subpath, dest_subpath)`` folders from every device at once.
+
+    Runs in the background; each device writes to its own ``Make_Model``
+    folder under the output path and progress is shown in the bulk panel.
+    With ``generate`` the enabled reports and colored logs are generated
+    from those folders once every move has finished.
+    """
+    if state.transfer_progress is not None:
+        log_message(state, "WARNING", "A device transfer is already running.")
+        return
+
+    base_path = state.base_output_path if state.base_output_path else state.output_path
+    folder_names = device_folder_names(devices)
+    transfers: list[DeviceTransfer] = []
+    for source_subpath, dest_subpath in folders:
+        source_path = _device_saved_folder(state, source_subpath)
+        if source_path is None:
+            return
+        log_filter = _device_log_filter(state, dest_subpath)
+        for device in devices:
+            local_dir = base_path / folder_names[device.serial] / dest_subpath
+            transfers.append(
+                DeviceTransfer(device.serial, source_path, local_dir, log_filter)
+            )
+
+    progress = TransferProgress(len(devices))
+    state.transfer_progress = progress
+    compressed = state.compressed_transfer_enabled
+    incremental = state.incremental_sync_enabled
+    log_message(
+        state, "INFO", f"Moving files from {len(devices)} devices to {base_path}..."
+    )
+
+    def work() -> None:
+        finished = threading.Event()
+
+        def tick() -> None:
+            while not finished.wait(TRANSFER_PROGRESS_INTERVAL):
+                post_to_ui(state, lambda: _show_transfer_progress(progress))
+
+        threading.Thread(target=tick, name="transfer-progress", daemon=True).start()
+        try:
+            outcomes = sync_devices(
+                state.adb_client,
+                transfers,
+                compressed=compressed,
+                progress=progress,
+                incremental=incremental,
+            )
+        except Exception as e:
+            error = e
+            post_to_ui(
+                state, lambda: _finish_device_moves(state, {}, folder_names, error)
+            )
+        else:
+            post_to_ui(
+                state,
+                lambda: _finish_device_moves(
+                    state, outcomes, folder_names, generate=generate
+                ),
+            )
+        finally:
+            finished.set()
+
+    threading.Thread(target=work, name="device-transfers", daemon=True).start()
+
+
+def _show_transfer_progress(progress: TransferProgress) -> None:
+    if not dpg.does_item_exist("transfer_progress"):
+        return
+    megabyte = 1024 * 1024
+    dpg.set_value("transfer_progress", progress.fraction)
+    dpg.configure_item(
+        "transfer_progress",
+        overlay=(
+            f"{progress.devices_done}/{progress.devices} devices, "
+            f"{progress.done_bytes / megabyte:.1f}/"
+            f"{progress.total_bytes / megabyte:.1f} MB, "
+            f"{progress.bytes_per_second / megabyte:.1f} MB/s"
+        ),
+    )
+
+
+def _finish_device_moves(
+    state: UIState,
+    outcomes: dict[str, list[tuple[DeviceTransfer, SyncResult | AdbError]]],
+    folder_names: dict[str, str],
+    error: Exception | None = None,
+    generate: bool = False,
+) -> None:
+    progress = state.transfer_progress
+    state.transfer_progress = None
+    if progress is not None:
+        _show_transfer_progress(progress)
+    if error is not None:
+        log_message(state, "ERROR", f"Failed to move files: {error}")
+        return
+
+    for serial, device_outcomes in outcomes.items():
+        for transfer, outcome in device_outcomes:
+            label = f"{folder_names[serial]}/{transfer.local_dir.name}"
+            if isinstance(outcome, AdbError):
+                if "No such file or directory" in str(outcome):
+                    log_message(state, "WARNING", f"{label}: nothing on device.")
+                else:
+                    log_message(
+                        state, "ERROR", f"{label}: {_describe_adb_error(outcome)}"
+                    )
+                continue
+            level = "WARNING" if outcome.failed else "SUCCESS"
+            log_message(
+                state,
+                level,
+                f"{label}: {len(outcome.pulled)} copied, "
+                f"{len(outcome.skipped)} already up to date, "
+                f"{len(outcome.failed)} kept on device.",
+            )
+    if progress is not None:
+        megabyte = 1024 * 1024
+        log_message(
+            state,
+            "INFO",
+            f"Moved {progress.done_bytes / megabyte:.1f} MB from "
+            f"{progress.devices} devices at "
+            f"{progress.bytes_per_second / megabyte:.1f} MB/s.",
+        )
+    if generate:
+        _generate_outputs(state, list(folder_names.values()))
+
+
+def _describe_adb_error(error: AdbError) -> str:
+    if isinstance(error, AdbTimeoutError):
+        return f"Device did not respond in time: {error}"
+    if isinstance(error, AdbDeviceOfflineError):
+        return f"Device is offline or disconnected: {error}"
+    return f"ADB Error: {error}"
+
+
 def _render_log_entries(state: UIState) -> None:
     if not dpg.does_item_exist("log_container"):
         return
@@ -1114,6 +1997,7 @@ def _render_device_table(state: UIState) -> None:
         borders_innerH=True,
         borders_innerV=True,
     ):
+        dpg.add_table_column(label="Bulk", width_fixed=True)
         for column in [
             "Make",
             "Model",
@@ -1128,7 +2012,7 @@ def _render_device_table(state: UIState) -> None:
 
         if not state.devices:
             with dpg.table_row():
-                for message in ["-", "-", "No devices listed", "-", "-", "-"]:
+                for message in ["", "-", "-", "No devices listed", "-", "-", "-"]:
                     dpg.add_text(message)
         else:
             for row_index, device in enumerate(state.devices):
@@ -1137,13 +2021,20 @@ def _render_device_table(state: UIState) -> None:
 
 def _render_device_row(row_index: int, device: DeviceInfo, state: UIState) -> None:
     with dpg.table_row():
+        selectable = device.status == DEVICE_STATUS_ONLINE and device.package_found
+        dpg.add_checkbox(
+            default_value=selectable and device.serial in state.bulk_device_serials,
+            enabled=selectable,
+            callback=_handle_bulk_device_toggle,
+            user_data=(state, device.serial),
+        )
         values = [
             device.make,
             device.model,
             device.serial,
             device.android_version,
             device.sdk_level,
-            "True" if device.package_found else "False",
+            _package_found_label(device),
         ]
 
         row_tags: list[str] = []
@@ -1151,7 +2042,13 @@ def _render_device_row(row_index: int, device: DeviceInfo, state: UIState) -> No
             cell_tag = f"device_cell_{row_index}_{column_index}"
             # Color code the Package Found column (last column)
             if column_index == len(values) - 1:  # Package Found column
-                if device.package_found:
+                if device.status != DEVICE_STATUS_ONLINE:
+                    text_color = (
+                        get_theme_manager()
+                        .get_log_colors()
+                        .get("WARNING", (255, 165, 0))
+                    )
+                elif device.package_found:
                     text_color = (
                         get_theme_manager().get_log_colors().get("SUCCESS", (0, 255, 0))
                     )
@@ -1178,6 +2075,22 @@ def _render_device_row(row_index: int, device: DeviceInfo, state: UIState) -> No
         _select_device_row(row_index, state)
 
 
+def _handle_bulk_device_toggle(
+    sender: int, app_data: bool, user_data: tuple[UIState, str]
+) -> None:
+    state, serial = user_data
+    if app_data:
+        state.bulk_device_serials.add(serial)
+    else:
+        state.bulk_device_serials.discard(serial)
+
+
+def _package_found_label(device: DeviceInfo) -> str:
+    if device.status != DEVICE_STATUS_ONLINE:
+        return device.status.capitalize()
+    return "True" if device.package_found else "False"
+
+
 def _handle_device_select(
     sender: int, app_data: int, user_data: tuple[UIState, int, str]
 ) -> None:
@@ -1190,6 +2103,14 @@ def _handle_device_select(
             selected_device = device
             break
 
+    if selected_device and selected_device.status != DEVICE_STATUS_ONLINE:
+        log_message(
+            state,
+            "WARNING",
+            f"Device {serial} is {selected_device.status}. Check the cable and USB debugging authorization, then list devices again.",
+        )
+        return
+
     if selected_device and not selected_device.package_found:
         log_message(
             state,
@@ -1609,8 +2530,13 @@ def _auto_save_profile(state: UIState) -> None:
         # Save bulk action states
         profile.move_logs_enabled = state.move_logs_enabled
         profile.move_csv_enabled = state.move_csv_enabled
+        profile.incremental_sync_enabled = state.incremental_sync_enabled
+        profile.compressed_transfer_enabled = state.compressed_transfer_enabled
+        profile.device_log_filter_enabled = state.device_log_filter_enabled
         profile.generate_perf_report_enabled = state.generate_perf_report_enabled
         profile.generate_colored_logs_enabled = state.generate_colored_logs_enabled
+        profile.log_search_index_enabled = state.log_search_index_enabled
+        profile.log_paging_enabled = state.log_paging_enabled
 
         if state.profile_manager.current_profile_path:
             state.profile_manager.save_current_profile()
@@ -1697,8 +2623,13 @@ def _finalize_profile_save(state: UIState, path: Path) -> None:
 
     profile.move_logs_enabled = state.move_logs_enabled
     profile.move_csv_enabled = state.move_csv_enabled
+    profile.incremental_sync_enabled = state.incremental_sync_enabled
+    profile.compressed_transfer_enabled = state.compressed_transfer_enabled
+    profile.device_log_filter_enabled = state.device_log_filter_enabled
     profile.generate_perf_report_enabled = state.generate_perf_report_enabled
     profile.generate_colored_logs_enabled = state.generate_colored_logs_enabled
+    profile.log_search_index_enabled = state.log_search_index_enabled
+    profile.log_paging_enabled = state.log_paging_enabled
 
     profile.save(path)
 
@@ -1752,12 +2683,25 @@ def _load_profile_from_path(state: UIState, path: Path) -> None:
         # Load bulk action states (with defaults if missing in old profiles)
         state.move_logs_enabled = getattr(profile, "move_logs_enabled", True)
         state.move_csv_enabled = getattr(profile, "move_csv_enabled", True)
+        state.incremental_sync_enabled = getattr(
+            profile, "incremental_sync_enabled", False
+        )
+        state.compressed_transfer_enabled = getattr(
+            profile, "compressed_transfer_enabled", False
+        )
+        state.device_log_filter_enabled = getattr(
+            profile, "device_log_filter_enabled", False
+        )
         state.generate_perf_report_enabled = getattr(
             profile, "generate_perf_report_enabled", True
         )
         state.generate_colored_logs_enabled = getattr(
             profile, "generate_colored_logs_enabled", True
         )
+        state.log_search_index_enabled = getattr(
+            profile, "log_search_index_enabled", False
+        )
+        state.log_paging_enabled = getattr(profile, "log_paging_enabled", False)
 
         # Update UI elements
         if dpg.does_item_exist("package_input"):
@@ -1785,10 +2729,20 @@ def _load_profile_from_path(state: UIState, path: Path) -> None:
             dpg.set_value("cb_move_logs", state.move_logs_enabled)
         if dpg.does_item_exist("cb_move_csv"):
             dpg.set_value("cb_move_csv", state.move_csv_enabled)
+        if dpg.does_item_exist("cb_incremental_sync"):
+            dpg.set_value("cb_incremental_sync", state.incremental_sync_enabled)
+        if dpg.does_item_exist("cb_compressed_transfer"):
+            dpg.set_value("cb_compressed_transfer", state.compressed_transfer_enabled)
+        if dpg.does_item_exist("cb_device_log_filter"):
+            dpg.set_value("cb_device_log_filter", state.device_log_filter_enabled)
         if dpg.does_item_exist("cb_gen_perf"):
             dpg.set_value("cb_gen_perf", state.generate_perf_report_enabled)
         if dpg.does_item_exist("cb_gen_logs"):
             dpg.set_value("cb_gen_logs", state.generate_colored_logs_enabled)
+        if dpg.does_item_exist("cb_log_search_index"):
+            dpg.set_value("cb_log_search_index", state.log_search_index_enabled)
+        if dpg.does_item_exist("cb_log_paging"):
+            dpg.set_value("cb_log_paging", state.log_paging_enabled)
 
         _update_profile_display_colors(state)
 
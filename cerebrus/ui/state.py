@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import queue
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List
 
+from cerebrus.core.console import ConsoleCommandQueues
 from cerebrus.core.devices import DeviceInfo
-from cerebrus.core.profile import ProfileManager
+from cerebrus.core.liveness import PackageLiveness, PackageLivenessPoller
+from cerebrus.core.profile import (
+    ADB_BACKEND_PROCESS,
+    ADB_BACKEND_SERVER,
+    ProfileManager,
+)
+from cerebrus.core.transfer import TransferProgress
+from cerebrus.tools.adb import AdbClient
+from cerebrus.tools.adb_async import AsyncAdbClient
+from cerebrus.tools.adb_server import AdbServerClient
+from cerebrus.tools.logcat import LogcatStreamer
 
 
 @dataclass
@@ -17,6 +29,18 @@ class UIState:
     profile_path: Path = Path("/complete/path/to/profile")
     devices: List[DeviceInfo] = field(default_factory=list)
     selected_device_serial: str | None = None
+    # Devices ticked for parallel bulk moves
+    bulk_device_serials: set[str] = field(default_factory=set)
+    transfer_progress: TransferProgress | None = None
+    # Latest package PIDs per serial, published by the liveness poller
+    package_liveness: Dict[str, PackageLiveness] = field(default_factory=dict)
+    liveness_poller: PackageLivenessPoller | None = None
+    # Devices with a CsvProfile capture started from this session
+    profiling_serials: set[str] = field(default_factory=set)
+    # Per-device console command queues, created on first use
+    console_queues: ConsoleCommandQueues | None = None
+    # Live logcat captures keyed by serial
+    logcat_streamers: Dict[str, LogcatStreamer] = field(default_factory=dict)
     copy_directory: Path = Path("/path/to/copy")
     date_string: str = "2024-01-01"
     device_cell_tags: list[list[str]] = field(default_factory=list)
@@ -27,6 +51,19 @@ class UIState:
     logs: list[tuple[str, str, str]] = field(default_factory=list)
     log_filter: str = ""
     profile_manager: ProfileManager = field(default_factory=ProfileManager)
+    # Saved in the global config; a change applies on the next start.
+    adb_backend: str = ADB_BACKEND_PROCESS
+    # Shared across UI actions so per-device adb shell sessions are reused.
+    # CerebrusApp replaces it to match the saved adb backend at startup.
+    adb_client: AdbClient = field(
+        default_factory=lambda: AdbClient(persistent_sessions=True)
+    )
+    # List Devices probes every device at once from one event loop
+    async_adb_client: AsyncAdbClient = field(default_factory=AsyncAdbClient)
+    # Work posted by background threads, run on the UI thread each frame
+    ui_tasks: queue.SimpleQueue[Callable[[], None]] = field(
+        default_factory=queue.SimpleQueue
+    )
     base_output_path: Path | None = (
         None  # Store the original path without device appended
     )
@@ -34,5 +71,18 @@ class UIState:
     # Bulk Action States
     move_logs_enabled: bool = True
     move_csv_enabled: bool = True
+    incremental_sync_enabled: bool = False
+    compressed_transfer_enabled: bool = False
+    device_log_filter_enabled: bool = False
     generate_perf_report_enabled: bool = True
     generate_colored_logs_enabled: bool = True
+    log_search_index_enabled: bool = False
+    log_paging_enabled: bool = False
+    log_conversion_running: bool = False
+
+
+def create_adb_client(backend: str) -> AdbClient:
+    """The client for an adb backend setting (see ``cerebrus.core.profile``)."""
+    if backend == ADB_BACKEND_SERVER:
+        return AdbServerClient()
+    return AdbClient(persistent_sessions=True)
@@ -0,0 +1,86 @@
+"""Compare detect_log_level against the old one-search-per-pattern loop.
+
+Usage: python scripts/benchmark_log_classifier.py [LOG ...] [--repeat N]
+
+Without arguments the sample log in tests/data is used. The script fails if
+the two classifiers disagree on any line.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from cerebrus.tools.log_to_html import LOG_PATTERNS, detect_log_level  # noqa: E402
+
+
+def detect_log_level_per_pattern(line):
+    """The classifier as it was: one ``re.search`` per pattern, in order."""
+    for level, (pattern, _) in LOG_PATTERNS.items():
+        if re.search(pattern, line):
+            return level.lower()
+    return "info"
+
+
+def best_time(classify, lines, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            classify(line)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "logs",
+        nargs="*",
+        type=Path,
+        default=[project_root / "tests" / "data" / "ue_sample.log"],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-lines",
+        type=int,
+        default=200_000,
+        help="Repeat small inputs until at least this many lines are timed.",
+    )
+    args = parser.parse_args()
+
+    lines = []
+    for log in args.logs:
+        with open(log, "r", encoding="utf-8", errors="replace") as f:
+            lines.extend(line.rstrip("\n\r") for line in f)
+    if not lines:
+        print("No lines to classify.")
+        return 1
+
+    mismatches = []
+    for line in lines:
+        old, new = detect_log_level_per_pattern(line), detect_log_level(line)
+        if old != new:
+            mismatches.append((line, old, new))
+    if mismatches:
+        for line, old, new in mismatches[:20]:
+            print(f"MISMATCH {old} -> {new}: {line}")
+        print(f"{len(mismatches)} of {len(lines)} lines classified differently.")
+        return 1
+
+    timed = lines * max(1, -(-args.min_lines // len(lines)))
+    old = best_time(detect_log_level_per_pattern, timed, args.repeat)
+    new = best_time(detect_log_level, timed, args.repeat)
+    print(f"{len(lines)} lines classified identically; timing {len(timed)} lines")
+    print(f"per-pattern search: {old:.3f}s ({old / len(timed) * 1e6:.2f} us/line)")
+    print(f"single scan:        {new:.3f}s ({new / len(timed) * 1e6:.2f} us/line)")
+    print(f"speedup:            {old / new:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from cerebrus.core.console import (
+    DEFAULT_MAX_BATCH,
+    DEFAULT_MIN_INTERVAL,
+    ConsoleCommandQueue,
+)
+from cerebrus.tools.adb import AdbDeviceOfflineError
+
+
+class FakeAdbClient:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.sent_at: list[float] = []
+        self.release = threading.Event()
+        self.release.set()
+        self.fail = False
+
+    def send_console_commands(self, serial: str, commands: list[str]) -> None:
+        self.release.wait(2)
+        self.batches.append(list(commands))
+        self.sent_at.append(time.monotonic())
+        if self.fail:
+            raise AdbDeviceOfflineError("device offline")
+
+
+def test_queued_commands_share_round_trips_in_order() -> None:
+    client = FakeAdbClient()
+    client.release.clear()
+    console = ConsoleCommandQueue(client, "abc", linger=0)  # type: ignore[arg-type]
+
+    first = console.submit("stat unit")
+    rest = console.submit_many([f"r.Cvar{index} 1" for index in range(6)])
+    last = console.submit("CsvProfile Start")
+    client.release.set()
+    last.result(2)
+    console.close()
+
+    assert first.done() and all(future.done() for future in rest)
+    flat = [command for batch in client.batches for command in batch]
+    assert flat[0] == "stat unit" and flat[-1] == "CsvProfile Start"
+    assert flat[1:-1] == [f"r.Cvar{index} 1" for index in range(6)]
+    # Everything queued while a call was in flight went out in one go.
+    assert len(client.batches) <= 2
+
+
+def test_round_trips_are_rate_limited() -> None:
+    client = FakeAdbClient()
+    console = ConsoleCommandQueue(client, "abc", min_interval=0.1, linger=0)  # type: ignore[arg-type]
+
+    console.submit("a").result(2)
+    console.submit("b").result(2)
+    console.close()
+
+    assert client.sent_at[1] - client.sent_at[0] >= 0.09
+
+
+def test_long_scripts_are_split_and_paced_by_default() -> None:
+    client = FakeAdbClient()
+    client.release.clear()
+    console = ConsoleCommandQueue(client, "abc", linger=0)  # type: ignore[arg-type]
+
+    futures = console.submit_many([f"r.Cvar{index} 1" for index in range(20)])
+    client.release.set()
+    futures[-1].result(5)
+    console.close()
+
+    assert all(len(batch) <= DEFAULT_MAX_BATCH for batch in client.batches)
+    gaps = [b - a for a, b in zip(client.sent_at, client.sent_at[1:])]
+    assert gaps and min(gaps) >= DEFAULT_MIN_INTERVAL * 0.9
+
+
+def test_failed_batch_fails_its_futures() -> None:
+    client = FakeAdbClient()
+    client.fail = True
+    console = ConsoleCommandQueue(client, "abc")  # type: ignore[arg-type]
+
+    future = console.submit("stat unit")
+
+    with pytest.raises(AdbDeviceOfflineError):
+        future.result(2)
+    console.close()
+    with pytest.raises(RuntimeError):
+        console.submit("stat fps")
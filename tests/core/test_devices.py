@@ -1,7 +1,24 @@
 from __future__ import annotations
 
-from cerebrus.core.devices import DeviceInfo, collect_device_info
-from cerebrus.tools.adb import AdbError
+import asyncio
+import threading
+import time
+
+from cerebrus.core import devices as devices_module
+from cerebrus.core.devices import (
+    DEVICE_STATUS_ONLINE,
+    DEVICE_STATUS_UNRESPONSIVE,
+    DeviceInfo,
+    collect_device_info,
+    collect_device_info_async,
+    device_folder_names,
+)
+from cerebrus.tools.adb import (
+    AdbDeviceOfflineError,
+    AdbError,
+    AdbTimeoutError,
+    remaining_timeout,
+)
 
 
 class FakeAdbClient:
@@ -9,15 +26,18 @@ class FakeAdbClient:
         self.installed_packages = installed_packages or set()
         self.properties: dict[tuple[str, str], str] = {}
         self.serials: list[str] = []
+        self.property_calls: list[str] = []
 
     def list_devices(self) -> list[str]:
         return list(self.serials)
 
-    def get_property(self, serial: str, prop: str) -> str:
-        key = (serial, prop)
-        if key not in self.properties:
-            raise AdbError(f"missing {prop}")
-        return self.properties[key]
+    def get_properties(self, serial: str) -> dict[str, str]:
+        self.property_calls.append(serial)
+        return {
+            prop: value
+            for (prop_serial, prop), value in self.properties.items()
+            if prop_serial == serial
+        }
 
     def is_package_installed(self, serial: str, package_name: str) -> bool:
         return package_name in self.installed_packages
@@ -43,6 +63,9 @@ def test_collect_device_info_returns_entries_for_serials() -> None:
         DeviceInfo("Google", "Pixel", "abc", "14", "34", True),
         DeviceInfo("Samsung", "Galaxy", "def", "13", "33", True),
     ]
+    assert client.property_calls == ["abc", "def"]
+    assert devices[0].get_property("ro.build.version.sdk") == "34"
+    assert devices[0].get_property("ro.product.cpu.abi") == "Unknown"
 
 
 def test_collect_device_info_handles_missing_properties() -> None:
@@ -67,3 +90,137 @@ def test_collect_device_info_returns_empty_when_listing_fails() -> None:
     devices = collect_device_info("com.app", adb_client=FailingClient())
 
     assert devices == []
+
+
+def test_collect_device_info_marks_unknown_when_getprop_fails() -> None:
+    class NoPropsClient(FakeAdbClient):
+        def get_properties(self, serial: str) -> dict[str, str]:
+            raise AdbError("getprop failed")
+
+    client = NoPropsClient(installed_packages={"com.test.app"})
+    client.serials = ["abc"]
+
+    devices = collect_device_info("com.test.app", adb_client=client)
+
+    assert devices == [
+        DeviceInfo("Unknown", "Unknown", "abc", "Unknown", "Unknown", True)
+    ]
+
+
+def test_collect_device_info_reports_slow_device_as_unresponsive() -> None:
+    release = threading.Event()
+
+    class StallingClient(FakeAdbClient):
+        def get_properties(self, serial: str) -> dict[str, str]:
+            if serial == "slow":
+                release.wait(5)
+            return super().get_properties(serial)
+
+    client = StallingClient(installed_packages={"com.test.app"})
+    client.serials = ["slow", "abc"]
+    client.properties = {("abc", "ro.product.model"): "Pixel"}
+
+    try:
+        devices = collect_device_info(
+            "com.test.app", adb_client=client, device_timeout=0.2
+        )
+    finally:
+        release.set()
+
+    assert [device.serial for device in devices] == ["slow", "abc"]
+    assert devices[0].status == DEVICE_STATUS_UNRESPONSIVE
+    assert devices[0].package_found is False
+    assert devices[1].status == DEVICE_STATUS_ONLINE
+    assert devices[1].model == "Pixel"
+
+
+def test_collect_device_info_reports_probe_deadline_as_unresponsive(
+    monkeypatch,
+) -> None:
+    release = threading.Event()
+
+    class HangingGetpropClient(FakeAdbClient):
+        def get_properties(self, serial: str) -> dict[str, str]:
+            # Like AdbClient: wait no longer than the operation deadline.
+            if serial == "slow" and not release.wait(remaining_timeout(5.0)):
+                raise AdbTimeoutError("getprop timed out")
+            return super().get_properties(serial)
+
+    # Leave it to the probe's own deadline, not the collector's polling.
+    monkeypatch.setattr(devices_module, "_DEADLINE_POLL_INTERVAL", 5.0)
+    client = HangingGetpropClient(installed_packages={"com.test.app"})
+    client.serials = ["slow", "abc"]
+
+    try:
+        devices = collect_device_info(
+            "com.test.app", adb_client=client, device_timeout=0.2
+        )
+    finally:
+        release.set()
+
+    assert [(device.serial, device.status) for device in devices] == [
+        ("slow", DEVICE_STATUS_UNRESPONSIVE),
+        ("abc", DEVICE_STATUS_ONLINE),
+    ]
+
+
+def test_collect_device_info_probes_devices_concurrently() -> None:
+    class SlowClient(FakeAdbClient):
+        def get_properties(self, serial: str) -> dict[str, str]:
+            time.sleep(0.2)
+            return super().get_properties(serial)
+
+    client = SlowClient()
+    client.serials = [f"serial-{index}" for index in range(5)]
+
+    start = time.monotonic()
+    devices = collect_device_info("com.test.app", adb_client=client, max_workers=5)
+    elapsed = time.monotonic() - start
+
+    assert len(devices) == 5
+    assert elapsed < 0.8
+
+
+def test_collect_device_info_async_marks_timeouts_unresponsive() -> None:
+    class FakeAsyncAdbClient:
+        async def list_devices(self) -> list[str]:
+            return ["slow", "abc", "gone"]
+
+        async def get_properties(self, serial: str) -> dict[str, str]:
+            if serial == "slow":
+                await asyncio.sleep(5)
+            if serial == "gone":
+                raise AdbDeviceOfflineError("device offline")
+            return {"ro.product.manufacturer": "Google"}
+
+        async def is_package_installed(self, serial: str, package_name: str) -> bool:
+            return True
+
+    devices = asyncio.run(
+        collect_device_info_async(
+            "com.test.app",
+            adb_client=FakeAsyncAdbClient(),  # type: ignore[arg-type]
+            device_timeout=0.1,
+        )
+    )
+
+    assert [(device.serial, device.status) for device in devices] == [
+        ("slow", DEVICE_STATUS_UNRESPONSIVE),
+        ("abc", DEVICE_STATUS_ONLINE),
+        ("gone", DEVICE_STATUS_UNRESPONSIVE),
+    ]
+    assert devices[1].make == "Google"
+
+
+def test_device_folder_names_disambiguate_identical_models() -> None:
+    devices = [
+        DeviceInfo("Google", "Pixel 8", "a1", "14", "34", True),
+        DeviceInfo("Google", "Pixel 8", "b2", "14", "34", True),
+        DeviceInfo("Samsung", "S24", "c3", "14", "34", True),
+    ]
+
+    assert device_folder_names(devices) == {
+        "a1": "Google_Pixel 8_a1",
+        "b2": "Google_Pixel 8_b2",
+        "c3": "Samsung_S24",
+    }
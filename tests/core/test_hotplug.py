@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import queue
+import threading
+
+from cerebrus.core.devices import DeviceInfo
+from cerebrus.core.hotplug import (
+    EVENT_ADDED,
+    EVENT_CHANGED,
+    EVENT_REMOVED,
+    DeviceEvent,
+    DeviceWatcher,
+    diff_device_states,
+)
+from cerebrus.tools.adb import AdbError, remaining_timeout
+
+
+class FakeTracker:
+    def __init__(self, snapshots: list[dict[str, str]]) -> None:
+        self._snapshots: queue.Queue[dict[str, str] | None] = queue.Queue()
+        for snapshot in snapshots:
+            self._snapshots.put(snapshot)
+
+    def next_snapshot(self) -> dict[str, str]:
+        snapshot = self._snapshots.get()
+        if snapshot is None:
+            raise AdbError("tracker closed")
+        return snapshot
+
+    def close(self) -> None:
+        self._snapshots.put(None)
+
+
+class FakeServer:
+    def __init__(self, tracker: FakeTracker) -> None:
+        self.tracker = tracker
+
+    def track_devices(self) -> FakeTracker:
+        return self.tracker
+
+
+class FakeAdbClient:
+    def __init__(self) -> None:
+        self.probed: list[str] = []
+        self.forgotten: list[str] = []
+
+    def get_properties(self, serial: str) -> dict[str, str]:
+        self.probed.append(serial)
+        return {"ro.product.model": f"Model-{serial}"}
+
+    def is_package_installed(self, serial: str, package_name: str) -> bool:
+        return True
+
+    def forget_device(self, serial: str) -> None:
+        self.forgotten.append(serial)
+
+    def invalidate_packages(self, serial: str | None = None) -> None:
+        pass
+
+
+def test_diff_device_states_reports_each_kind() -> None:
+    previous = {"a": "device", "b": "offline", "c": "device"}
+    current = {"a": "device", "b": "device", "d": "unauthorized"}
+
+    assert diff_device_states(previous, current) == [
+        DeviceEvent(EVENT_CHANGED, "b", "device"),
+        DeviceEvent(EVENT_ADDED, "d", "unauthorized"),
+        DeviceEvent(EVENT_REMOVED, "c", "device"),
+    ]
+
+
+def test_watcher_probes_only_changed_devices() -> None:
+    tracker = FakeTracker(
+        [
+            {"a": "device"},
+            {"a": "device", "b": "unauthorized"},
+            {"b": "device"},
+        ]
+    )
+    client = FakeAdbClient()
+    changes: list[tuple[str, DeviceInfo | None]] = []
+    done = threading.Event()
+
+    def on_change(serial: str, device: DeviceInfo | None) -> None:
+        changes.append((serial, device))
+        if len(changes) == 4:
+            done.set()
+
+    watcher = DeviceWatcher(
+        adb_client=client,  # type: ignore[arg-type]
+        package_name=lambda: "com.test.app",
+        on_change=on_change,
+        server=FakeServer(tracker),  # type: ignore[arg-type]
+    )
+    watcher.start()
+    assert done.wait(2)
+    watcher.stop()
+
+    assert client.probed == ["a", "b"]
+    assert client.forgotten == ["a"]
+    assert [(serial, device and device.status) for serial, device in changes] == [
+        ("a", "online"),
+        ("b", "unauthorized"),
+        ("b", "online"),
+        ("a", None),
+    ]
+
+
+def test_hung_probe_is_reported_unresponsive_within_the_deadline() -> None:
+    release = threading.Event()
+
+    class HungClient(FakeAdbClient):
+        def get_properties(self, serial: str) -> dict[str, str]:
+            if serial == "hung":
+                # A real adb call would be killed at the operation deadline.
+                release.wait(remaining_timeout(None))
+                remaining_timeout(None)
+            return super().get_properties(serial)
+
+    tracker = FakeTracker([{"hung": "device"}, {"hung": "device", "b": "device"}])
+    client = HungClient()
+    changes: list[tuple[str, DeviceInfo | None]] = []
+    done = threading.Event()
+
+    def on_change(serial: str, device: DeviceInfo | None) -> None:
+        changes.append((serial, device))
+        if len(changes) == 2:
+            done.set()
+
+    watcher = DeviceWatcher(
+        adb_client=client,  # type: ignore[arg-type]
+        package_name=lambda: "com.test.app",
+        on_change=on_change,
+        server=FakeServer(tracker),  # type: ignore[arg-type]
+        device_timeout=0.2,
+    )
+    watcher.start()
+    try:
+        assert done.wait(2)
+    finally:
+        release.set()
+        watcher.stop()
+
+    assert [(serial, device and device.status) for serial, device in changes] == [
+        ("hung", "unresponsive"),
+        ("b", "online"),
+    ]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from cerebrus.core.liveness import PackageLiveness, PackageLivenessPoller
+from cerebrus.tools.adb import AdbTimeoutError
+
+
+class FakeAdbClient:
+    def __init__(self) -> None:
+        self.pids: dict[str, list[int]] = {}
+        self.failing: set[str] = set()
+        self.calls: list[str] = []
+
+    def package_pids(self, serial: str, package_name: str) -> list[int]:
+        self.calls.append(serial)
+        if serial in self.failing:
+            raise AdbTimeoutError("timed out")
+        return self.pids.get(serial, [])
+
+
+def make_poller(
+    client: FakeAdbClient, serials: list[str]
+) -> tuple[PackageLivenessPoller, list[tuple[object, object]]]:
+    changes: list[tuple[object, object]] = []
+    poller = PackageLivenessPoller(
+        client,  # type: ignore[arg-type]
+        package_name=lambda: "com.foo",
+        serials=lambda: serials,
+        on_change=lambda current, previous: changes.append((current, previous)),
+        min_interval=1.0,
+        max_interval=8.0,
+    )
+    return poller, changes
+
+
+def test_publishes_pid_changes_and_removed_devices() -> None:
+    client = FakeAdbClient()
+    client.pids = {"abc": [100], "def": []}
+    serials = ["abc", "def"]
+    poller, changes = make_poller(client, serials)
+
+    poller.poll_once()
+    assert poller.get("abc") == PackageLiveness("abc", "com.foo", (100,))
+    assert poller.get("def") is not None and not poller.get("def").running  # type: ignore[union-attr]
+    assert len(changes) == 2
+
+    changes.clear()
+    client.pids["abc"] = []  # crashed
+    poller.poke()
+    poller.poll_once()
+    assert changes == [
+        (
+            PackageLiveness("abc", "com.foo", ()),
+            PackageLiveness("abc", "com.foo", (100,)),
+        )
+    ]
+
+    changes.clear()
+    serials.remove("def")
+    poller.poll_once()
+    assert changes == [(None, PackageLiveness("def", "com.foo", ()))]
+    assert set(poller.snapshot()) == {"abc"}
+
+
+def test_interval_grows_while_idle_and_backs_off_on_errors() -> None:
+    client = FakeAdbClient()
+    client.pids = {"abc": [100]}
+    poller, _ = make_poller(client, ["abc"])
+
+    waits = [round(poller.poll_once())]
+    for _ in range(3):
+        poller._schedule["abc"].due = 0.0  # skip the wait
+        waits.append(round(poller.poll_once()))
+    assert waits == [2, 4, 8, 8]
+
+    client.failing.add("abc")
+    poller._schedule["abc"].due = 0.0
+    assert round(poller.poll_once()) == 16
+    liveness = poller.get("abc")
+    assert liveness is not None and liveness.error is not None
+    # The last known PIDs are kept while the device does not answer.
+    assert liveness.pids == (100,)
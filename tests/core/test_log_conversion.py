@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from cerebrus.core import log_conversion
+from cerebrus.core.log_conversion import LogConversion, convert_logs
+
+
+def test_convert_logs_removes_only_successfully_converted_sources(
+    tmp_path: Path,
+) -> None:
+    logs = tmp_path / "Logs"
+    logs.mkdir()
+    small = logs / "Small.log"
+    small.write_text("LogTemp: one\n")
+    large = logs / "Large.log"
+    large.write_text("LogNet: Warning: lag\n" * 500)
+    stuck = logs / "Stuck.log"
+    stuck.write_text("LogInit: boot\n")
+    jobs = [
+        (small, tmp_path / "Small.html"),
+        (large, tmp_path / "Large.html"),
+        (stuck, tmp_path / "missing" / "Stuck.html"),  # output dir is missing
+    ]
+    finished: list[LogConversion] = []
+
+    results = convert_logs(jobs, remove_sources=True, on_done=finished.append)
+
+    assert [(r.source, r.output) for r in results] == jobs
+    assert [r.ok for r in results] == [True, True, False]
+    assert sorted(r.source for r in finished) == sorted(source for source, _ in jobs)
+    assert "log-warning" in (tmp_path / "Large.html").read_text(encoding="utf-8")
+    assert not small.exists() and not large.exists()
+    assert stuck.exists()
+    assert results[2].error
+
+
+def test_convert_logs_can_write_paged_logs(tmp_path: Path) -> None:
+    source = tmp_path / "Game.log"
+    source.write_text("".join(f"LogTemp: line {n}\n" for n in range(25)))
+    output = tmp_path / "Game.html"
+
+    (result,) = convert_logs([(source, output)], page_lines=10)
+
+    assert result.ok
+    pages = sorted(path.name for path in (tmp_path / "Game_pages").iterdir())
+    assert pages == ["page-0001.html", "page-0002.html", "page-0003.html"]
+    index = output.read_text(encoding="utf-8")
+    assert '"lines": 25' in index and "Game_pages/page-0003.html" in index
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """In-process pool that records ``(log name, workers)`` per submission."""
+
+    submitted: list[tuple[str, int]] = []
+
+    def submit(self, fn, source, output, search_index, workers, page_lines):  # type: ignore[override]
+        self.submitted.append((source.name, workers))
+        return super().submit(fn, source, output, search_index, workers, page_lines)
+
+
+def test_huge_logs_run_after_the_small_ones_on_every_core(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(log_conversion, "PARALLEL_MIN_BYTES", 4096)
+    monkeypatch.setattr(log_conversion, "ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(RecordingExecutor, "submitted", [])
+    monkeypatch.setattr(log_conversion.os, "cpu_count", lambda: 4)
+    huge = tmp_path / "Huge.log"
+    huge.write_text("LogNet: Warning: lag\n" * 1000)
+    small = [tmp_path / f"Small{n}.log" for n in range(3)]
+    for path in small:
+        path.write_text("LogTemp: one\n")
+    jobs = [(path, path.with_suffix(".html")) for path in [huge, *small]]
+
+    results = convert_logs(jobs, max_workers=2)
+
+    assert all(result.ok for result in results)
+    assert RecordingExecutor.submitted[-1] == ("Huge.log", 4)
+    assert all(workers == 1 for _, workers in RecordingExecutor.submitted[:-1])
+    html = (tmp_path / "Huge.html").read_text(encoding="utf-8")
+    assert html.count("LogNet: Warning: lag") == 1000
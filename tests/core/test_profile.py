@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from cerebrus.core import profile
+from cerebrus.core.profile import (
+    ADB_BACKEND_PROCESS,
+    ADB_BACKEND_SERVER,
+    ProfileManager,
+)
+
+
+def test_adb_backend_setting_round_trips(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(profile, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(profile, "CONFIG_FILE", tmp_path / "config.json")
+    manager = ProfileManager()
+
+    assert manager.get_adb_backend() == ADB_BACKEND_PROCESS
+    manager.set_last_used_profile_path(None)
+    manager.set_adb_backend(ADB_BACKEND_SERVER)
+
+    assert ProfileManager().get_adb_backend() == ADB_BACKEND_SERVER
+    with pytest.raises(ValueError):
+        manager.set_adb_backend("telnet")
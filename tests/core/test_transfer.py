@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import io
+import re
+import shlex
+import tarfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from cerebrus.core import transfer
+from cerebrus.core.transfer import (
+    MANIFEST_NAME,
+    DeviceTransfer,
+    LogFilter,
+    RemoteFile,
+    TransferProgress,
+    filter_device_logs,
+    parse_stat_listing,
+    sync_device_folder,
+    sync_devices,
+)
+from cerebrus.tools.adb import AdbCommandError
+
+REMOTE = "/sdcard/Saved/Logs"
+
+
+class FakeAdbClient:
+    """Device folder held in memory: ``{relative path: (content, mtime)}``."""
+
+    def __init__(self, files: dict[str, tuple[bytes, int]]) -> None:
+        self.files = files
+        self.pulls: list[str] = []
+        self.resumable_pulls: list[str] = []
+        self.shell_calls: list[list[str]] = []
+        self.truncate_on_pull: set[str] = set()
+        self.unreadable: set[str] = set()  # tar skips them and pull fails
+        self.tar_supported = True
+        self.exec_commands: list[str] = []
+
+    def shell(self, serial: str, command: list[str]) -> str:
+        self.shell_calls.append(command)
+        if command[0] == "find":
+            return "".join(
+                f"{len(content)} {mtime} {REMOTE}/{path}\n"
+                for path, (content, mtime) in self.files.items()
+            )
+        if command[:2] == ["rm", "-f"]:
+            for quoted in command[2:]:
+                (path,) = shlex.split(quoted)
+                self.files.pop(path[len(REMOTE) + 1 :], None)
+            return ""
+        raise AssertionError(f"unexpected command {command}")
+
+    @contextmanager
+    def exec_out(self, serial: str, command: str) -> Iterator[io.BytesIO]:
+        self.exec_commands.append(command)
+        if command.startswith("grep "):
+            # grep -E -C <n> -e <pattern>... <path> 2>/dev/null; printf <status>
+            args = shlex.split(command.split(" 2>/dev/null")[0])
+            patterns = [args[i + 1] for i, arg in enumerate(args) if arg == "-e"]
+            path = args[-1][len(REMOTE) + 1 :]
+            if path in self.unreadable:
+                yield io.BytesIO(b"\n__CEREBRUS_GREP_STATUS__ 2\n")
+                return
+            content = self.files[path][0].decode()
+            kept = [
+                line
+                for line in content.splitlines(keepends=True)
+                if any(re.search(pattern, line) for pattern in patterns)
+            ]
+            status = 0 if kept else 1
+            trailer = f"\n__CEREBRUS_GREP_STATUS__ {status}\n"
+            yield io.BytesIO("".join(kept + [trailer]).encode())
+            return
+        if not self.tar_supported:
+            yield io.BytesIO(b"tar: Unknown option 'z'\n")
+            return
+        # tar -czf - -C <dir> <members...> 2>/dev/null
+        members = shlex.split(command)[5:-1]
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            for member in members:
+                if member in self.unreadable:
+                    continue
+                content = self.files[member][0]
+                info = tarfile.TarInfo(f"./{member}")
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+        buffer.seek(0)
+        yield buffer
+
+    def pull(self, serial: str, source: str, destination: str) -> None:
+        relative = source[len(REMOTE) + 1 :]
+        self.pulls.append(relative)
+        if relative not in self.files:
+            raise AdbCommandError(f"remote object '{source}' does not exist", 1)
+        if relative in self.unreadable:
+            raise AdbCommandError(f"'{source}': Permission denied", 1)
+        content = self.files[relative][0]
+        if relative in self.truncate_on_pull:
+            content = content[:-1]
+        Path(destination).write_bytes(content)
+
+    def pull_resumable(self, serial: str, source: str, destination: str) -> None:
+        relative = source[len(REMOTE) + 1 :]
+        self.resumable_pulls.append(relative)
+        Path(destination).write_bytes(self.files[relative][0])
+
+
+def test_parse_stat_listing_keeps_spaces_in_names() -> None:
+    output = (
+        f"12 1700000000 {REMOTE}/Game.log\n"
+        f"3 1700000001 {REMOTE}/Crash Dumps/dump 1.txt\n"
+        "stat: /sdcard/Saved/Logs/gone: No such file\n"
+    )
+
+    assert parse_stat_listing(output, REMOTE) == [
+        RemoteFile("Game.log", 12, 1700000000),
+        RemoteFile("Crash Dumps/dump 1.txt", 3, 1700000001),
+    ]
+
+
+def test_sync_pulls_only_new_or_changed_files(tmp_path: Path) -> None:
+    client = FakeAdbClient({"Game.log": (b"first", 1), "Old.log": (b"old", 1)})
+    sync_device_folder(client, "abc", REMOTE, tmp_path, remove_verified=False)  # type: ignore[arg-type]
+
+    client.pulls.clear()
+    client.files["Game.log"] = (b"first and more", 2)
+    client.files["sub/New.log"] = (b"new", 3)
+    result = sync_device_folder(client, "abc", REMOTE, tmp_path)  # type: ignore[arg-type]
+
+    assert sorted(client.pulls) == ["Game.log", "sub/New.log"]
+    assert result.skipped == ["Old.log"]
+    assert (tmp_path / "sub" / "New.log").read_bytes() == b"new"
+    assert (tmp_path / MANIFEST_NAME).is_file()
+    assert client.files == {}
+
+
+def test_sync_keeps_unverified_files_on_device(tmp_path: Path) -> None:
+    client = FakeAdbClient({"Game.log": (b"growing", 1), "Done.log": (b"done", 1)})
+    client.truncate_on_pull.add("Game.log")
+
+    result = sync_device_folder(client, "abc", REMOTE, tmp_path)  # type: ignore[arg-type]
+
+    assert result.pulled == ["Done.log"]
+    assert set(result.failed) == {"Game.log"}
+    assert list(client.files) == ["Game.log"]
+
+
+def test_manifest_is_saved_in_batches_and_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(transfer, "_MANIFEST_SAVE_SECONDS", 3600.0)
+    saves: list[int] = []
+    save_manifest = transfer._save_manifest
+
+    def counting_save(path: Path, manifest: dict) -> None:
+        saves.append(len(manifest[f"abc:{REMOTE}"]))
+        save_manifest(path, manifest)
+
+    monkeypatch.setattr(transfer, "_save_manifest", counting_save)
+
+    class DyingClient(FakeAdbClient):
+        def pull(self, serial: str, source: str, destination: str) -> None:
+            if source.endswith("/250.csv"):
+                raise KeyboardInterrupt
+            super().pull(serial, source, destination)
+
+    client = DyingClient({f"{index}.csv": (b"a,b", 1) for index in range(300)})
+    with pytest.raises(KeyboardInterrupt):
+        sync_device_folder(client, "abc", REMOTE, tmp_path)  # type: ignore[arg-type]
+
+    assert saves == [100, 200, 250]
+    assert (
+        len(transfer._load_manifest(tmp_path / MANIFEST_NAME)[f"abc:{REMOTE}"]) == 250
+    )
+
+
+def test_compressed_sync_streams_changed_files(tmp_path: Path) -> None:
+    client = FakeAdbClient({"Game.log": (b"x" * 100, 1), "sub/Csv 1.csv": (b"a,b", 2)})
+
+    result = sync_device_folder(client, "abc", REMOTE, tmp_path, compressed=True)  # type: ignore[arg-type]
+
+    assert len(client.exec_commands) == 1
+    assert client.pulls == []
+    assert sorted(result.pulled) == ["Game.log", "sub/Csv 1.csv"]
+    assert (tmp_path / "sub" / "Csv 1.csv").read_bytes() == b"a,b"
+
+
+def test_compressed_sync_falls_back_to_pull(tmp_path: Path) -> None:
+    client = FakeAdbClient({"Game.log": (b"log", 1)})
+    client.tar_supported = False
+
+    result = sync_device_folder(client, "abc", REMOTE, tmp_path, compressed=True)  # type: ignore[arg-type]
+
+    assert client.pulls == ["Game.log"]
+    assert result.pulled == ["Game.log"]
+
+
+def test_full_compressed_move_removes_only_verified_files(tmp_path: Path) -> None:
+    client = FakeAdbClient({"Game.log": (b"log", 1), "Locked.log": (b"secret", 1)})
+    client.unreadable.add("Locked.log")
+    sync_device_folder(client, "abc", REMOTE, tmp_path, remove_verified=False)  # type: ignore[arg-type]
+    client.exec_commands.clear()
+
+    result = sync_device_folder(
+        client, "abc", REMOTE, tmp_path, compressed=True, incremental=False  # type: ignore[arg-type]
+    )
+
+    assert len(client.exec_commands) == 1  # copied again despite the manifest
+    assert result.pulled == ["Game.log"] and result.removed == ["Game.log"]
+    assert set(result.failed) == {"Locked.log"}
+    assert list(client.files) == ["Locked.log"]
+
+
+def test_large_files_use_resumable_pulls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(transfer, "RESUMABLE_PULL_THRESHOLD", 10)
+    client = FakeAdbClient({"Trace.utrace": (b"x" * 10, 1), "Game.log": (b"log", 1)})
+
+    result = sync_device_folder(client, "abc", REMOTE, tmp_path, compressed=True)  # type: ignore[arg-type]
+
+    assert client.resumable_pulls == ["Trace.utrace"]
+    assert "Trace.utrace" not in client.exec_commands[0]
+    assert sorted(result.pulled) == ["Game.log", "Trace.utrace"]
+
+
+def test_filter_device_logs_copies_matching_lines_only(tmp_path: Path) -> None:
+    log = b"LogInit: start\nLogTemp: marker\nLogRHI: Error: lost\nLogInit: end\n"
+    client = FakeAdbClient({"Game.log": (log, 1), "dump.dmp": (b"\0", 1)})
+    log_filter = LogFilter(("LogTemp", "(Error|ERROR)"), context=2)
+
+    result = filter_device_logs(client, "abc", REMOTE, tmp_path, log_filter)  # type: ignore[arg-type]
+    again = filter_device_logs(client, "abc", REMOTE, tmp_path, log_filter)  # type: ignore[arg-type]
+
+    assert result.pulled == ["Game.log"] and again.skipped == ["Game.log"]
+    assert (tmp_path / "Game.filtered.log").read_bytes() == (
+        b"LogTemp: marker\nLogRHI: Error: lost\n"
+    )
+    assert "-C 2" in client.exec_commands[0]
+    assert len(client.exec_commands) == 1
+    # The originals stay on the device.
+    assert set(client.files) == {"Game.log", "dump.dmp"}
+    assert not any(call[0] == "rm" for call in client.shell_calls)
+
+
+def test_filter_device_logs_skips_logs_whose_copy_was_converted(
+    tmp_path: Path,
+) -> None:
+    client = FakeAdbClient({"Game.log": (b"LogTemp: marker\n", 1)})
+    log_filter = LogFilter(("LogTemp",), context=0)
+    filter_device_logs(client, "abc", REMOTE, tmp_path, log_filter)  # type: ignore[arg-type]
+    # Colored-log generation deletes the filtered copy once converted.
+    (tmp_path / "Game.filtered.log").unlink()
+
+    again = filter_device_logs(client, "abc", REMOTE, tmp_path, log_filter)  # type: ignore[arg-type]
+
+    assert again.skipped == ["Game.log"] and again.pulled == []
+    assert not (tmp_path / "Game.filtered.log").exists()
+    assert len(client.exec_commands) == 1
+
+
+def test_filter_device_logs_reports_grep_failures(tmp_path: Path) -> None:
+    client = FakeAdbClient(
+        {"Game.log": (b"LogTemp: marker\n", 1), "Quiet.log": (b"LogInit: ok\n", 1)}
+    )
+    client.unreadable.add("Game.log")
+    log_filter = LogFilter(("LogTemp",), context=0)
+
+    result = filter_device_logs(client, "abc", REMOTE, tmp_path, log_filter)  # type: ignore[arg-type]
+    client.unreadable.clear()
+    again = filter_device_logs(client, "abc", REMOTE, tmp_path, log_filter)  # type: ignore[arg-type]
+
+    assert "exit status 2" in result.failed["Game.log"]
+    # No match is not a failure; the failed log is filtered on the next run.
+    assert result.pulled == ["Quiet.log"]
+    assert (tmp_path / "Quiet.filtered.log").read_bytes() == b""
+    assert again.pulled == ["Game.log"] and again.skipped == ["Quiet.log"]
+    assert (tmp_path / "Game.filtered.log").read_bytes() == b"LogTemp: marker\n"
+
+
+def test_sync_devices_runs_devices_in_parallel(tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=2)
+
+    class BarrierClient(FakeAdbClient):
+        def shell(self, serial: str, command: list[str]) -> str:
+            if command[0] == "find":
+                # Both devices must be listing at the same time to get past here.
+                barrier.wait()
+            if command[0] == "rm":
+                return ""  # both "devices" share one file store
+            return super().shell(serial, command)
+
+    client = BarrierClient({"Game.log": (b"12345", 1)})
+    progress = TransferProgress(devices=2)
+    transfers = [
+        DeviceTransfer("abc", REMOTE, tmp_path / "Google_Pixel" / "Logs"),
+        DeviceTransfer("def", REMOTE, tmp_path / "Samsung_S24" / "Logs"),
+    ]
+
+    outcomes = sync_devices(client, transfers, progress=progress)  # type: ignore[arg-type]
+
+    assert set(outcomes) == {"abc", "def"}
+    assert (tmp_path / "Google_Pixel" / "Logs" / "Game.log").is_file()
+    assert progress.devices_done == 2
+    assert progress.fraction == 1.0
+
+
+def test_sync_devices_can_copy_everything_again(tmp_path: Path) -> None:
+    client = FakeAdbClient({"Game.log": (b"log", 1)})
+    local_dir = tmp_path / "Google_Pixel" / "Logs"
+    sync_device_folder(client, "abc", REMOTE, local_dir, remove_verified=False)  # type: ignore[arg-type]
+    client.pulls.clear()
+
+    outcomes = sync_devices(
+        client, [DeviceTransfer("abc", REMOTE, local_dir)], incremental=False  # type: ignore[arg-type]
+    )
+
+    ((_, result),) = outcomes["abc"]
+    assert client.pulls == ["Game.log"]
+    assert result.pulled == ["Game.log"] and result.removed == ["Game.log"]
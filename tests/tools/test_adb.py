@@ -1,54 +1,422 @@
 from __future__ import annotations
 
+import queue
+import re
 import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from cerebrus.tools.adb import AdbClient, AdbError
+from cerebrus.tools.adb import (
+    CONSOLE_BATCH_COMMANDS,
+    AdbClient,
+    AdbCommandError,
+    AdbDeviceOfflineError,
+    AdbError,
+    AdbTimeoutError,
+    RetryPolicy,
+    console_batch_args,
+    operation_deadline,
+    parse_getprop,
+)
 
 
-def _completed(
-    stdout: str, returncode: int = 0, stderr: str = ""
-) -> subprocess.CompletedProcess[str]:
-    return subprocess.CompletedProcess(
-        args=["adb"], returncode=returncode, stdout=stdout, stderr=stderr
-    )
+class FakePopen:
+    """Stand-in for a one-shot adb process."""
 
+    def __init__(
+        self,
+        stdout: str = "",
+        returncode: int = 0,
+        stderr: str = "",
+        hang: bool = False,
+    ) -> None:
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode = returncode
+        self.hang = hang
+        self.pid = 4242
+        self.timeouts: list[float | None] = []
 
-@patch("subprocess.run")
-def test_list_devices_parses_device_lines(run_mock: MagicMock) -> None:
-    run_mock.return_value = _completed(
-        "emulator-5554\tdevice\n012345\tunauthorized\nreal\tdevice"
-    )
+    def __call__(self, command: list[str], **kwargs: object) -> "FakePopen":
+        self.command = command
+        self.kwargs = kwargs
+        return self
 
-    client = AdbClient()
-    devices = client.list_devices()
+    def __enter__(self) -> "FakePopen":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def communicate(self, timeout: float | None = None) -> tuple[str, str]:
+        self.timeouts.append(timeout)
+        if self.hang:
+            raise subprocess.TimeoutExpired(self.command, timeout or 0)
+        return self.stdout, self.stderr
+
+    def wait(self) -> int:
+        return self.returncode
+
+
+def test_list_devices_parses_device_lines() -> None:
+    process = FakePopen("emulator-5554\tdevice\n012345\tunauthorized\nreal\tdevice")
+
+    with patch("subprocess.Popen", process):
+        devices = AdbClient().list_devices()
 
     assert devices == ["emulator-5554", "real"]
-    run_mock.assert_called_once_with(
-        ["adb", "devices"],
-        check=False,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+    assert process.command == ["adb", "devices"]
+    assert process.kwargs == {
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.PIPE,
+        "text": True,
+    }
+    assert process.timeouts == [10.0]
 
 
-@patch("subprocess.run")
-def test_get_property_raises_on_failure(run_mock: MagicMock) -> None:
-    run_mock.return_value = _completed("", returncode=1, stderr="boom")
+def test_get_property_raises_on_failure() -> None:
     client = AdbClient()
 
-    with pytest.raises(AdbError):
-        client.get_property("serial", "ro.product.model")
+    with patch("subprocess.Popen", FakePopen(returncode=1, stderr="boom")):
+        with pytest.raises(AdbCommandError, match="boom"):
+            client.get_property("serial", "ro.product.model")
+
+
+def test_offline_device_is_reported_and_retried() -> None:
+    process = FakePopen(returncode=1, stderr="error: device offline")
+    client = AdbClient(
+        retry_policies={"get_property": RetryPolicy(attempts=3, backoff=0)}
+    )
+
+    with patch("subprocess.Popen", process):
+        with pytest.raises(AdbDeviceOfflineError):
+            client.get_property("serial", "ro.product.model")
+
+    assert len(process.timeouts) == 3
+
+
+def test_timeout_kills_process_tree() -> None:
+    process = FakePopen(hang=True)
+
+    with patch("subprocess.Popen", process), patch(
+        "cerebrus.tools.adb.kill_process_tree"
+    ) as kill_mock:
+        client = AdbClient(retry_policies={"pull": RetryPolicy(timeout=600.0)})
+        with pytest.raises(AdbTimeoutError, match="timed out after 600s"):
+            client.pull("serial", "/sdcard/a", "a")
+
+    kill_mock.assert_called_once_with(4242)
+    # Bulk pulls are not capped unless a policy asks for it.
+    assert AdbClient().retry_policies["pull"].timeout is None
+
+
+def test_operation_deadline_caps_command_timeouts() -> None:
+    process = FakePopen("")
+
+    with patch("subprocess.Popen", process):
+        with operation_deadline(2.0):
+            AdbClient().shell("serial", ["ls"])
+        with operation_deadline(0):
+            with pytest.raises(AdbTimeoutError):
+                AdbClient().shell("serial", ["ls"])
+
+    assert len(process.timeouts) == 1
+    assert process.timeouts[0] is not None and process.timeouts[0] <= 2.0
 
 
-@patch("subprocess.run")
+def test_parse_getprop_reads_full_dump() -> None:
+    output = (
+        "[ro.product.model]: [Pixel 8]\n"
+        "[ro.build.fingerprint]: [google/shiba/shiba:14/AP1A/123:user/release-keys]\n"
+        "[persist.sys.motd]: [line one\nline two]\n"
+        "[ro.empty]: []\n"
+    )
+
+    assert parse_getprop(output) == {
+        "ro.product.model": "Pixel 8",
+        "ro.build.fingerprint": "google/shiba/shiba:14/AP1A/123:user/release-keys",
+        "persist.sys.motd": "line one\nline two",
+        "ro.empty": "",
+    }
+
+
+@patch("subprocess.Popen")
 def test_is_package_installed_short_circuits_for_empty_name(
-    run_mock: MagicMock,
+    popen_mock: MagicMock,
 ) -> None:
     client = AdbClient()
 
     assert client.is_package_installed("serial", "") is False
-    run_mock.assert_not_called()
+    popen_mock.assert_not_called()
+
+
+class FakeShellProcess:
+    """Stand-in for a long-lived ``adb shell`` process driven over stdin."""
+
+    def __init__(self, responses: dict[str, tuple[int, str]]) -> None:
+        self.responses = responses
+        self.commands: list[str] = []
+        self.written: list[bytes] = []
+        self.pid = 4242
+        self.returncode: int | None = None
+        self.stdin = self
+        self._output: queue.Queue[str | None] = queue.Queue()
+        self.stdout = (line.encode() for line in iter(self._output.get, None))
+        self._last_exit_code = 0
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        for line in data.decode().split("\n"):
+            command = re.fullmatch(r"\{ (.*); \} </dev/null", line)
+            marker = re.fullmatch(r"printf '\\n(\S+):%s\\n' \"\$\?\"", line)
+            if command:
+                self.commands.append(command.group(1))
+                code, output = self.responses.get(command.group(1), (127, "nope\n"))
+                self._last_exit_code = code
+                for chunk in output.splitlines(keepends=True):
+                    self._output.put(chunk)
+            elif marker:
+                self._output.put("\n")
+                self._output.put(f"{marker.group(1)}:{self._last_exit_code}\n")
+            elif line == "exit":
+                self.returncode = 0
+                self._output.put(None)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        self.returncode = 0
+        return 0
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+
+@patch("subprocess.Popen")
+def test_persistent_session_reuses_one_shell_per_device(popen_mock: MagicMock) -> None:
+    fake = FakeShellProcess(
+        {
+            "getprop ro.product.model": (0, "Pixel 8\n"),
+            "getprop ro.build.version.sdk": (0, "34\n"),
+            "pidof com.test.app": (0, "4242\n"),
+        }
+    )
+    popen_mock.return_value = fake
+    client = AdbClient(persistent_sessions=True)
+
+    assert client.get_property("abc", "ro.product.model") == "Pixel 8"
+    assert client.get_property("abc", "ro.build.version.sdk") == "34"
+    assert client.is_package_running("abc", "com.test.app") is True
+
+    popen_mock.assert_called_once()
+    assert popen_mock.call_args.args[0] == ["adb", "-s", "abc", "shell"]
+    assert fake.commands == [
+        "getprop ro.product.model",
+        "getprop ro.build.version.sdk",
+        "pidof com.test.app",
+    ]
+    client.close()
+    assert fake.returncode == 0
+
+
+@patch("subprocess.Popen")
+def test_persistent_session_writes_lf_only_bytes(popen_mock: MagicMock) -> None:
+    fake = FakeShellProcess({"getprop ro.product.model": (0, "Pixel 8\r\n")})
+    popen_mock.return_value = fake
+    client = AdbClient(persistent_sessions=True)
+
+    assert client.get_property("abc", "ro.product.model") == "Pixel 8"
+    client.close()
+
+    assert "text" not in popen_mock.call_args.kwargs
+    marker = re.search(rb"printf '\\n(\S+):", fake.written[0]).group(1)
+    assert fake.written == [
+        b"{ getprop ro.product.model; } </dev/null\n"
+        b"printf '\\n" + marker + b':%s\\n\' "$?"\n',
+        b"exit\n",
+    ]
+
+
+@patch("subprocess.Popen")
+def test_persistent_session_raises_on_non_zero_exit(popen_mock: MagicMock) -> None:
+    popen_mock.return_value = FakeShellProcess({"ls /missing": (1, "No such file\n")})
+    client = AdbClient(persistent_sessions=True)
+
+    with pytest.raises(AdbError, match="No such file"):
+        client.shell("abc", ["ls", "/missing"])
+    client.close()
+
+
+@patch("cerebrus.tools.adb.kill_process_tree")
+@patch("subprocess.Popen")
+def test_persistent_session_timeout_replaces_wedged_shell(
+    popen_mock: MagicMock, kill_mock: MagicMock
+) -> None:
+    wedged = FakeShellProcess({})
+    wedged.write = lambda data: None  # type: ignore[method-assign]
+    fresh = FakeShellProcess({"getprop ro.product.model": (0, "Pixel 8\n")})
+    popen_mock.side_effect = [wedged, fresh]
+    client = AdbClient(
+        persistent_sessions=True,
+        retry_policies={
+            "get_property": RetryPolicy(timeout=0.1, attempts=2, backoff=0)
+        },
+    )
+
+    assert client.get_property("abc", "ro.product.model") == "Pixel 8"
+    kill_mock.assert_called_once_with(4242)
+    client.close()
+
+
+@patch("subprocess.Popen")
+def test_busy_session_timeout_leaves_other_command_running(
+    popen_mock: MagicMock,
+) -> None:
+    fake = FakeShellProcess({"pidof com.test.app": (0, "4242\n")})
+    popen_mock.return_value = fake
+    client = AdbClient(
+        persistent_sessions=True,
+        retry_policies={"is_package_running": RetryPolicy(timeout=0.1)},
+    )
+    session = client._session("abc")
+
+    with session._lock:  # another thread's command is running
+        with pytest.raises(AdbTimeoutError, match="stayed busy"):
+            client.is_package_running("abc", "com.test.app")
+        assert fake.returncode is None
+        assert client._sessions["abc"] is session
+
+    assert client.is_package_running("abc", "com.test.app") is True
+    popen_mock.assert_called_once()
+    client.close()
+
+
+@pytest.fixture
+def shell_adb(tmp_path: Path) -> str:
+    """An ``adb`` stand-in that runs shell/exec-out commands in the local shell."""
+
+    if sys.platform == "win32":
+        pytest.skip("needs a POSIX shell")
+    script = tmp_path / "adb"
+    script.write_text('#!/bin/sh\nshift 3\nexec sh -c "$*"\n')
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_exec_out_streams_raw_stdout(shell_adb: str) -> None:
+    client = AdbClient(executable=shell_adb)
+
+    with client.exec_out("abc", "printf 'a\\000b'; printf tail") as stream:
+        # Leaving unread output behind is not an error.
+        assert stream.read(3) == b"a\x00b"
+
+
+def test_exec_out_kills_stream_after_timeout(shell_adb: str) -> None:
+    client = AdbClient(
+        executable=shell_adb, retry_policies={"exec_out": RetryPolicy(timeout=0.2)}
+    )
+
+    with pytest.raises(AdbTimeoutError):
+        with client.exec_out("abc", "sleep 5") as stream:
+            stream.read()
+
+
+def test_pull_resumable_continues_after_last_good_chunk(
+    shell_adb: str, tmp_path: Path
+) -> None:
+    source = tmp_path / "Trace.utrace"
+    source.write_bytes(bytes(range(256)) * (10 * 1024))  # 2.5 MiB
+    destination = tmp_path / "pulled" / "Trace.utrace"
+    client = AdbClient(
+        executable=shell_adb,
+        retry_policies={"pull_chunk": RetryPolicy(timeout=10.0)},
+    )
+    read_chunk = client._read_chunk
+    reads: list[int] = []
+
+    def dropped_at_third_chunk(
+        serial: str, path: str, index: int, chunk_size: int
+    ) -> bytes:
+        reads.append(index)
+        if index == 2:
+            raise AdbDeviceOfflineError("device offline")
+        return read_chunk(serial, path, index, chunk_size)
+
+    with patch.object(client, "_read_chunk", dropped_at_third_chunk):
+        with pytest.raises(AdbDeviceOfflineError):
+            client.pull_resumable("abc", str(source), str(destination), 1024 * 1024)
+    assert reads == [0, 1, 2]
+    assert not destination.exists()
+    assert (tmp_path / "pulled" / "Trace.utrace.part.json").is_file()
+
+    with patch.object(client, "_read_chunk", side_effect=read_chunk) as resumed:
+        client.pull_resumable("abc", str(source), str(destination), 1024 * 1024)
+
+    assert [call.args[2] for call in resumed.call_args_list] == [2]
+    assert destination.read_bytes() == source.read_bytes()
+    assert not (tmp_path / "pulled" / "Trace.utrace.part").exists()
+    assert not (tmp_path / "pulled" / "Trace.utrace.part.json").exists()
+
+
+def test_package_inventory_matches_exactly_and_is_cached() -> None:
+    process = FakePopen("package:com.foo.titanx\npackage:com.foo.other\n")
+    client = AdbClient()
+
+    with patch("subprocess.Popen", process):
+        assert client.is_package_installed("abc", "com.foo.titan") is False
+        assert client.is_package_installed("abc", "com.foo.titanx") is True
+        assert client.is_package_installed("abc", "com.foo.other") is True
+        assert process.command == [
+            "adb",
+            "-s",
+            "abc",
+            "shell",
+            "pm",
+            "list",
+            "packages",
+        ]
+        assert len(process.timeouts) == 1
+
+        client.invalidate_packages("abc")
+        client.is_package_installed("abc", "com.foo.other")
+        assert len(process.timeouts) == 2
+
+        client.package_cache_ttl = 0
+        client.is_package_installed("abc", "com.foo.other")
+        assert len(process.timeouts) == 3
+
+
+def test_console_commands_are_quoted_and_batched() -> None:
+    process = FakePopen()
+    client = AdbClient()
+
+    with patch("subprocess.Popen", process):
+        client.send_console_commands("abc", ["stat unit", "ke * Say 'hi'"])
+
+    assert len(process.timeouts) == 1
+    assert process.command[4:] == [
+        *["am", "broadcast", "-a", "android.intent.action.RUN", "-e", "cmd"],
+        "'stat unit'",
+        "&&",
+        *["am", "broadcast", "-a", "android.intent.action.RUN", "-e", "cmd"],
+        "'ke * Say '\"'\"'hi'\"'\"''",
+    ]
+
+
+def test_console_batches_stay_under_the_command_limit() -> None:
+    batches = console_batch_args([f"r.Cvar{index} 1" for index in range(200)])
+
+    assert len(batches) > 1
+    assert all(sum(len(arg) + 1 for arg in batch) < 4000 for batch in batches)
+    assert sum(batch.count("broadcast") for batch in batches) == 200
+    assert all(batch.count("broadcast") <= CONSOLE_BATCH_COMMANDS for batch in batches)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from cerebrus.tools.adb import AdbCommandError, AdbTimeoutError, RetryPolicy
+from cerebrus.tools.adb_async import AsyncAdbClient
+
+
+class FakeProcess:
+    def __init__(
+        self, stdout: bytes = b"", returncode: int = 0, delay: float = 0.0
+    ) -> None:
+        self._stdout = stdout
+        self._final_returncode = returncode
+        self._delay = delay
+        self.pid = 4242
+        self.returncode: int | None = None
+        self.killed = False
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        await asyncio.sleep(self._delay)
+        self.returncode = self._final_returncode
+        return self._stdout, b"boom" if self._final_returncode else b""
+
+    def kill(self) -> None:
+        self.killed = True
+        self.returncode = -9
+
+    async def wait(self) -> int:
+        return self.returncode or 0
+
+
+def _spawner(process: FakeProcess, calls: list[tuple[str, ...]]):
+    async def spawn(*command: str, **_: object) -> FakeProcess:
+        calls.append(command)
+        return process
+
+    return spawn
+
+
+def test_list_devices_parses_device_lines() -> None:
+    calls: list[tuple[str, ...]] = []
+    process = FakeProcess(
+        b"List of devices attached\r\nabc\tdevice\r\nxyz\toffline\r\n"
+    )
+
+    with patch("asyncio.create_subprocess_exec", _spawner(process, calls)):
+        devices = asyncio.run(AsyncAdbClient().list_devices())
+
+    assert devices == ["abc"]
+    assert calls == [("adb", "devices")]
+
+
+def test_get_properties_parses_crlf_output() -> None:
+    process = FakeProcess(
+        b"[ro.product.model]: [Pixel]\r\n[ro.build.version.sdk]: [34]\r\n"
+    )
+
+    with patch("asyncio.create_subprocess_exec", _spawner(process, [])):
+        properties = asyncio.run(AsyncAdbClient().get_properties("abc"))
+
+    assert properties == {"ro.product.model": "Pixel", "ro.build.version.sdk": "34"}
+
+
+def test_non_zero_exit_raises() -> None:
+    process = FakeProcess(returncode=1)
+
+    with patch("asyncio.create_subprocess_exec", _spawner(process, [])):
+        with pytest.raises(AdbCommandError, match="boom"):
+            asyncio.run(AsyncAdbClient().shell("abc", ["ls"]))
+
+
+def _kill_tree(process: FakeProcess):
+    return patch(
+        "cerebrus.tools.adb_async.kill_process_tree",
+        side_effect=lambda pid: process.kill(),
+    )
+
+
+def test_timeout_kills_process() -> None:
+    process = FakeProcess(delay=5)
+    client = AsyncAdbClient(retry_policies={"shell": RetryPolicy(timeout=0.05)})
+
+    with patch("asyncio.create_subprocess_exec", _spawner(process, [])), _kill_tree(
+        process
+    ):
+        with pytest.raises(AdbTimeoutError, match="timed out"):
+            asyncio.run(client.shell("abc", ["sleep", "5"]))
+
+    assert process.killed
+
+
+def test_cancellation_kills_process() -> None:
+    process = FakeProcess(delay=5)
+
+    async def cancel_soon() -> None:
+        client = AsyncAdbClient(retry_policies={"pull": RetryPolicy(timeout=None)})
+        task = asyncio.create_task(client.pull("abc", "/a", "b"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with patch("asyncio.create_subprocess_exec", _spawner(process, [])), _kill_tree(
+        process
+    ):
+        asyncio.run(cancel_soon())
+
+    assert process.killed
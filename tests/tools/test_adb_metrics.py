@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cerebrus.tools.adb import AdbClient, AdbCommandError
+from cerebrus.tools.adb_metrics import (
+    AdbCallRecord,
+    AdbMetrics,
+    command_key,
+    percentile,
+)
+
+
+def fake_popen(stdout: str = "", stderr: str = "", returncode: int = 0) -> MagicMock:
+    popen = MagicMock()
+    process = popen.return_value.__enter__.return_value
+    process.communicate.return_value = (stdout, stderr)
+    process.returncode = returncode
+    return popen
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_command_key_keeps_shell_program_and_serial() -> None:
+    assert command_key(["devices"]) == ("devices", "")
+    assert command_key(["-s", "abc", "shell", "getprop", "ro.x"]) == (
+        "shell getprop",
+        "abc",
+    )
+    assert command_key(["-s", "abc", "shell", "pidof com.foo"]) == (
+        "shell pidof",
+        "abc",
+    )
+    assert command_key(["-s", "abc", "pull", "/a", "b"]) == ("pull", "abc")
+
+
+def test_client_records_every_invocation(tmp_path: Path) -> None:
+    metrics = AdbMetrics()
+    client = AdbClient(metrics=metrics)
+
+    with patch("subprocess.Popen", fake_popen("[ro.a]: [1]\n")):
+        client.get_properties("abc")
+    with patch("subprocess.Popen", fake_popen(stderr="boom", returncode=1)):
+        with pytest.raises(AdbCommandError):
+            client.get_property("def", "ro.a")
+
+    (getprop,) = metrics.by_command()
+    assert (getprop.key, getprop.calls, getprop.failures) == ("shell getprop", 2, 1)
+    assert getprop.output_bytes == len("[ro.a]: [1]\n")
+    assert {stats.key for stats in metrics.by_device()} == {"abc", "def"}
+
+    target = tmp_path / "metrics.json"
+    metrics.dump(target)
+    data = json.loads(target.read_text())
+    assert data["commands"]["shell getprop"]["calls"] == 2
+    assert sum(data["commands"]["shell getprop"]["histogram"]) == 2
+    assert data["recent"][0]["serial"] == "abc"
+
+
+def test_registry_keeps_only_recent_samples_for_percentiles() -> None:
+    metrics = AdbMetrics(samples=2)
+    for seconds in (10.0, 1.0, 2.0):
+        metrics.record(AdbCallRecord("devices", "", seconds, 0, 0))
+
+    (stats,) = metrics.by_command()
+    assert stats.calls == 3
+    assert stats.max == 2.0
+
+
+def test_client_records_exec_out_streams() -> None:
+    metrics = AdbMetrics()
+    client = AdbClient(metrics=metrics)
+    popen = MagicMock()
+    process = popen.return_value.__enter__.return_value
+    process.stdout = io.BytesIO(b"x" * 100)
+    process.stderr = io.BytesIO(b"")
+    process.returncode = 0
+
+    with patch("subprocess.Popen", popen):
+        with client.exec_out("abc", "tar -czf - -C /sdcard Logs") as stream:
+            assert stream.read(10) == b"x" * 10
+
+    (tar,) = metrics.by_command()
+    assert (tar.key, tar.calls, tar.failures) == ("exec-out tar", 1, 0)
+    assert tar.output_bytes == 100  # the drained remainder counts too
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import socket
+import socketserver
+import stat
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from cerebrus.tools.adb import (
+    AdbDeviceOfflineError,
+    AdbError,
+    AdbTimeoutError,
+    RetryPolicy,
+)
+from cerebrus.tools.adb_metrics import AdbMetrics
+from cerebrus.tools.adb_server import AdbServerClient
+
+DEVICES = "abc\tdevice product:p model:Pixel device:d transport_id:1\n" + (
+    "def\tunauthorized transport_id:2\n"
+)
+SHELL = {
+    "getprop ro.product.model": (0, b"Pixel\n", b""),
+    "pidof com.test.app": (1, b"", b""),
+}
+# Transports that accept the connection but reject shell v2 with this reply.
+SHELL_V2_FAILURES = {"old": "unknown service", "gone": "device offline"}
+LEGACY_SERIALS: list[str] = []  # serials whose command went over shell:
+FILES = {
+    "/sdcard/Logs/game.log": b"LogTemp: hello\n",
+    "/sdcard/Logs/sub/crash.txt": b"Error: boom\n",
+}
+
+
+class _FakeAdbServerHandler(socketserver.BaseRequestHandler):
+    """Speak just enough of the adb host protocol for the client under test."""
+
+    def handle(self) -> None:
+        serial = None
+        while True:
+            header = self._read(4)
+            if not header:
+                return
+            service = self._read(int(header, 16)).decode()
+            if service == "host:devices-l":
+                self._okay(DEVICES.encode())
+                return
+            if service == "host:track-devices":
+                self.request.sendall(b"OKAY")
+                for listing in (b"abc\tdevice\n", b"abc\toffline\n"):
+                    self.request.sendall(b"%04x" % len(listing) + listing)
+                return
+            if service.startswith("host:transport:"):
+                serial = service.split(":", 2)[2]
+                if serial != "abc" and serial not in SHELL_V2_FAILURES:
+                    self._fail(f"device '{serial}' not found")
+                    return
+                self.request.sendall(b"OKAY")
+            elif service.startswith("shell,v2,raw:") and serial in SHELL_V2_FAILURES:
+                self._fail(SHELL_V2_FAILURES[serial])
+                return
+            elif service.startswith("shell:"):
+                LEGACY_SERIALS.append(str(serial))
+                self.request.sendall(b"OKAY" + b"legacy\n")
+                return
+            elif service == "shell,v2,raw:logcat":
+                # Never finishes: one small packet every 50 ms.
+                self.request.sendall(b"OKAY")
+                while True:
+                    self.request.sendall(b"\x01" + struct.pack("<I", 2) + b"x\n")
+                    time.sleep(0.05)
+            elif service.startswith("shell,v2,raw:"):
+                code, out, err = SHELL[service.split(":", 1)[1]]
+                self.request.sendall(b"OKAY")
+                for packet_id, payload in ((1, out), (2, err), (3, bytes([code]))):
+                    self.request.sendall(
+                        bytes([packet_id]) + struct.pack("<I", len(payload)) + payload
+                    )
+                return
+            elif service == "sync:":
+                self.request.sendall(b"OKAY")
+                self._sync()
+                return
+
+    def _sync(self) -> None:
+        while True:
+            request_id = self._read(4)
+            if len(request_id) < 4:
+                return
+            (length,) = struct.unpack("<I", self._read(4))
+            path = self._read(length).decode()
+            if request_id == b"QUIT":
+                return
+            if request_id == b"STAT":
+                mode = 0
+                if path in FILES:
+                    mode = stat.S_IFREG | 0o644
+                elif any(name.startswith(path + "/") for name in FILES):
+                    mode = stat.S_IFDIR | 0o755
+                self.request.sendall(b"STAT" + struct.pack("<III", mode, 0, 0))
+            elif request_id == b"LIST":
+                children: dict[str, int] = {}
+                for name in FILES:
+                    if name.startswith(path + "/"):
+                        head, _, rest = name[len(path) + 1 :].partition("/")
+                        children[head] = stat.S_IFDIR if rest else stat.S_IFREG
+                for child, mode in children.items():
+                    encoded = child.encode()
+                    self.request.sendall(
+                        b"DENT" + struct.pack("<IIII", mode, 0, 0, len(encoded))
+                    )
+                    self.request.sendall(encoded)
+                self.request.sendall(b"DONE" + bytes(16))
+            elif request_id == b"RECV":
+                data = FILES[path]
+                self.request.sendall(b"DATA" + struct.pack("<I", len(data)) + data)
+                self.request.sendall(b"DONE" + bytes(4))
+
+    def _okay(self, payload: bytes) -> None:
+        self.request.sendall(b"OKAY" + b"%04x" % len(payload) + payload)
+
+    def _fail(self, message: str) -> None:
+        self.request.sendall(b"FAIL" + b"%04x" % len(message) + message.encode())
+
+    def _read(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return data
+            data += chunk
+        return data
+
+
+@pytest.fixture
+def fake_server() -> Iterator[int]:
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _FakeAdbServerHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_list_devices_reads_host_devices(fake_server: int) -> None:
+    client = AdbServerClient(port=fake_server)
+
+    assert client.list_devices() == ["abc"]
+
+
+def test_track_devices_streams_snapshots(fake_server: int) -> None:
+    tracker = AdbServerClient(port=fake_server).track_devices()
+
+    try:
+        assert tracker.next_snapshot() == {"abc": "device"}
+        assert tracker.next_snapshot() == {"abc": "offline"}
+        with pytest.raises(AdbError):
+            tracker.next_snapshot()
+    finally:
+        tracker.close()
+
+
+def test_shell_commands_use_shell_v2_exit_codes(fake_server: int) -> None:
+    client = AdbServerClient(port=fake_server)
+
+    assert client.get_property("abc", "ro.product.model") == "Pixel"
+    assert client.is_package_running("abc", "com.test.app") is False
+
+
+def test_shell_falls_back_only_when_v2_is_rejected(fake_server: int) -> None:
+    client = AdbServerClient(
+        port=fake_server, retry_policies={"shell": RetryPolicy(timeout=5.0)}
+    )
+    LEGACY_SERIALS.clear()
+
+    assert client.shell("old", ["echo", "hi"]) == "legacy\n"
+    with pytest.raises(AdbDeviceOfflineError):
+        client.shell("gone", ["echo", "hi"])
+    assert LEGACY_SERIALS == ["old"]
+
+
+def test_trickling_shell_output_cannot_outlast_the_timeout(fake_server: int) -> None:
+    client = AdbServerClient(
+        port=fake_server, retry_policies={"shell": RetryPolicy(timeout=0.3)}
+    )
+
+    started = time.monotonic()
+    with pytest.raises(AdbTimeoutError):
+        client.shell("abc", ["logcat"])
+    assert time.monotonic() - started < 2.0
+
+
+def test_unknown_serial_raises(fake_server: int) -> None:
+    client = AdbServerClient(port=fake_server)
+
+    with pytest.raises(AdbError, match="not found"):
+        client.get_property("zzz", "ro.product.model")
+
+
+def test_pull_directory_contents_over_sync(fake_server: int, tmp_path: Path) -> None:
+    client = AdbServerClient(port=fake_server)
+
+    client.pull("abc", "/sdcard/Logs/.", str(tmp_path))
+
+    assert (tmp_path / "game.log").read_bytes() == b"LogTemp: hello\n"
+    assert (tmp_path / "sub" / "crash.txt").read_bytes() == b"Error: boom\n"
+
+
+def test_socket_calls_are_recorded(fake_server: int, tmp_path: Path) -> None:
+    metrics = AdbMetrics()
+    client = AdbServerClient(port=fake_server, metrics=metrics)
+
+    client.get_property("abc", "ro.product.model")
+    client.pull("abc", "/sdcard/Logs/.", str(tmp_path))
+    with pytest.raises(AdbError):
+        client.pull("abc", "/sdcard/Missing/.", str(tmp_path))
+
+    stats = {item.key: item for item in metrics.by_command()}
+    assert stats["shell getprop"].calls == 1
+    assert stats["shell getprop"].output_bytes == len(b"Pixel\n")
+    assert (stats["pull"].calls, stats["pull"].failures) == (2, 1)
+    assert stats["pull"].output_bytes == sum(len(data) for data in FILES.values())
+
+
+def test_pull_missing_path_reports_does_not_exist(
+    fake_server: int, tmp_path: Path
+) -> None:
+    client = AdbServerClient(port=fake_server)
+
+    with pytest.raises(AdbError, match="does not exist"):
+        client.pull("abc", "/sdcard/Missing/.", str(tmp_path))
+
+
+def test_unreachable_server_raises_adb_error() -> None:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    client = AdbServerClient(port=port)
+
+    with pytest.raises(AdbError, match="not reachable"):
+        client.list_devices()
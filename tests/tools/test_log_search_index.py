@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import base64
+import io
+import json
+from pathlib import Path
+
+from cerebrus.tools.log_search_index import (
+    TrigramBloom,
+    TrigramIndex,
+    decode_postings,
+    trigrams,
+)
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "ue_sample.log"
+
+
+def test_search_candidates_cover_every_matching_line() -> None:
+    lines = SAMPLE.read_text(encoding="utf-8").splitlines()
+    index = TrigramIndex()
+    for line in lines:
+        index.add(line)
+
+    for term in ("Warning", "logtemp", ".ini", "Cmd:", "ShaderArchive", "zzz"):
+        candidates = index.search(term)
+        assert candidates is not None
+        matches = [i for i, line in enumerate(lines) if term.lower() in line.lower()]
+        assert set(matches) <= set(candidates)
+        assert [i for i in candidates if term.lower() in lines[i].lower()] == matches
+    assert index.search("er") is None  # shorter than a trigram
+
+
+def test_dense_trigrams_are_left_out_of_the_json() -> None:
+    index = TrigramIndex(dense_fraction=0.7)
+    for line in ["LogTemp: a", "LogTemp: b", "LogNet: </script> x" + "y" * 200]:
+        index.add(line)
+
+    out = io.StringIO()
+    index.write_json(out)
+    data = json.loads(out.getvalue())
+
+    assert "</" not in out.getvalue()
+    assert data["lines"] == 3
+    assert "log" in data["dense"] and "log" not in data["postings"]
+    assert index.search("LogTemp") == [0, 1]
+    assert decode_postings(base64.b64decode(data["postings"]["net"])) == [2]
+    assert index.lines_with("log") is None
+
+
+def test_extend_matches_indexing_all_lines_at_once() -> None:
+    lines = SAMPLE.read_text(encoding="utf-8").splitlines() * 3
+    whole = TrigramIndex()
+    for line in lines:
+        whole.add(line)
+
+    joined = TrigramIndex()
+    for start in range(0, len(lines), 50):
+        part = TrigramIndex()
+        for line in lines[start : start + 50]:
+            part.add(line)
+        joined.extend(part)
+
+    expected, actual = io.StringIO(), io.StringIO()
+    whole.write_json(expected)
+    joined.write_json(actual)
+    assert json.loads(actual.getvalue()) == json.loads(expected.getvalue())
+
+
+def test_bloom_never_misses_an_added_trigram() -> None:
+    text = SAMPLE.read_text(encoding="utf-8")
+    bloom = TrigramBloom(trigrams(text))
+
+    for line in text.splitlines():
+        assert bloom.might_contain(line)
+    assert bloom.might_contain("ab")  # no trigram to rule it out
+    misses = sum(not bloom.might_contain(f"q{i}z") for i in range(1000))
+    assert misses > 950
+    data = bloom.to_json()
+    assert len(base64.b64decode(data["data"])) * 8 == data["bits"]
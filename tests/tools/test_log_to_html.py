@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import re
+import tracemalloc
+from pathlib import Path
+
+from cerebrus.tools import log_to_html
+from cerebrus.tools.log_to_html import (
+    LOG_PATTERNS,
+    convert_log_to_html,
+    convert_log_to_pages,
+    detect_log_level,
+    device_filter_patterns,
+)
+
+LINES = [
+    "[2024.01.01-00.00.00:000][  0]LogTemp: Display: marker",
+    "[2024.01.01-00.00.00:000][  0]LogRHI: Error: device lost",
+    "[2024.01.01-00.00.00:000][  0]LogNet: Warning: packet loss",
+    "[2024.01.01-00.00.00:000][  0]LogInit: Display: boot",
+]
+
+
+def test_device_filter_patterns_keep_every_highlighted_line() -> None:
+    levels = ("ERROR", "WARNING", "LOGTEMP")
+    patterns = device_filter_patterns(levels)
+
+    for line in LINES:
+        highlighted = any(re.search(LOG_PATTERNS[level][0], line) for level in levels)
+        kept = any(re.search(pattern, line) for pattern in patterns)
+        assert kept or not highlighted
+    assert all("(?:" not in pattern and "\\b" not in pattern for pattern in patterns)
+    assert detect_log_level(LINES[1]) == "error"
+
+
+def _detect_log_level_per_pattern(line: str) -> str:
+    for level, (pattern, _) in LOG_PATTERNS.items():
+        if re.search(pattern, line):
+            return level.lower()
+    return "info"
+
+
+def test_detect_log_level_matches_per_pattern_search_on_sample_log() -> None:
+    sample = Path(__file__).resolve().parents[1] / "data" / "ue_sample.log"
+    lines = sample.read_text(encoding="utf-8").splitlines()
+
+    levels = [detect_log_level(line) for line in lines]
+
+    assert levels == [_detect_log_level_per_pattern(line) for line in lines]
+    assert {level.lower() for level in LOG_PATTERNS} <= set(levels)
+
+
+def test_convert_log_to_html_streams_every_line(tmp_path: Path) -> None:
+    source = tmp_path / "Game.log"
+    source.write_text("\n".join(LINES[:2] + ["", "  "] + LINES[2:]) + "\n")
+    output = tmp_path / "Game.html"
+
+    convert_log_to_html(source, output)
+
+    html = output.read_text(encoding="utf-8")
+    rows = [line.strip() for line in html.splitlines() if 'class="log-line ' in line]
+    assert rows == [
+        '<div class="log-line log-logtemp">' + LINES[0] + "</div>",
+        '<div class="log-line log-error">' + LINES[1] + "</div>",
+        '<div class="log-line log-warning">' + LINES[2] + "</div>",
+        '<div class="log-line log-info">' + LINES[3] + "</div>",
+    ]
+    assert "<title>Log Viewer - Game.log</title>" in html
+    assert html.rstrip().endswith("</html>")
+
+
+def test_convert_log_to_html_memory_does_not_grow_with_log(tmp_path: Path) -> None:
+    source = tmp_path / "Big.log"
+    line = LINES[1] + " " + "x" * 200 + "\n"
+    with open(source, "w", encoding="utf-8") as f:
+        for _ in range(40):
+            f.write(line * 1000)
+    output = tmp_path / "Big.html"
+
+    tracemalloc.start()
+    try:
+        convert_log_to_html(source, output)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert source.stat().st_size > 8 * 1024 * 1024
+    assert peak < 4 * 1024 * 1024
+
+
+def test_virtual_viewer_embeds_lines_and_levels(tmp_path: Path, monkeypatch) -> None:
+    source = tmp_path / "Game.log"
+    lines = LINES + ["LogScript: Error: </script><b>bold</b>"]
+    source.write_text("\n\n".join(lines) + "\n", encoding="utf-8")
+    output = tmp_path / "Game.html"
+    monkeypatch.setattr(log_to_html, "VIRTUAL_VIEWER_MIN_BYTES", 1)
+
+    convert_log_to_html(source, output)
+
+    html = output.read_text(encoding="utf-8")
+    data = re.search(r'<script id="logData"[^>]*>(.*?)</script>', html, re.S)
+    codes = re.search(r'<script id="logLevels"[^>]*>(\d*)</script>', html)
+    assert data is not None and codes is not None
+    assert json.loads(data.group(1)) == lines
+    names = json.loads(re.search(r"const LEVELS = (\[.*?\]);", html).group(1))
+    assert [names[int(code)] for code in codes.group(1)] == [
+        detect_log_level(line) for line in lines
+    ]
+    assert 'class="log-line ' not in html
+
+
+def test_search_index_is_embedded_in_the_virtual_page(tmp_path: Path) -> None:
+    source = tmp_path / "Game.log"
+    source.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    output = tmp_path / "Game.html"
+
+    convert_log_to_html(source, output, virtual=False, search_index=True)
+
+    html = output.read_text(encoding="utf-8")
+    match = re.search(r'<script id="logIndex"[^>]*>(.*?)</script>', html, re.S)
+    assert match is not None
+    index = json.loads(match.group(1))
+    assert index["lines"] == len(LINES)
+    assert "packet" not in index["postings"] and "pac" in index["postings"]
+
+
+def test_parallel_conversion_matches_serial_output(tmp_path: Path, monkeypatch) -> None:
+    sample = Path(__file__).resolve().parents[1] / "data" / "ue_sample.log"
+    source = tmp_path / "Game.log"
+    source.write_bytes(sample.read_bytes() * 20 + "LogTemp: été\r\n".encode())
+    monkeypatch.setattr(log_to_html, "_RANGE_BYTES", 4096)
+
+    for virtual, search_index in ((False, False), (True, True)):
+        serial = tmp_path / "serial.html"
+        parallel = tmp_path / "parallel.html"
+        convert_log_to_html(source, serial, virtual, search_index, workers=1)
+        convert_log_to_html(source, parallel, virtual, search_index, workers=3)
+
+        assert parallel.read_text(encoding="utf-8") == serial.read_text(
+            encoding="utf-8"
+        )
+
+
+def test_paged_conversion_writes_pages_and_an_index(tmp_path: Path) -> None:
+    lines = [line for line in LINES for _ in range(3)]  # 12 lines
+    source = tmp_path / "Game.log"
+    source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    output = tmp_path / "Game.html"
+    stale = tmp_path / "Game_pages" / "page-0009.html"
+    stale.parent.mkdir()
+    stale.write_text("old")
+
+    convert_log_to_pages(source, output, page_lines=5)
+
+    pages = sorted((tmp_path / "Game_pages").iterdir())
+    assert [page.name for page in pages] == [
+        "page-0001.html",
+        "page-0002.html",
+        "page-0003.html",
+    ]
+    embedded = []
+    for page in pages:
+        html = page.read_text(encoding="utf-8")
+        data = re.search(r'<script id="logData"[^>]*>(.*?)</script>', html, re.S)
+        embedded += json.loads(data.group(1))
+        assert '<a href="../Game.html">Index</a>' in html
+    assert embedded == lines
+    assert "page-0003.html" not in pages[0].read_text(encoding="utf-8")
+    assert "page-0003.html" in pages[1].read_text(encoding="utf-8")
+
+    html = output.read_text(encoding="utf-8")
+    match = re.search(r'<script id="pageManifest"[^>]*>(.*?)</script>', html, re.S)
+    manifest = json.loads(match.group(1))
+    assert manifest["lines"] == 12
+    assert [page["href"] for page in manifest["pages"]] == [
+        "Game_pages/" + page.name for page in pages
+    ]
+    assert [page["first"] for page in manifest["pages"]] == [1, 6, 11]
+    names = json.loads(re.search(r"const LEVELS = (\[.*?\]);", html).group(1))
+    first_page = dict(zip(names, manifest["pages"][0]["counts"]))
+    assert first_page["logtemp"] == 3 and first_page["error"] == 2
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+from cerebrus.tools.logcat import LogcatStreamer, parse_threadtime
+
+
+class FakeAdbClient:
+    executable = "adb"
+
+    def __init__(self, pids: list[int]) -> None:
+        self.pids = pids
+
+    def package_pids(self, serial: str, package_name: str) -> list[int]:
+        return list(self.pids)
+
+
+def line(pid: int, tag: str, message: str, stamp: str = "01-31 12:00:00.000") -> str:
+    return f"{stamp}  {pid}  {pid + 1} I {tag}: {message}"
+
+
+def streamer(tmp_path: Path, pids: list[int], **kwargs: object) -> LogcatStreamer:
+    return LogcatStreamer(
+        FakeAdbClient(pids), "abc", tmp_path, pid_refresh=3600, **kwargs  # type: ignore[arg-type]
+    )
+
+
+def test_parse_threadtime_splits_fields() -> None:
+    parsed = parse_threadtime("01-31 12:34:56.789  1234  5678 W UE      : Hitch 40ms")
+
+    assert parsed is not None
+    assert (parsed.pid, parsed.tid, parsed.level) == (1234, 5678, "W")
+    assert (parsed.tag, parsed.message) == ("UE", "Hitch 40ms")
+    assert parse_threadtime("--------- beginning of main") is None
+
+
+def test_keeps_package_and_tag_lines_and_follows_restarts(tmp_path: Path) -> None:
+    logcat = streamer(tmp_path, [100], package_name="com.foo", tags=["Thermal"])
+    logcat._refresh_pids()
+
+    logcat.handle_line(line(100, "UE", "frame"))
+    logcat.handle_line(line(200, "Other", "noise"))
+    logcat.handle_line(line(300, "Thermal", "throttling"))
+    logcat.handle_line(
+        line(50, "ActivityManager", "Start proc 400:com.foo/u0a12 for activity")
+    )
+    logcat.handle_line(line(400, "UE", "restarted", "01-31 12:00:01.000"))
+    logcat.stop()
+
+    assert [raw.split(": ", 1)[1] for raw in logcat.lines()] == [
+        "frame",
+        "throttling",
+        "restarted",
+    ]
+    (segment,) = logcat.segments
+    with gzip.open(segment, "rt", encoding="utf-8") as handle:
+        assert handle.read().splitlines() == logcat.lines()
+
+
+def test_replayed_lines_after_reconnect_are_skipped(tmp_path: Path) -> None:
+    logcat = streamer(tmp_path, [])
+    logcat.handle_line(line(1, "A", "one"))
+    logcat.handle_line(line(1, "A", "two"))
+    # logcat -T <last timestamp> repeats every line from that millisecond.
+    logcat.handle_line(line(1, "A", "one"))
+    logcat.handle_line(line(1, "A", "two"))
+    logcat.handle_line(line(1, "A", "three", "01-31 12:00:02.000"))
+    logcat.stop()
+
+    assert len(logcat.lines()) == 3
+    assert logcat._command()[-1] == "'01-31 12:00:02.000'"
+
+
+def test_lines_after_stop_open_no_segment(tmp_path: Path) -> None:
+    logcat = streamer(tmp_path, [], segment_bytes=10)
+    logcat.handle_line(line(1, "A", "rotates the first segment"))
+    logcat.stop()
+
+    # A reader thread that outlived the join timeout delivers a late line.
+    logcat.handle_line(line(1, "A", "late", "01-31 12:00:01.000"))
+
+    assert len(logcat.segments) == 1
+    assert list(tmp_path.glob("*.log.gz")) == logcat.segments
+
+
+def test_buffer_and_segments_stay_bounded(tmp_path: Path) -> None:
+    logcat = streamer(tmp_path, [], buffer_lines=3, segment_bytes=100, max_segments=2)
+    for index in range(20):
+        logcat.handle_line(
+            line(1, "A", f"message {index}", f"01-31 12:00:{index:02d}.000")
+        )
+    logcat.stop()
+
+    assert len(logcat.lines()) == 3
+    assert logcat.lines()[-1].endswith("message 19")
+    assert len(logcat.segments) == 2
+    assert sorted(tmp_path.glob("*.log.gz")) == sorted(logcat.segments)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cerebrus.tools.ue_log import VERBOSITY_CODES, parse_ue_log, read_ue_log
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "ue_sample.log"
+
+
+def test_lines_are_split_into_columns() -> None:
+    log = parse_ue_log(
+        [
+            "Log file open, 05/14/24 10:22:31\n",
+            "LogInit: Build: ++UE5+Release-5.3\n",
+            "[2024.05.14-10.22.32:118][ 42]LogShaderLibrary: Error: Failed to open\n",
+            "[2024.05.14-10.22.33:001][ 43]LogTemp: Tick: done\r\n",
+        ]
+    )
+
+    assert len(log) == 4
+    assert list(log.frames) == [-1, -1, 42, 43]
+    assert log.timestamps[0] == -1
+    expected = datetime(2024, 5, 14, 10, 22, 32, 118000, tzinfo=timezone.utc)
+    assert log.timestamps[2] == int(expected.timestamp() * 1000)
+    assert [log.category(row) for row in range(4)] == [
+        None,
+        "LogInit",
+        "LogShaderLibrary",
+        "LogTemp",
+    ]
+    assert list(log.verbosities) == [
+        0,
+        VERBOSITY_CODES["Log"],
+        VERBOSITY_CODES["Error"],
+        VERBOSITY_CODES["Log"],
+    ]
+    assert [log.message(row) for row in range(4)] == [
+        "Log file open, 05/14/24 10:22:31",
+        "Build: ++UE5+Release-5.3",
+        "Failed to open",
+        "Tick: done",
+    ]
+
+
+def test_select_filters_on_the_columns() -> None:
+    log = read_ue_log(SAMPLE)
+    lines = SAMPLE.read_text(encoding="utf-8").splitlines()
+
+    assert len(log) == len(lines)
+    for row in log.select(categories=["LogTemp", "LogNet"]):
+        assert lines[row].split("]")[-1].startswith(("LogTemp:", "LogNet:"))
+    assert len(log.select(categories=["LogTemp"])) == log.category_counts()["LogTemp"]
+    assert log.select(categories=["LogMissing"]) == []
+
+    errors = log.select(max_verbosity="Error")
+    assert errors and all(": Error: " in lines[row] for row in errors)
+    warnings = log.select(max_verbosity="Warning")
+    assert set(errors) < set(warnings)
+
+    framed = log.select(frames=(1, 999))
+    assert framed and all("][  0]" not in lines[row] for row in framed)
+    assert all(lines[row].startswith("[") for row in framed)
+    assert log.select(categories=["LogTemp"], frames=(0, 0)) == [
+        row for row in log.select(frames=(0, 0)) if log.category(row) == "LogTemp"
+    ]
+
+
+def test_leading_words_are_categories_only_in_ue_form() -> None:
+    log = parse_ue_log(
+        [
+            "Error: see the crash report\n",
+            "Note: continuation of the line above\n",
+            "PixelStreaming: Warning: no peers\n",
+            "[2024.05.14-10.22.33:001][ 43]Display: not a category\n",
+        ]
+    )
+
+    assert [log.category(row) for row in range(4)] == [
+        None,
+        None,
+        "PixelStreaming",
+        None,
+    ]
+    assert list(log.verbosities) == [0, 0, VERBOSITY_CODES["Warning"], 0]
+    assert log.message(0) == "Error: see the crash report"
+    assert log.message(3) == "Display: not a category"
@@ -71,6 +71,15 @@ class TestUniqueOutputPath:
         assert result_csv == self.test_dir / "data.csv"
         assert result_txt == self.test_dir / "log.txt"
 
+    def test_reserved_paths_are_skipped(self):
+        """Test that paths promised to other pending outputs are not reused."""
+        (self.test_dir / "test.html").touch()
+        reserved = {self.test_dir / "test_1.html"}
+
+        result = _get_unique_output_path(self.test_dir, "test", ".html", reserved)
+        expected = self.test_dir / "test_2.html"
+        assert result == expected
+
     def test_gap_in_sequence(self):
         """Test when there's a gap in the sequence (e.g., test.html and test_3.html exist)."""
         # Create files with a gap